@@ -2,12 +2,18 @@
 API 엔드포인트
 """
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from datetime import datetime
-from app.services.storage import get_recent_items
-from app.services.ranking import get_top_rankings, calculate_item_interest_score, detect_surge_trends
+from app.services.storage import get_recent_items, get_collection_stats
+from app.services.ranking_snapshot import render_rankings, render_surge_trends, get_ranking_snapshot, note_snapshot_served
+from app.services.ranking import calculate_item_interest_score, calculate_sample_interest_score, stored_interest_score
+from app.services.live_updates import event_stream, LIVE_LANGUAGES
+from app.services.localization import localize_rows
 from app.core.models import CollectedItem, IssueRanking, AnalysisResult
+from app.core.partitions import collected_window
+from app.services.search import keyword_search_condition
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 from app.core.database import AsyncSessionLocal
@@ -26,148 +32,42 @@ async def root():
             "/rankings": "이슈 랭킹 조회",
             "/recent": "최근 수집 데이터 조회",
             "/analysis": "최근 분석 결과 조회",
-            "/stats": "통계 정보"
+            "/stats": "통계 정보",
+            "/stream": "랭킹/급상승/통계 실시간 푸시 (SSE)"
         }
     }
 
 
 @router.get("/rankings")
 async def get_rankings(
+    request: Request,
     limit: int = Query(10, ge=1, le=10, description="가져올 최대 개수 (최대 10개)"),
     lang: Optional[str] = Query("ko", description="언어 (ko 또는 en)")
 ) -> List[dict]:
     """
     최신 이슈 랭킹을 조회합니다.
+    랭킹 저장 시 미리 만든 스냅샷을 그대로 반환하며, If-None-Match가 일치하면 304를 반환합니다.
     
     Args:
-        limit: 가져올 최대 개수 (1-50)
+        limit: 가져올 최대 개수 (1-10)
+        lang: 언어 설정
     
     Returns:
         이슈 랭킹 리스트
     """
     try:
-        from app.services.translator import translate_text
-        
-        rankings = await get_top_rankings(limit=limit)
+        snapshot = await get_ranking_snapshot(lang, limit)
+        if snapshot is None:
+            # 스냅샷에 없는 언어는 직접 렌더링
+            return await render_rankings(limit=limit, lang=lang)
         
-        result = []
-        async with AsyncSessionLocal() as session:
-            for r in rankings:
-                # 출처 정보 실시간 계산 (관련 아이템에서 소스 정보 추출)
-                source_info = {"types": [], "names": []}
-                try:
-                    # AnalysisResult에서 collected_item_ids 가져오기
-                    analysis_query = select(AnalysisResult).where(
-                        AnalysisResult.topic == r.topic
-                    ).order_by(desc(AnalysisResult.analyzed_at)).limit(5)
-                    
-                    analysis_result = await session.execute(analysis_query)
-                    analyses = list(analysis_result.scalars().all())
-                    
-                    collected_item_ids = set()
-                    for analysis in analyses:
-                        if analysis.collected_item_ids:
-                            if isinstance(analysis.collected_item_ids, list):
-                                collected_item_ids.update(analysis.collected_item_ids[:20])  # 최대 20개
-                    
-                    if collected_item_ids:
-                        item_ids_list = [int(id) for id in list(collected_item_ids) if id is not None]
-                        if item_ids_list:
-                            items_query = select(CollectedItem.source_type, CollectedItem.source).where(
-                                CollectedItem.id.in_(item_ids_list)
-                            )
-                            
-                            items_result = await session.execute(items_query)
-                            source_data = list(items_result.all())
-                            
-                            # 소스 타입별 카운트
-                            source_type_counts = {}
-                            source_name_counts = {}
-                            for source_type, source_name in source_data:
-                                source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-                                source_name_counts[source_name] = source_name_counts.get(source_name, 0) + 1
-                            
-                            # 상위 3개씩만
-                            source_info["types"] = [{"type": st, "count": cnt} for st, cnt in sorted(source_type_counts.items(), key=lambda x: x[1], reverse=True)[:3]]
-                            source_info["names"] = [{"name": sn, "count": cnt} for sn, cnt in sorted(source_name_counts.items(), key=lambda x: x[1], reverse=True)[:3]]
-                except Exception as e:
-                    # 출처 정보 조회 실패 시 무시
-                    pass
-                
-                # 언어에 따라 번역
-                topic = r.topic
-                description = r.description or ""
-                what = r.what or ""
-                why_now = r.why_now or ""
-                context = r.context or ""
-                
-                if lang == "ko":
-                    # 한국어로 번역 (필요한 경우)
-                    if description and not any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                        description = await translate_text(description, "ko")
-                    if what and not any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "ko")
-                    if why_now and not any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "ko")
-                    if context and not any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "ko")
-                    if topic and not any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic = await translate_text(topic, "ko")
-                elif lang == "en":
-                    # 영어로 번역 (필요한 경우)
-                    if description and any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                        description = await translate_text(description, "en")
-                    if what and any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "en")
-                    if why_now and any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "en")
-                    if context and any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "en")
-                    if topic and any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic = await translate_text(topic, "en")
-                
-                # 감정 정보 가져오기 (AnalysisResult에서)
-                sentiment = 'neutral'
-                try:
-                    analysis_query_sentiment = select(AnalysisResult.sentiment).where(
-                        AnalysisResult.topic == r.topic
-                    ).order_by(desc(AnalysisResult.analyzed_at)).limit(5)
-                    
-                    sentiment_result = await session.execute(analysis_query_sentiment)
-                    sentiments = [s for s in sentiment_result.scalars().all() if s]
-                    
-                    if sentiments:
-                        # 가장 많이 나타난 감정
-                        sentiment_counts = {}
-                        for s in sentiments:
-                            sentiment_counts[s] = sentiment_counts.get(s, 0) + 1
-                        sentiment = max(sentiment_counts.items(), key=lambda x: x[1])[0] if sentiment_counts else 'neutral'
-                except Exception:
-                    pass
-                
-                # 출처 정보 가져오기 (IssueRanking에는 저장되지 않으므로, 최신 랭킹 계산 결과에서 가져옴)
-                # 실제로는 상세 분석 API에서 제공하지만, 간단한 출처 정보는 여기서도 제공
-                result_item = {
-                    "rank": r.rank,
-                    "topic": topic,
-                    "description": description,
-                    "what": what,
-                    "why_now": why_now,
-                    "context": context,
-                    "score": r.score,
-                    "mention_count": r.mention_count,  # 실제로는 interest_score가 저장됨
-                    "interest_score": r.mention_count,  # 관심도 점수 (별도 필드로도 제공)
-                    "source_diversity": r.source_diversity,
-                    "trend_direction": r.trend_direction,
-                    "sentiment": sentiment,  # 감정 정보 추가
-                    "period_start": r.period_start.isoformat() if r.period_start else None,
-                    "period_end": r.period_end.isoformat() if r.period_end else None,
-                    "sources": source_info  # 출처 정보 추가
-                }
-                
-                result.append(result_item)
+        headers = {"ETag": snapshot["etag"], "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == snapshot["etag"]:
+            note_snapshot_served(not_modified=True)
+            return Response(status_code=304, headers=headers)
         
-        return result
+        note_snapshot_served(not_modified=False)
+        return Response(content=snapshot["body"], media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"랭킹 조회 실패: {str(e)}")
 
@@ -193,108 +93,34 @@ async def get_surge_trends(
         급상승 트렌드 리스트
     """
     try:
-        from app.services.translator import translate_text
-        
-        surge_trends = await detect_surge_trends(limit=limit)
-        
-        if not surge_trends:
-            return []
-        
-        result = []
-        async with AsyncSessionLocal() as session:
-            for trend in surge_trends:
-                topic = trend['topic']
-                
-                # 출처 정보 가져오기
-                source_info = {"types": [], "names": []}
-                try:
-                    analysis_query = select(AnalysisResult).where(
-                        AnalysisResult.topic == topic
-                    ).order_by(desc(AnalysisResult.analyzed_at)).limit(5)
-                    
-                    analysis_result = await session.execute(analysis_query)
-                    analyses = list(analysis_result.scalars().all())
-                    
-                    collected_item_ids = set()
-                    for analysis in analyses:
-                        if analysis.collected_item_ids:
-                            if isinstance(analysis.collected_item_ids, list):
-                                collected_item_ids.update(analysis.collected_item_ids[:20])
-                    
-                    if collected_item_ids:
-                        item_ids_list = [int(id) for id in list(collected_item_ids) if id is not None]
-                        if item_ids_list:
-                            items_query = select(CollectedItem.source_type, CollectedItem.source).where(
-                                CollectedItem.id.in_(item_ids_list)
-                            )
-                            
-                            items_result = await session.execute(items_query)
-                            source_data = list(items_result.all())
-                            
-                            source_type_counts = {}
-                            source_name_counts = {}
-                            for source_type, source_name in source_data:
-                                source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-                                source_name_counts[source_name] = source_name_counts.get(source_name, 0) + 1
-                            
-                            source_info["types"] = [{"type": st, "count": cnt} for st, cnt in sorted(source_type_counts.items(), key=lambda x: x[1], reverse=True)[:3]]
-                            source_info["names"] = [{"name": sn, "count": cnt} for sn, cnt in sorted(source_name_counts.items(), key=lambda x: x[1], reverse=True)[:3]]
-                except Exception as e:
-                    pass
-                
-                # 언어에 따라 번역
-                topic_translated = topic
-                description = trend.get('description', '')
-                what = trend.get('what', '')
-                why_now = trend.get('why_now', '')
-                context = trend.get('context', '')
-                
-                if lang == "ko":
-                    if topic and not any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic_translated = await translate_text(topic, "ko")
-                    if description and not any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                        description = await translate_text(description, "ko")
-                    if what and not any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "ko")
-                    if why_now and not any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "ko")
-                    if context and not any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "ko")
-                elif lang == "en":
-                    if topic and any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic_translated = await translate_text(topic, "en")
-                    if description and any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                        description = await translate_text(description, "en")
-                    if what and any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "en")
-                    if why_now and any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "en")
-                    if context and any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "en")
-                
-                result.append({
-                    "topic": topic_translated,
-                    "current_rank": trend['current_rank'],
-                    "previous_rank": trend['previous_rank'],
-                    "rank_change": trend['rank_change'],
-                    "current_interest": trend['current_interest'],
-                    "previous_interest": trend['previous_interest'],
-                    "interest_change_rate": trend['interest_change_rate'],
-                    "interest_multiplier": trend['interest_multiplier'],
-                    "surge_reason": trend['surge_reason'],
-                    "description": description,
-                    "what": what,
-                    "why_now": why_now,
-                    "context": context,
-                    "sources": source_info,
-                })
-        
-        return result
+        return await render_surge_trends(limit=limit, lang=lang)
     except Exception as e:
         logger.error(f"❌ 급상승 트렌드 조회 실패: {type(e).__name__} - {e}")
         raise HTTPException(status_code=500, detail=f"급상승 트렌드 조회 실패: {str(e)}")
 
 
+@router.get("/stream")
+async def stream_updates(
+    request: Request,
+    lang: Optional[str] = Query("ko", description="언어 (ko 또는 en)")
+):
+    """
+    랭킹/급상승/통계 업데이트를 Server-Sent Events로 푸시합니다.
+    수집 파이프라인이 끝날 때마다 한 번 전송하며, 연결 직후에는 마지막 메시지를 바로 보냅니다.
+    
+    Args:
+        lang: 언어 설정
+    """
+    if lang not in LIVE_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 언어: {lang}")
+    
+    return StreamingResponse(
+        event_stream(lang, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/recent")
 async def get_recent(
     source_type: Optional[str] = Query(None, description="소스 타입 필터 (news, reddit, github, youtube)"),
@@ -312,28 +138,17 @@ async def get_recent(
         수집 데이터 리스트
     """
     try:
-        from app.services.translator import translate_text
-        
         items = await get_recent_items(source_type=source_type, limit=limit)
         
+        # 쓰기 시점에 저장된 번역 사용 (translations가 없는 기존 행만 모아서 한 번에 번역)
+        localized_rows = await localize_rows(
+            [(item.translations, {"title": item.title, "content": item.content}) for item in items], lang
+        )
+        
         result = []
-        for item in items:
-            title = item.title or ""
-            content = item.content or ""
-            
-            # 언어에 따라 번역
-            if lang == "ko":
-                # 한국어로 번역 (영어인 경우)
-                if title and not any('\uac00' <= c <= '\ud7a3' for c in title[:50]):
-                    title = await translate_text(title, "ko")
-                if content and not any('\uac00' <= c <= '\ud7a3' for c in content[:100]):
-                    content = await translate_text(content, "ko")
-            elif lang == "en":
-                # 영어로 번역 (한국어인 경우)
-                if title and any('\uac00' <= c <= '\ud7a3' for c in title[:50]):
-                    title = await translate_text(title, "en")
-                if content and any('\uac00' <= c <= '\ud7a3' for c in content[:100]):
-                    content = await translate_text(content, "en")
+        for item, localized in zip(items, localized_rows):
+            title = localized["title"]
+            content = localized["content"]
             
             result.append({
                 "id": item.id,
@@ -374,39 +189,19 @@ async def get_analysis(
             result = await session.execute(query)
             analyses = list(result.scalars().all())
             
-            from app.services.translator import translate_text
+            # 쓰기 시점에 저장된 번역 사용 (translations가 없는 기존 행만 모아서 한 번에 번역)
+            localized_rows = await localize_rows([
+                (a.translations, {"topic": a.topic, "summary": a.summary, "what": a.what, "why_now": a.why_now, "context": a.context})
+                for a in analyses
+            ], lang)
             
             translated_analyses = []
-            for a in analyses:
-                topic = a.topic or ""
-                summary = a.summary or ""
-                what = a.what or ""
-                why_now = a.why_now or ""
-                context = a.context or ""
-                
-                # 언어에 따라 번역
-                if lang == "ko":
-                    if topic and not any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic = await translate_text(topic, "ko")
-                    if summary and not any('\uac00' <= c <= '\ud7a3' for c in summary[:50]):
-                        summary = await translate_text(summary, "ko")
-                    if what and not any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "ko")
-                    if why_now and not any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "ko")
-                    if context and not any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "ko")
-                elif lang == "en":
-                    if topic and any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                        topic = await translate_text(topic, "en")
-                    if summary and any('\uac00' <= c <= '\ud7a3' for c in summary[:50]):
-                        summary = await translate_text(summary, "en")
-                    if what and any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                        what = await translate_text(what, "en")
-                    if why_now and any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                        why_now = await translate_text(why_now, "en")
-                    if context and any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                        context = await translate_text(context, "en")
+            for a, localized in zip(analyses, localized_rows):
+                topic = localized["topic"]
+                summary = localized["summary"]
+                what = localized["what"]
+                why_now = localized["why_now"]
+                context = localized["context"]
                 
                 translated_analyses.append({
                     "id": a.id,
@@ -444,7 +239,6 @@ async def get_trend_detail(
     """
     async with AsyncSessionLocal() as session:
         try:
-            from app.services.translator import translate_text
             from datetime import timezone, timedelta
             
             # URL 디코딩된 토픽명 사용 (FastAPI가 자동 디코딩하지만, 안전을 위해)
@@ -566,19 +360,14 @@ async def get_trend_detail(
                 
                 logger.info(f"📊 토픽 키워드 추출: {topic_keywords}")
                 
-                if topic_keywords:
+                keyword_condition = keyword_search_condition(topic_keywords)
+                if keyword_condition is not None:
                     # 최근 7일 내에서 검색 (더 넓은 범위로 확장)
+                    # 제목이나 내용에 토픽 키워드가 포함된 아이템 찾기 (전문 검색 인덱스)
                     time_start = now - timedelta(days=7)
-                    from sqlalchemy import or_
                     related_items_query = select(CollectedItem).where(
-                        CollectedItem.collected_at >= time_start
-                    )
-                    
-                    # 제목이나 내용에 토픽 키워드가 포함된 아이템 찾기
-                    title_conditions = [CollectedItem.title.ilike(f"%{kw}%") for kw in topic_keywords]
-                    content_conditions = [CollectedItem.content.ilike(f"%{kw}%") for kw in topic_keywords]
-                    related_items_query = related_items_query.where(
-                        or_(*title_conditions, *content_conditions)
+                        collected_window(time_start),
+                        keyword_condition
                     )
                     
                     related_items_result = await session.execute(related_items_query)
@@ -637,26 +426,42 @@ async def get_trend_detail(
             logger.info(f"📊 5분 구간 생성: {len(minute_buckets)}개 구간, 첫 구간: {min(list(minute_buckets.keys()))}, 마지막 구간: {max(list(minute_buckets.keys()))}")
             
             # 아이템을 5분 단위 시간대별로 분류
+            # 같은 게시물은 한 행에 참여도 이력(engagement_history)으로 누적되므로,
+            # 이력의 각 샘플을 해당 시각의 구간에 그 시점의 관심도로 배치합니다.
+            # (이력이 없는 기존 행은 collected_at 시각에 현재 관심도로 배치)
             items_matched = 0
             items_not_matched = []
             for item in all_related_items:
-                if item.collected_at:
-                    # 아이템의 수집 시간이 속하는 5분 구간 찾기
-                    matched = False
+                points = []
+                for sample in (item.engagement_history or []):
+                    try:
+                        sample_time = datetime.fromisoformat(sample["t"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if sample_time.tzinfo is None:
+                        sample_time = sample_time.replace(tzinfo=timezone.utc)
+                    points.append((sample_time, calculate_sample_interest_score(item, sample)))
+                if not points and item.collected_at:
+                    points.append((item.collected_at, await calculate_item_interest_score(item)))
+                
+                matched = False
+                for point_time, point_score in points:
+                    # 샘플 시각이 속하는 5분 구간 찾기
                     for bucket_start, bucket in minute_buckets.items():
-                        if bucket['start'] <= item.collected_at < bucket['end']:
-                            bucket['items'].append(item)
-                            items_matched += 1
+                        if bucket['start'] <= point_time < bucket['end']:
+                            bucket['items'].append((item, point_score))
                             matched = True
                             break
-                    
-                    if not matched:
-                        # 디버깅: 매칭되지 않은 아이템 로깅
-                        items_not_matched.append({
-                            'id': item.id,
-                            'collected_at': item.collected_at.isoformat() if item.collected_at else None,
-                            'title': item.title[:50] if item.title else None
-                        })
+                
+                if matched:
+                    items_matched += 1
+                elif points:
+                    # 디버깅: 매칭되지 않은 아이템 로깅
+                    items_not_matched.append({
+                        'id': item.id,
+                        'collected_at': item.collected_at.isoformat() if item.collected_at else None,
+                        'title': item.title[:50] if item.title else None
+                    })
             
             logger.info(f"📊 시간대별 분류 완료: {items_matched}/{len(all_related_items)}개 아이템이 구간에 매칭됨")
             
@@ -680,9 +485,7 @@ async def get_trend_detail(
                 bucket = minute_buckets[bucket_start]
                 bucket_interest_score = 0
                 
-                for item in bucket['items']:
-                    # calculate_item_interest_score 함수 사용
-                    item_score = await calculate_item_interest_score(item)
+                for item, item_score in bucket['items']:
                     bucket_interest_score += item_score
                     total_items_in_buckets += 1
                     
@@ -723,19 +526,18 @@ async def get_trend_detail(
                 try:
                     item_ids_list = [int(id) for id in list(collected_item_ids) if id is not None]
                     if item_ids_list:
-                        # 시간 필터 없이 모든 관련 아이템 조회
-                        all_items_query = select(CollectedItem).where(
+                        # 시간 필터 없이 모든 관련 아이템의 저장된 관심도 점수를 DB에서 합산
+                        total_query = select(
+                            func.count(CollectedItem.id),
+                            func.coalesce(func.sum(stored_interest_score()), 0)
+                        ).where(
                             CollectedItem.id.in_(item_ids_list)
                         )
-                        all_items_result = await session.execute(all_items_query)
-                        all_items_for_total = list(all_items_result.scalars().all())
-                        
-                        # 전체 아이템의 관심도 점수 합산
-                        for item in all_items_for_total:
-                            item_score = await calculate_item_interest_score(item)
-                            total_interest_score += item_score
+                        total_result = await session.execute(total_query)
+                        total_item_count, total_interest_score = total_result.one()
+                        total_interest_score = int(total_interest_score)
                         
-                        logger.info(f"📊 전체 관심도 점수 계산: {len(all_items_for_total)}개 아이템, 총 {total_interest_score}점")
+                        logger.info(f"📊 전체 관심도 점수 계산: {total_item_count}개 아이템, 총 {total_interest_score}점")
                 except Exception as e:
                     logger.error(f"❌ 전체 관심도 점수 계산 실패: {e}")
                     # Fallback: ranking의 mention_count 사용
@@ -787,64 +589,44 @@ async def get_trend_detail(
             top_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
             
             # 8. AI 심층 분석 정보 가져오기 (ranking 우선, 없으면 analyses에서)
-            topic_translated = topic
-            description = ranking.description if ranking else ""
-            what = ranking.what if ranking else ""
-            why_now = ranking.why_now if ranking else ""
-            context = ranking.context if ranking else ""
+            # 값마다 (원문, 원본 행의 translations, 원본 필드 이름)을 보관하여 저장된 번역을 찾음
+            ranking_translations = ranking.translations if ranking else None
+            description = (ranking.description if ranking else "", ranking_translations, "description")
+            what = (ranking.what if ranking else "", ranking_translations, "what")
+            why_now = (ranking.why_now if ranking else "", ranking_translations, "why_now")
+            context = (ranking.context if ranking else "", ranking_translations, "context")
             
             # ranking에 정보가 없으면 analyses에서 가장 최신 분석 결과 사용
-            if not what and not why_now and not context and analyses:
+            if not what[0] and not why_now[0] and not context[0] and analyses:
                 latest_analysis = analyses[0]  # 가장 최신 분석 결과
-                if not what and latest_analysis.what:
-                    what = latest_analysis.what
-                if not why_now and latest_analysis.why_now:
-                    why_now = latest_analysis.why_now
-                if not context and latest_analysis.context:
-                    context = latest_analysis.context
-                if not description and latest_analysis.summary:
-                    description = latest_analysis.summary
-            
-            # 번역 처리
-            if lang == "ko":
-                if topic and not any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                    topic_translated = await translate_text(topic, "ko")
-                if description and not any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                    description = await translate_text(description, "ko")
-                if what and not any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                    what = await translate_text(what, "ko")
-                if why_now and not any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                    why_now = await translate_text(why_now, "ko")
-                if context and not any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                    context = await translate_text(context, "ko")
-            elif lang == "en":
-                if topic and any('\uac00' <= c <= '\ud7a3' for c in topic[:50]):
-                    topic_translated = await translate_text(topic, "en")
-                if description and any('\uac00' <= c <= '\ud7a3' for c in description[:50]):
-                    description = await translate_text(description, "en")
-                if what and any('\uac00' <= c <= '\ud7a3' for c in what[:50]):
-                    what = await translate_text(what, "en")
-                if why_now and any('\uac00' <= c <= '\ud7a3' for c in why_now[:50]):
-                    why_now = await translate_text(why_now, "en")
-                if context and any('\uac00' <= c <= '\ud7a3' for c in context[:50]):
-                    context = await translate_text(context, "en")
+                if latest_analysis.what:
+                    what = (latest_analysis.what, latest_analysis.translations, "what")
+                if latest_analysis.why_now:
+                    why_now = (latest_analysis.why_now, latest_analysis.translations, "why_now")
+                if latest_analysis.context:
+                    context = (latest_analysis.context, latest_analysis.translations, "context")
+                if not description[0] and latest_analysis.summary:
+                    description = (latest_analysis.summary, latest_analysis.translations, "summary")
+            
+            # 쓰기 시점에 저장된 번역 사용 (translations가 없는 값은 관련 아이템과 함께 모아서 한 번에 번역)
+            topic_translations = ranking_translations if ranking and ranking.topic == topic else None
+            analysis_entries = [(topic_translations, {"topic": topic})] + [
+                (value[1], {value[2]: value[0]}) for value in (description, what, why_now, context)
+            ]
+            related_source = items[:20]  # 최대 20개
+            localized_rows = await localize_rows(
+                analysis_entries + [(item.translations, {"title": item.title, "content": item.content}) for item in related_source],
+                lang
+            )
+            topic_translated, description, what, why_now, context = [
+                next(iter(localized.values())) for localized in localized_rows[:len(analysis_entries)]
+            ]
             
             # 9. 관련 아이템 정리
             related_items = []
-            for item in items[:20]:  # 최대 20개
-                title = item.title or ""
-                content = item.content or ""
-                
-                if lang == "ko":
-                    if title and not any('\uac00' <= c <= '\ud7a3' for c in title[:50]):
-                        title = await translate_text(title, "ko")
-                    if content and not any('\uac00' <= c <= '\ud7a3' for c in content[:100]):
-                        content = await translate_text(content, "ko")
-                elif lang == "en":
-                    if title and any('\uac00' <= c <= '\ud7a3' for c in title[:50]):
-                        title = await translate_text(title, "en")
-                    if content and any('\uac00' <= c <= '\ud7a3' for c in content[:100]):
-                        content = await translate_text(content, "en")
+            for item, localized in zip(related_source, localized_rows[len(analysis_entries):]):
+                title = localized["title"]
+                content = localized["content"]
                 
                 related_items.append({
                     "id": item.id,
@@ -901,49 +683,7 @@ async def get_stats() -> dict:
     Returns:
         통계 정보 딕셔너리
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            # 수집 데이터 통계
-            collected_count = await session.execute(
-                select(func.count(CollectedItem.id))
-            )
-            total_collected = collected_count.scalar() or 0
-            
-            # 소스 타입별 통계
-            source_stats = await session.execute(
-                select(
-                    CollectedItem.source_type,
-                    func.count(CollectedItem.id)
-                ).group_by(CollectedItem.source_type)
-            )
-            source_counts = {source: count for source, count in source_stats}
-            
-            # 분석 결과 통계
-            analysis_count = await session.execute(
-                select(func.count(AnalysisResult.id))
-            )
-            total_analysis = analysis_count.scalar() or 0
-            
-            # 랭킹 통계
-            ranking_count = await session.execute(
-                select(func.count(IssueRanking.id))
-            )
-            total_rankings = ranking_count.scalar() or 0
-            
-            # 최근 수집 시간
-            latest_collected = await session.execute(
-                select(func.max(CollectedItem.collected_at))
-            )
-            latest_collected_time = latest_collected.scalar()
-            
-            return {
-                "total_collected": total_collected,
-                "source_counts": source_counts,
-                "total_analysis": total_analysis,
-                "total_rankings": total_rankings,
-                "latest_collected": latest_collected_time.isoformat() if latest_collected_time else None,
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
-
-
+    try:
+        return await get_collection_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
@@ -59,12 +59,11 @@ AsyncSessionLocal = async_sessionmaker(
 # Base 클래스
 Base = declarative_base()
 
-
 async def init_db():
     """
     데이터베이스 테이블을 생성합니다.
     """
-    from app.core.models import CollectedItem, AnalysisResult, IssueRanking
+    from app.core.models import CollectedItem, AnalysisResult, IssueRanking, FeedValidator, TranslationCache
     
     # 이벤트 루프가 올바르게 설정되었는지 확인
     if sys.platform == 'win32':
@@ -79,5 +78,9 @@ async def init_db():
             # 실행 중인 이벤트 루프가 없으면 정책만 확인
             pass
     
+    from app.core.partitions import ensure_partitions
+    
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # collected_items 일 단위 파티션 생성 (오늘 ~ 미리 만들 일 수)
+        await ensure_partitions(conn)
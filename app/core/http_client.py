@@ -0,0 +1,202 @@
+"""
+공유 HTTP 클라이언트 관리
+프로세스당 하나의 httpx.AsyncClient를 두고 모든 수집기가 연결을 재사용합니다.
+(FastAPI lifespan에서 생성/종료)
+"""
+import os
+import asyncio
+import logging
+from typing import Optional, Dict, Any
+import httpx
+
+logger = logging.getLogger("hourly_pulse")
+
+# HTTP/2 사용 여부 (h2 패키지가 설치되어 있을 때만 적용)
+HTTP_ENABLE_HTTP2 = os.getenv("HTTP_ENABLE_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# 전체 최대 연결 수 / 유지할 keep-alive 연결 수
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "40"))
+
+# keep-alive 유지 시간 (초, 기본값: 330초 - 5분 수집 주기 사이에도 연결을 유지)
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "330"))
+
+# 호스트당 동시 요청 수 제한 (기본값: 6개)
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "6"))
+
+# 기본 타임아웃 (초)
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "10"))
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# 연결 재사용 통계
+_pool_stats: Dict[str, int] = {
+    "requests": 0,
+    "https_requests": 0,
+    "tcp_connects": 0,
+    "tls_handshakes": 0,
+    "http2_requests": 0,
+}
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """
+    응답 본문을 모두 읽거나 닫을 때 호스트 세마포어를 반환하는 스트림 래퍼
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore):
+        self._stream = stream
+        self._semaphore = semaphore
+        self._released = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._semaphore.release()
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """
+    호스트별 동시 요청 수를 제한하고 연결 재사용 통계를 기록하는 트랜스포트
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max(1, max_per_host)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore_for(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            _pool_stats["tcp_connects"] += 1
+        elif event_name == "connection.start_tls.complete":
+            _pool_stats["tls_handshakes"] += 1
+        elif event_name == "http2.send_request_headers.started":
+            _pool_stats["http2_requests"] += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore_for(request.url.host)
+        await semaphore.acquire()
+
+        _pool_stats["requests"] += 1
+        if request.url.scheme == "https":
+            _pool_stats["https_requests"] += 1
+        request.extensions = {**request.extensions, "trace": self._trace}
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, semaphore)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    @property
+    def pool(self):
+        return self._transport._pool
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """
+    연결 풀 설정이 적용된 AsyncClient를 생성합니다.
+    """
+    use_http2 = HTTP_ENABLE_HTTP2 and _HTTP2_AVAILABLE
+    if HTTP_ENABLE_HTTP2 and not _HTTP2_AVAILABLE:
+        logger.warning("⚠️ h2 패키지가 설치되지 않아 HTTP/1.1만 사용합니다. (pip install 'httpx[http2]')")
+
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+    )
+    transport = _PooledTransport(
+        httpx.AsyncHTTPTransport(http2=use_http2, limits=limits),
+        max_per_host=HTTP_MAX_CONNECTIONS_PER_HOST
+    )
+
+    logger.info(f"🌐 공유 HTTP 클라이언트 생성 (HTTP/2: {use_http2}, 최대 연결: {HTTP_MAX_CONNECTIONS}, 호스트당: {HTTP_MAX_CONNECTIONS_PER_HOST})")
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=HTTP_DEFAULT_TIMEOUT,
+        headers={"User-Agent": "HourlyPulse/1.0"}
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트를 생성합니다. (서버 시작 시 호출)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    공유 HTTP 클라이언트를 닫고 모든 연결을 정리합니다. (서버 종료 시 호출)
+    """
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info(f"🌐 공유 HTTP 클라이언트 종료 (통계: {get_http_pool_stats()})")
+    _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트를 반환합니다.
+    lifespan 밖(단독 실행 스크립트 등)에서 호출되면 즉시 생성합니다.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """
+    연결 풀 통계를 반환합니다.
+
+    Returns:
+        요청 수, 새 연결 수, TLS 핸드셰이크 수, 절약된 핸드셰이크 수, 현재 연결 상태
+    """
+    stats: Dict[str, Any] = dict(_pool_stats)
+    stats["reused_connections"] = max(0, stats["requests"] - stats["tcp_connects"])
+    stats["saved_tls_handshakes"] = max(0, stats["https_requests"] - stats["tls_handshakes"])
+
+    open_connections = 0
+    idle_connections = 0
+    if _http_client is not None and not _http_client.is_closed:
+        transport = _http_client._transport
+        if isinstance(transport, _PooledTransport):
+            connections = transport.pool.connections
+            open_connections = len(connections)
+            idle_connections = sum(1 for conn in connections if conn.is_idle())
+
+    stats["open_connections"] = open_connections
+    stats["idle_connections"] = idle_connections
+    return stats
@@ -0,0 +1,233 @@
+"""
+공유 LLM(Gemini) 클라이언트
+분석/뉴스 관심도 추정/번역의 모든 모델 호출이 이 모듈을 거칩니다.
+- 분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷으로 쿼터 초과를 미리 막음
+- 같은 프롬프트가 동시에 들어오면 한 번만 호출하고 결과를 공유 (single-flight)
+- SDK의 네이티브 비동기 API(generate_content_async) 사용 - 진행 중인 호출은 스레드가 아니라 코루틴
+- 동시 호출 수는 세마포어로 제한
+- 429/5xx 응답은 지수 백오프 + 지터로 재시도
+"""
+import os
+import time
+import json
+import random
+import asyncio
+import hashlib
+import logging
+from typing import Dict, Any
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger("hourly_pulse")
+
+# 사용할 모델 (기본값: gemini-2.0-flash-lite)
+LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "gemini-2.0-flash-lite")
+
+# 분당 최대 요청 수 (기본값: 300회)
+LLM_RPM = int(os.getenv("LLM_RPM", "300"))
+
+# 분당 최대 토큰 수 (기본값: 4,000,000 토큰 - 4M TPM)
+LLM_TPM = int(os.getenv("LLM_TPM", "4000000"))
+
+# 동시에 진행할 모델 호출 수 (코루틴이므로 스레드 수와 무관, 기본값: 64개)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+
+# 429/5xx 재시도 횟수와 첫 대기 시간 (초)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "1.0"))
+
+# 안전 설정 (분석/번역 대상은 뉴스/커뮤니티 글이므로 차단 최대한 완화)
+SAFETY_SETTINGS = [
+    {
+        "category": genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+        "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
+    },
+    {
+        "category": genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+        "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
+    },
+    {
+        "category": genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+        "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
+    },
+    {
+        "category": genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+        "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
+    },
+]
+
+# 재시도할 오류 (429 쿼터 초과, 5xx 서버 오류)
+_RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+# Gemini 클라이언트 초기화
+gemini_model = None
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+    gemini_model = genai.GenerativeModel(LLM_MODEL_NAME)
+    logger.info(f"✅ Gemini 클라이언트 초기화 완료 ({LLM_MODEL_NAME})")
+else:
+    logger.warning("⚠️ GEMINI_API_KEY가 설정되지 않았습니다. AI 분석/번역 기능이 작동하지 않습니다.")
+
+
+class _TokenBucket:
+    """
+    분 단위 한도를 초당 보충하는 토큰 버킷
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    async def acquire(self, amount: float) -> float:
+        """
+        amount만큼 토큰을 가져갑니다. 부족하면 보충될 때까지 기다립니다.
+
+        Returns:
+            기다린 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.refill_per_second
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+_request_bucket = _TokenBucket(LLM_RPM)
+_token_bucket = _TokenBucket(LLM_TPM)
+_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# 프롬프트 키 -> 진행 중인 호출 태스크 (같은 프롬프트는 결과 공유)
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+_stats: Dict[str, Any] = {
+    "requests": 0,
+    "coalesced": 0,
+    "retries": 0,
+    "errors": 0,
+    "rate_limit_wait_seconds": 0.0,
+}
+
+
+def is_available() -> bool:
+    """
+    모델 호출이 가능한지(API 키가 설정되었는지) 반환합니다.
+    """
+    return gemini_model is not None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수를 대략 추정합니다. (한글은 글자당 약 1토큰이므로 보수적으로 2글자당 1토큰)
+    """
+    return len(text) // 2 + 8
+
+
+def _request_key(prompt: str, config: Dict[str, Any]) -> str:
+    payload = json.dumps(config, sort_keys=True) + "\n" + prompt
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def _call_with_retry(prompt: str, config: Dict[str, Any]):
+    """
+    RPM/TPM 버킷과 동시 호출 수 제한 안에서 모델을 호출하고, 429/5xx이면 지터를 두고 재시도합니다.
+    """
+    tokens = estimate_tokens(prompt) + config.get("max_output_tokens", 0)
+    generation_config = genai.types.GenerationConfig(**config)
+
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        _stats["rate_limit_wait_seconds"] += await _request_bucket.acquire(1)
+        _stats["rate_limit_wait_seconds"] += await _token_bucket.acquire(tokens)
+        try:
+            async with _semaphore:
+                _stats["requests"] += 1
+                return await gemini_model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    safety_settings=SAFETY_SETTINGS
+                )
+        except _RETRYABLE_ERRORS as e:
+            if attempt >= LLM_MAX_RETRIES:
+                raise
+            delay = LLM_RETRY_BASE_DELAY * (2 ** attempt)
+            delay = random.uniform(delay / 2, delay * 1.5)  # 지터 (동시에 실패한 호출이 같은 시각에 몰리지 않도록)
+            _stats["retries"] += 1
+            logger.warning(f"⚠️ Gemini 호출 재시도 {attempt + 1}/{LLM_MAX_RETRIES} ({type(e).__name__}), {delay:.1f}초 후")
+            await asyncio.sleep(delay)
+
+
+async def generate_content(prompt: str, **config):
+    """
+    공유 클라이언트로 모델을 호출합니다.
+    같은 프롬프트와 설정의 호출이 진행 중이면 새로 호출하지 않고 그 결과를 함께 기다립니다.
+
+    Args:
+        prompt: 프롬프트
+        **config: GenerationConfig 인자 (temperature, max_output_tokens, response_mime_type 등)
+
+    Returns:
+        Gemini 응답 객체 (재시도 후에도 실패하면 예외 발생)
+    """
+    if gemini_model is None:
+        raise RuntimeError("Gemini 클라이언트가 초기화되지 않았습니다.")
+
+    key = _request_key(prompt, config)
+    task = _inflight.get(key)
+    if task is not None:
+        _stats["coalesced"] += 1
+    else:
+        # 공유 호출은 별도 태스크로 실행하고 모든 호출자가 shield로 기다림
+        # (먼저 호출한 쪽이 취소되어도 함께 기다리는 호출자의 결과는 그대로 받음)
+        task = asyncio.create_task(_call_with_retry(prompt, config))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _finish_inflight(key, done))
+    return await asyncio.shield(task)
+
+
+def _finish_inflight(key: str, task: "asyncio.Task") -> None:
+    """
+    공유 호출 태스크가 끝나면 진행 중 목록에서 빼고 오류를 집계합니다.
+    """
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if task.cancelled():
+        return
+    # 기다리는 호출이 모두 취소되었어도 "예외를 가져가지 않음" 경고가 나지 않도록 소비
+    if task.exception() is not None:
+        _stats["errors"] += 1
+
+
+def get_llm_stats() -> Dict[str, Any]:
+    """
+    모델 호출 통계를 반환합니다.
+    """
+    return {
+        **_stats,
+        "rate_limit_wait_seconds": round(_stats["rate_limit_wait_seconds"], 2),
+        "inflight": len(_inflight),
+        "max_concurrency": LLM_MAX_CONCURRENCY,
+        "rpm": LLM_RPM,
+        "tpm": LLM_TPM,
+    }
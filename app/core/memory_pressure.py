@@ -0,0 +1,171 @@
+"""
+프로세스 메모리 압박 대응
+API 프로세스의 RSS가 임계값을 넘으면 프로세스가 실제로 들고 있는 구조
+(번역 캐시 등)를 비우고, 다음 분석 실행의 적재량을 줄입니다.
+(ORM identity map은 약한 참조라 다른 곳에서 참조 중인 객체만 남아 있으므로 회수 대상이 아님)
+데이터베이스 행을 지워도 이 프로세스의 RSS는 줄지 않으므로 DB는 건드리지 않습니다.
+
+각 모듈은 register_reclaimer로 자신의 구조를 등록하며, 등록 순서대로 회수합니다.
+"""
+import os
+import gc
+import time
+import logging
+from typing import Callable, Dict, Any, Optional
+import psutil
+
+logger = logging.getLogger("hourly_pulse")
+
+# 최대 컨테이너 메모리 용량 (GB, 환경 변수로 설정 가능, 기본값: 7.5GB)
+# Docker 컨테이너 메모리 제한에 맞춰 설정
+MAX_CONTAINER_MEMORY_GB = float(os.getenv("MAX_CONTAINER_MEMORY_GB", "7.5"))
+
+# 메모리 사용량 임계값 (이 비율을 초과하면 회수 시작, 기본값: 80%)
+MEMORY_USAGE_THRESHOLD = float(os.getenv("MEMORY_USAGE_THRESHOLD", "0.8"))
+
+# 메모리 압박 확인 주기 (초, 기본값: 60초)
+MEMORY_CHECK_INTERVAL_SECONDS = int(os.getenv("MEMORY_CHECK_INTERVAL_SECONDS", "60"))
+
+# 카테고리 이름 -> (현재 크기 함수, 회수 함수)
+# 크기 함수는 보유 항목 수를, 회수 함수는 회수한 항목 수를 반환합니다.
+_reclaimers: Dict[str, Dict[str, Callable[[], int]]] = {}
+
+# 카테고리별 회수 통계
+_category_stats: Dict[str, Dict[str, int]] = {}
+
+_pressure_stats: Dict[str, Any] = {
+    "checks": 0,
+    "pressure_events": 0,
+    "under_pressure": False,
+    "rss_gb": None,
+    "last_reclaim_rss_before_gb": None,
+    "last_reclaim_rss_after_gb": None,
+    "last_reclaim_at": None,
+}
+
+
+def register_reclaimer(category: str, size_fn: Callable[[], int], reclaim_fn: Callable[[], int]) -> None:
+    """
+    메모리 압박 시 회수할 인메모리 구조를 등록합니다.
+
+    Args:
+        category: 카테고리 이름 (통계 키)
+        size_fn: 현재 보유 항목 수를 반환하는 함수
+        reclaim_fn: 구조를 비우거나 줄이고 회수한 항목 수를 반환하는 함수
+    """
+    _reclaimers[category] = {"size": size_fn, "reclaim": reclaim_fn}
+    _category_stats.setdefault(category, {"size": 0, "reclaim_runs": 0, "reclaimed_items": 0})
+
+
+def get_container_memory_usage_gb() -> Optional[float]:
+    """
+    현재 프로세스의 메모리 사용량(RSS)을 GB 단위로 반환합니다.
+
+    Returns:
+        메모리 사용량 (GB), 실패 시 None
+    """
+    try:
+        return psutil.Process().memory_info().rss / (1024 ** 3)
+    except Exception as e:
+        logger.error(f"❌ 컨테이너 메모리 사용량 조회 실패: {type(e).__name__} - {e}")
+        return None
+
+
+def is_under_pressure() -> bool:
+    """
+    마지막 확인 시점에 메모리 압박 상태였는지 반환합니다.
+    """
+    return _pressure_stats["under_pressure"]
+
+
+def shed_limit(limit: int, minimum: int = 1) -> int:
+    """
+    메모리 압박 중이면 배치 크기를 절반으로 줄입니다. (새로 적재할 데이터 양 제한용)
+    """
+    if _pressure_stats["under_pressure"]:
+        return max(minimum, limit // 2)
+    return limit
+
+
+def _refresh_sizes() -> None:
+    for category, reclaimer in _reclaimers.items():
+        try:
+            _category_stats[category]["size"] = int(reclaimer["size"]())
+        except Exception as e:
+            logger.warning(f"⚠️ {category} 크기 확인 실패: {type(e).__name__} - {e}")
+
+
+def reclaim_memory() -> Dict[str, int]:
+    """
+    등록된 모든 구조를 등록 순서대로 회수하고 가비지 컬렉션을 실행합니다.
+
+    Returns:
+        카테고리별 회수한 항목 수
+    """
+    reclaimed: Dict[str, int] = {}
+    for category, reclaimer in _reclaimers.items():
+        try:
+            count = int(reclaimer["reclaim"]() or 0)
+        except Exception as e:
+            logger.warning(f"⚠️ {category} 회수 실패: {type(e).__name__} - {e}")
+            count = 0
+        reclaimed[category] = count
+        _category_stats[category]["reclaim_runs"] += 1
+        _category_stats[category]["reclaimed_items"] += count
+
+    reclaimed["gc_objects"] = gc.collect()
+    _refresh_sizes()
+    return reclaimed
+
+
+def check_memory_pressure(max_memory_gb: float = MAX_CONTAINER_MEMORY_GB, threshold: float = MEMORY_USAGE_THRESHOLD) -> Dict[str, int]:
+    """
+    프로세스 RSS를 확인하고 임계값을 넘으면 인메모리 구조를 회수합니다.
+    (스케줄러 작업으로 주기적으로 실행)
+
+    Args:
+        max_memory_gb: 최대 컨테이너 메모리 용량 (GB)
+        threshold: 메모리 사용량 임계값 비율 (0.0 ~ 1.0)
+
+    Returns:
+        카테고리별 회수한 항목 수 (압박이 없으면 빈 딕셔너리)
+    """
+    _pressure_stats["checks"] += 1
+    current_memory_gb = get_container_memory_usage_gb()
+    _pressure_stats["rss_gb"] = current_memory_gb
+    _refresh_sizes()
+
+    if current_memory_gb is None:
+        logger.warning("⚠️ 메모리 사용량을 확인할 수 없어 메모리 압박 확인을 건너뜁니다.")
+        return {}
+
+    threshold_memory_gb = max_memory_gb * threshold
+    if current_memory_gb < threshold_memory_gb:
+        _pressure_stats["under_pressure"] = False
+        return {}
+
+    _pressure_stats["under_pressure"] = True
+    _pressure_stats["pressure_events"] += 1
+    logger.warning(f"⚠️ 메모리 압박 감지: {current_memory_gb:.2f}GB / 최대 {max_memory_gb:.2f}GB (임계값: {threshold_memory_gb:.2f}GB), 인메모리 구조 회수 시작")
+
+    reclaimed = reclaim_memory()
+
+    after_memory_gb = get_container_memory_usage_gb()
+    _pressure_stats["rss_gb"] = after_memory_gb
+    _pressure_stats["last_reclaim_rss_before_gb"] = round(current_memory_gb, 3)
+    _pressure_stats["last_reclaim_rss_after_gb"] = round(after_memory_gb, 3) if after_memory_gb is not None else None
+    _pressure_stats["last_reclaim_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    after_info = f"{after_memory_gb:.2f}GB" if after_memory_gb is not None else "확인 실패"
+    logger.info(f"🧽 메모리 회수 완료: {reclaimed} (RSS {current_memory_gb:.2f}GB -> {after_info})")
+    return reclaimed
+
+
+def get_memory_pressure_stats() -> Dict[str, Any]:
+    """
+    메모리 압박 상태와 카테고리별 회수 통계를 반환합니다.
+    """
+    return {
+        **_pressure_stats,
+        "categories": {category: dict(stats) for category, stats in _category_stats.items()},
+    }
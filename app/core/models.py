@@ -1,7 +1,9 @@
 """
 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, BigInteger, String, Text, Float, DateTime, JSON, ARRAY
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Float, DateTime, JSON, ARRAY, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from datetime import datetime
 from app.core.database import Base
@@ -12,15 +14,35 @@ class CollectedItem(Base):
     수집된 데이터 아이템
     """
     __tablename__ = "collected_items"
+    # collected_at 기준 일 단위 RANGE 파티션 (파티션 생성/삭제는 app/core/partitions.py)
+    # 파티션 테이블의 기본 키와 UNIQUE 인덱스에는 파티션 키가 포함되어야 하므로 기본 키는 (id, collected_at)
+    # 제목+내용 전문 검색용 GIN 인덱스 (파티션 테이블의 부모에 만들면 모든 파티션에 생성됨)
+    __table_args__ = (
+        Index("ix_collected_items_search_vector", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (collected_at)"},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     source = Column(String, nullable=False, index=True)  # 소스 이름 (예: "Reddit", "BBC News")
     source_type = Column(String, nullable=False, index=True)  # 소스 타입 (예: "reddit", "news", "github")
     title = Column(Text, nullable=False)
     content = Column(Text)  # 설명/내용
     url = Column(Text, index=True)  # 원본 URL
     extra_data = Column(JSON)  # 추가 데이터 (upvotes, likes, stars 등)
-    collected_at = Column(DateTime(timezone=True), default=func.now(), index=True)
+    collected_at = Column(DateTime(timezone=True), primary_key=True, default=func.now(), index=True)  # 마지막으로 수집된 시각 (파티션 키)
+    # 중복 제거: 정규화된 URL(없으면 내용)의 SHA-1 해시, 같은 게시물은 한 행을 갱신
+    # (파티션 테이블이라 UNIQUE 대신 일반 인덱스, 유일성은 저장 경로에서 보장)
+    dedup_key = Column(String(40), index=True)
+    first_seen_at = Column(DateTime(timezone=True), default=func.now())  # 처음 수집된 시각
+    engagement_history = Column(JSON)  # 수집 주기별 참여도 지표 이력 [{"t": ..., "upvotes": ..., "score": ...}, ...]
+    interest_score = Column(BigInteger, index=True)  # 수집 시점에 계산한 관심도 점수 (추정 조회수, 랭킹/상세 집계는 SUM)
+    translations = Column(JSON(none_as_null=True))  # 쓰기 시점 번역 {"ko": {"title": ..., "content": ...}, "en": {...}}
+    # 전문 검색 벡터 (DB가 제목+내용으로 계산하는 생성 컬럼, 검색 조건에만 쓰므로 조회 시 로드하지 않음)
+    # 'simple' 설정: 형태소 분석 없이 소문자 단어 단위 (한국어/영어 혼합 데이터, 접두 검색으로 조사/복수형 대응)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))", persisted=True)
+    ))
 
 
 class AnalysisResult(Base):
@@ -43,6 +65,7 @@ class AnalysisResult(Base):
     what = Column(Text)  # 이슈가 무엇인지 설명
     why_now = Column(Text)  # 왜 지금 이슈가 되고 있는지 설명
     context = Column(Text)  # 배경 맥락 설명
+    translations = Column(JSON(none_as_null=True))  # 쓰기 시점 번역 {"ko": {"topic": ..., "summary": ...}, "en": {...}}
 
 
 class IssueRanking(Base):
@@ -65,4 +88,31 @@ class IssueRanking(Base):
     what = Column(Text)  # 이슈가 무엇인지
     why_now = Column(Text)  # 왜 지금 이슈가 되고 있는지
     context = Column(Text)  # 배경 맥락
+    translations = Column(JSON(none_as_null=True))  # 쓰기 시점 번역 {"ko": {"topic": ..., "description": ...}, "en": {...}}
+
+
+class FeedValidator(Base):
+    """
+    피드/API URL별 HTTP 캐시 검증자 (ETag, Last-Modified)
+    """
+    __tablename__ = "feed_validators"
+    
+    url_hash = Column(String(64), primary_key=True)  # 요청 URL(쿼리 포함)의 SHA-256 해시 (API Key가 저장되지 않도록 해시로 저장)
+    etag = Column(Text)  # 마지막 응답의 ETag
+    last_modified = Column(Text)  # 마지막 응답의 Last-Modified
+    source = Column(Text)  # 이 URL에서 만든 아이템의 source 값 (304 응답 동안 현재 본문 아이템을 찾는 데 사용)
+    fetched_at = Column(DateTime(timezone=True))  # 마지막 200 응답(현재 본문)을 받은 시각, 이후 저장된 아이템이 현재 본문의 아이템
+    last_seen_at = Column(DateTime(timezone=True), index=True)  # 마지막으로 200 또는 304 응답을 받은 시각
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
 
+class TranslationCache(Base):
+    """
+    번역 결과 영구 캐시 (모든 워커가 공유, 같은 텍스트는 한 번만 번역)
+    """
+    __tablename__ = "translation_cache"
+    
+    text_hash = Column(String(64), primary_key=True)  # "목표 언어:원문 전체"의 SHA-256 해시
+    target_language = Column(String(8), nullable=False)  # 목표 언어 ("ko" 또는 "en")
+    translated = Column(Text, nullable=False)  # 번역된 텍스트
+    created_at = Column(DateTime(timezone=True), default=func.now())
@@ -0,0 +1,282 @@
+"""
+collected_items 테이블의 시간 범위 파티션 관리
+collected_at 기준 일(UTC) 단위 PostgreSQL 네이티브 RANGE 파티션을 미리 만들어 두고,
+보존 정리 시에는 행 단위 DELETE 대신 오래된 파티션을 통째로 삭제합니다.
+"""
+import os
+import re
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple, Optional
+from sqlalchemy import text, and_, or_, func, select, exists
+
+logger = logging.getLogger("hourly_pulse")
+
+# 파티션을 나눌 부모 테이블
+PARTITIONED_TABLE = "collected_items"
+
+# 미리 만들어 둘 미래 파티션 일 수 (기본값: 2일)
+PARTITION_PRECREATE_DAYS = int(os.getenv("PARTITION_PRECREATE_DAYS", "2"))
+
+# 범위 밖 데이터(잘못된 수집 시각 등)를 받는 기본 파티션
+DEFAULT_PARTITION = f"{PARTITIONED_TABLE}_default"
+
+_PARTITION_NAME_PATTERN = re.compile(rf"^{PARTITIONED_TABLE}_p(\d{{8}})$")
+
+
+def partition_name(day: datetime) -> str:
+    """
+    해당 날짜(UTC)의 파티션 이름을 반환합니다. (예: collected_items_p20250101)
+    """
+    return f"{PARTITIONED_TABLE}_p{day:%Y%m%d}"
+
+
+def _day_start(value: datetime) -> datetime:
+    """
+    주어진 시각이 속한 날짜의 시작 시각(UTC)을 반환합니다.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def collected_window(start: datetime, end: Optional[datetime] = None):
+    """
+    파티션 프루닝이 되도록 상한을 함께 둔 collected_at 범위 조건을 만듭니다.
+    하한만 있으면 미리 만든 미래 파티션과 기본 파티션까지 스캔하므로, 상한을 두어
+    5분/1시간 윈도우 쿼리가 1~2개 파티션만 읽도록 합니다.
+
+    조건부 GET으로 304를 받은 피드는 아이템의 collected_at이 갱신되지 않으므로,
+    윈도우 안에 200/304 응답을 받은 피드(feed_validators.last_seen_at)의 현재 본문 아이템
+    (같은 source, 마지막 200 응답 시각 fetched_at 이후 저장)도 윈도우 안의 아이템으로 포함합니다.
+    이 경우 하한은 그런 피드의 가장 오래된 fetched_at까지 내려갑니다. (실행 시 파티션 프루닝)
+
+    Args:
+        start: 시작 시각 (포함)
+        end: 종료 시각 (제외, 기본값: 현재 + 1시간 - 서버 간 시계 오차 여유)
+    """
+    from app.core.models import CollectedItem, FeedValidator
+
+    if end is None:
+        end = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    seen_feed = and_(FeedValidator.last_seen_at >= start, FeedValidator.fetched_at.isnot(None))
+    oldest_current = select(func.min(FeedValidator.fetched_at)).where(seen_feed).scalar_subquery()
+    current_in_feed = exists().where(
+        seen_feed,
+        FeedValidator.source == CollectedItem.source,
+        CollectedItem.collected_at >= FeedValidator.fetched_at
+    )
+    return and_(
+        CollectedItem.collected_at >= func.least(start, oldest_current),
+        CollectedItem.collected_at < end,
+        or_(CollectedItem.collected_at >= start, current_in_feed)
+    )
+
+
+def collected_window_sql(alias: str) -> str:
+    """
+    collected_window와 같은 조건의 SQL 문자열을 만듭니다. (text() 쿼리용, :window_start / :window_end 파라미터 사용)
+
+    Args:
+        alias: collected_items 테이블 별칭
+    """
+    seen_feed = "fv.last_seen_at >= :window_start AND fv.fetched_at IS NOT NULL"
+    return (
+        f"{alias}.collected_at >= least(:window_start, (SELECT min(fv.fetched_at) FROM feed_validators fv WHERE {seen_feed})) "
+        f"AND {alias}.collected_at < :window_end "
+        f"AND ({alias}.collected_at >= :window_start OR EXISTS ("
+        f"SELECT 1 FROM feed_validators fv WHERE {seen_feed} "
+        f"AND fv.source = {alias}.source AND {alias}.collected_at >= fv.fetched_at))"
+    )
+
+
+async def is_partitioned(conn) -> bool:
+    """
+    collected_items가 파티션 테이블인지 확인합니다. (마이그레이션 전 기존 테이블이면 False)
+
+    Args:
+        conn: AsyncConnection 또는 AsyncSession
+    """
+    result = await conn.execute(
+        text("SELECT relkind FROM pg_class WHERE relname = :name AND relkind IN ('r', 'p')"),
+        {"name": PARTITIONED_TABLE}
+    )
+    return result.scalar() == "p"
+
+
+async def _table_exists(conn, name: str) -> bool:
+    result = await conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+    return bool(result.scalar())
+
+
+async def _insertable_columns(conn) -> List[str]:
+    """
+    collected_items의 생성 컬럼(search_vector 등)을 제외한 컬럼 목록을 반환합니다. (행 이동 INSERT용)
+    """
+    result = await conn.execute(
+        text(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :name AND is_generated = 'NEVER' "
+            "ORDER BY ordinal_position"
+        ),
+        {"name": PARTITIONED_TABLE}
+    )
+    return [row[0] for row in result.all()]
+
+
+async def create_day_partition(conn, day: datetime) -> None:
+    """
+    해당 날짜의 파티션을 만듭니다. (이미 있으면 무시)
+    파티션이 없는 동안 기본 파티션에 들어간 같은 날짜의 행이 있으면 PARTITION OF가 실패하므로,
+    그 행들을 임시 테이블로 옮긴 뒤 파티션을 만들고 다시 넣습니다. (호출자의 트랜잭션 안에서 실행)
+    """
+    start = _day_start(day)
+    end = start + timedelta(days=1)
+    name = partition_name(start)
+    if await _table_exists(conn, name):
+        return
+
+    bounds = {"start": start, "end": end}
+    range_condition = "collected_at >= :start AND collected_at < :end"
+    moving = False
+    if await _table_exists(conn, DEFAULT_PARTITION):
+        result = await conn.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {range_condition})"), bounds
+        )
+        moving = bool(result.scalar())
+
+    if moving:
+        staging = f"{name}_moving"
+        await conn.execute(text(f"CREATE TEMP TABLE {staging} (LIKE {PARTITIONED_TABLE}) ON COMMIT DROP"))
+        await conn.execute(text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {range_condition} RETURNING *) "
+            f"INSERT INTO {staging} SELECT * FROM moved"
+        ), bounds)
+
+    await conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARTITIONED_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+
+    if moving:
+        columns = ", ".join(await _insertable_columns(conn))
+        result = await conn.execute(text(
+            f"INSERT INTO {PARTITIONED_TABLE} ({columns}) SELECT {columns} FROM {staging}"
+        ))
+        await conn.execute(text(f"DROP TABLE {staging}"))
+        logger.info(f"📦 기본 파티션의 {result.rowcount}개 행을 {name}(으)로 이동")
+
+
+async def _default_partition_days(conn, last_day: datetime) -> List[datetime]:
+    """
+    기본 파티션에 들어 있는 행의 날짜(UTC) 중 last_day 이전 날짜를 반환합니다.
+    """
+    if not await _table_exists(conn, DEFAULT_PARTITION):
+        return []
+    result = await conn.execute(text(
+        f"SELECT DISTINCT (collected_at AT TIME ZONE 'UTC')::date FROM {DEFAULT_PARTITION} ORDER BY 1"
+    ))
+    days = [datetime(d.year, d.month, d.day, tzinfo=timezone.utc) for (d,) in result.all()]
+    return [day for day in days if day <= last_day]
+
+
+async def delete_default_rows_before(conn, before: datetime) -> int:
+    """
+    기본 파티션에서 before 이전의 행을 삭제합니다. (파티션이 만들어지지 못한 날짜의 오래된 행 보존 정리용)
+
+    Returns:
+        삭제된 행 수
+    """
+    if not await _table_exists(conn, DEFAULT_PARTITION):
+        return 0
+    result = await conn.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE collected_at < :before"), {"before": before}
+    )
+    row_count = result.rowcount or 0
+    if row_count > 0:
+        logger.info(f"🗑️ 기본 파티션의 오래된 행 삭제: {row_count}개 행")
+    return row_count
+
+
+async def ensure_partitions(conn, start: Optional[datetime] = None, days_ahead: int = PARTITION_PRECREATE_DAYS) -> int:
+    """
+    start(기본값: 오늘)부터 days_ahead일 뒤까지의 파티션과 기본 파티션을 만듭니다.
+    기본 파티션에 들어간 행이 있으면 그 날짜의 파티션도 만들어 행을 옮깁니다. (days_ahead일 뒤까지)
+
+    Args:
+        conn: AsyncConnection 또는 AsyncSession
+        start: 첫 파티션 날짜
+        days_ahead: 오늘 이후로 미리 만들 일 수
+
+    Returns:
+        확인한 파티션 수
+    """
+    if not await is_partitioned(conn):
+        return 0
+
+    now = datetime.now(timezone.utc)
+    day = _day_start(start or now)
+    last_day = _day_start(now) + timedelta(days=days_ahead)
+
+    days = []
+    while day <= last_day:
+        days.append(day)
+        day += timedelta(days=1)
+    for default_day in await _default_partition_days(conn, last_day):
+        if default_day not in days:
+            days.append(default_day)
+
+    count = 0
+    for day in days:
+        await create_day_partition(conn, day)
+        count += 1
+
+    await conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARTITIONED_TABLE} DEFAULT"))
+    return count
+
+
+async def list_day_partitions(conn) -> List[Tuple[str, datetime, datetime]]:
+    """
+    일 단위 파티션 목록을 오래된 순으로 반환합니다. (기본 파티션 제외)
+
+    Returns:
+        (파티션 이름, 시작 시각, 종료 시각) 리스트
+    """
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :name"
+        ),
+        {"name": PARTITIONED_TABLE}
+    )
+
+    partitions = []
+    for (name,) in result.all():
+        match = _PARTITION_NAME_PATTERN.match(name)
+        if not match:
+            continue
+        start = datetime.strptime(match.group(1), "%Y%m%d").replace(tzinfo=timezone.utc)
+        partitions.append((name, start, start + timedelta(days=1)))
+
+    return sorted(partitions, key=lambda p: p[1])
+
+
+async def drop_partition(conn, name: str) -> int:
+    """
+    파티션을 통째로 삭제합니다. (DELETE와 달리 테이블 팽창이나 VACUUM 부담이 없음)
+
+    Returns:
+        삭제된 파티션의 행 수
+    """
+    if not _PARTITION_NAME_PATTERN.match(name):
+        raise ValueError(f"일 단위 파티션이 아닙니다: {name}")
+
+    count_result = await conn.execute(text(f"SELECT count(*) FROM {name}"))
+    row_count = count_result.scalar() or 0
+    await conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    logger.info(f"🗑️ 파티션 삭제: {name} ({row_count}개 행)")
+    return row_count
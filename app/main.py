@@ -6,12 +6,22 @@ import apscheduler.events
 import logging
 import sys
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from app.services.unified_collector import collect_all_sources
 from app.services.storage import save_all_collected_data
+from app.services.retention import job_retention_task, get_storage_stats, RETENTION_INTERVAL_MINUTES
+from app.core.memory_pressure import check_memory_pressure, get_memory_pressure_stats, MEMORY_CHECK_INTERVAL_SECONDS
 from app.services.ai_analyzer import analyze_collected_data, save_analysis_results
 from app.services.ranking import calculate_issue_rankings, save_issue_rankings, get_top_rankings
 from app.core.database import init_db
+from app.core.http_client import init_http_client, close_http_client, get_http_pool_stats
+from app.services.conditional_fetch import get_conditional_fetch_stats, begin_validator_batch, flush_validators
+from app.services.ranking_snapshot import build_ranking_snapshots, get_snapshot_stats
+from app.services.localization import localize_pending_rows, get_localization_stats
+from app.core.llm_client import get_llm_stats
+from app.services.analysis_cache import get_analysis_cache_stats
+from app.services.live_updates import publish_pipeline_update, get_live_stats
+from app.services.translation_store import get_translation_cache_stats
 
 # Windows에서 SelectorEventLoop 사용 (ProactorEventLoop 대신)
 import selectors
@@ -141,6 +151,7 @@ async def job_collection_task():
     # 통합 수집기 호출
     logger.info("📥 데이터 수집 시작...")
     sys_module.stdout.flush()
+    validator_batch = begin_validator_batch()
     collected_data = await collect_all_sources()
     logger.info(f"✅ 데이터 수집 완료: {sum(len(items) for items in collected_data.values())}개 아이템")
     sys_module.stdout.flush()
@@ -165,6 +176,8 @@ async def job_collection_task():
     # 데이터베이스에 저장
     try:
         save_results = await save_all_collected_data(collected_data)
+        # 저장이 커밋된 뒤에만 이번 주기의 ETag / Last-Modified 반영 (실패하면 다음 주기에 다시 받아 저장)
+        await flush_validators(validator_batch)
         logger.info("💾 저장 결과:")
         for source, count in save_results.items():
             if count > 0:
@@ -220,6 +233,24 @@ async def job_collection_task():
         logger.error(f"❌ 이슈 랭킹 실패: {type(e).__name__} - {e}")
         import traceback
         traceback.print_exc()
+    
+    # 쓰기 시점 번역 (요청 처리기는 저장된 ko/en 번역만 읽음)
+    try:
+        await localize_pending_rows()
+    except Exception as e:
+        logger.error(f"❌ 쓰기 시점 번역 실패: {type(e).__name__} - {e}")
+    
+    # 번역까지 반영된 랭킹으로 /rankings 응답 스냅샷 갱신
+    try:
+        await build_ranking_snapshots()
+    except Exception as e:
+        logger.error(f"❌ 랭킹 스냅샷 생성 실패: {type(e).__name__} - {e}")
+    
+    # 실시간 구독자에게 이번 주기 결과를 한 번 푸시
+    try:
+        await publish_pipeline_update()
+    except Exception as e:
+        logger.error(f"❌ 실시간 업데이트 전송 실패: {type(e).__name__} - {e}")
 
 # 4. Lifespan (수명주기) 관리자
 # 서버가 켜질 때(Start)와 꺼질 때(Shutdown) 할 일을 정의합니다.
@@ -254,6 +285,9 @@ async def lifespan(app: FastAPI):
         sys_module.stdout.flush()
         # 데이터베이스 초기화 실패해도 서버는 계속 실행
     
+    # 공유 HTTP 클라이언트 생성 (모든 수집기가 연결을 재사용)
+    await init_http_client()
+    
     # 현재 실행 중인 이벤트 루프 가져오기
     logger.info("🔄 이벤트 루프 확인 중...")
     sys_module.stdout.flush()
@@ -273,6 +307,23 @@ async def lifespan(app: FastAPI):
         replace_existing=True,
         misfire_grace_time=300  # 작업이 지연되어도 5분 내에는 실행
     )
+    # 보존 정리 작업 (저장 경로와 분리, 시작 직후 한 번 실행하여 저장소 상태 캐시를 채움)
+    scheduler.add_job(
+        job_retention_task,
+        "interval",
+        minutes=RETENTION_INTERVAL_MINUTES,
+        id="retention_cleanup",
+        replace_existing=True,
+        next_run_time=datetime.now(timezone.utc)
+    )
+    # 메모리 압박 확인 작업 (임계값 초과 시 번역 캐시 회수, 다음 분석 배치 축소)
+    scheduler.add_job(
+        check_memory_pressure,
+        "interval",
+        seconds=MEMORY_CHECK_INTERVAL_SECONDS,
+        id="memory_pressure",
+        replace_existing=True
+    )
     logger.info("✅ 작업 등록 완료")
     sys_module.stdout.flush()
     
@@ -352,6 +403,9 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 서버 종료! 스케줄러를 멈춥니다.")
     if scheduler.running:
         scheduler.shutdown(wait=True)
+    
+    # 공유 HTTP 클라이언트 종료
+    await close_http_client()
 
 # 5. FastAPI 앱 생성
 app = FastAPI(
@@ -387,5 +441,15 @@ async def health_check():
     return {
         "status": "ok",
         "scheduler_running": scheduler.running,
-        "next_job_run": next_run
+        "next_job_run": next_run,
+        "storage": get_storage_stats(),
+        "memory_pressure": get_memory_pressure_stats(),
+        "http_pool": get_http_pool_stats(),
+        "conditional_fetch": get_conditional_fetch_stats(),
+        "ranking_snapshot": get_snapshot_stats(),
+        "live_updates": get_live_stats(),
+        "translation_cache": get_translation_cache_stats(),
+        "localization": get_localization_stats(),
+        "llm": get_llm_stats(),
+        "analysis_cache": get_analysis_cache_stats()
     }
\ No newline at end of file
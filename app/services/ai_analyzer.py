@@ -2,31 +2,94 @@
 AI를 사용하여 수집된 데이터를 분석하는 모듈 (Gemini API 사용)
 """
 import os
-import logging
+import re
+import html
 import asyncio
-from typing import List, Dict, Any, Optional
-import google.generativeai as genai
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.core.database import AsyncSessionLocal
 from app.core.models import CollectedItem, AnalysisResult
+from app.core.partitions import collected_window
+from app.core.memory_pressure import register_reclaimer, shed_limit
+from app.core.llm_client import generate_content, is_available as llm_available
+from app.services.analysis_cache import get_cached_analysis, store_analysis
+from app.services.keyword_index import KeywordIndex, tokenize
 
 load_dotenv()
 logger = logging.getLogger("hourly_pulse")
 
-# Gemini 클라이언트 초기화
-gemini_model = None
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# 분석 방식 ("mapreduce": 수집 윈도우 전체를 청크로 나눠 분석 후 병합, "single": 샘플 100개를 한 프롬프트로 분석)
+ANALYSIS_MODE = os.getenv("ANALYSIS_MODE", "mapreduce")
+
+# 맵리듀스 분석에서 윈도우에서 가져올 최대 아이템 수 (기본값: 3,000개)
+ANALYSIS_MAX_ITEMS = int(os.getenv("ANALYSIS_MAX_ITEMS", "3000"))
+
+# 청크당 최대 아이템 수와 최대 글자 수 (기본값: 150개, 24,000자 - 약 12K 토큰)
+ANALYSIS_CHUNK_MAX_ITEMS = int(os.getenv("ANALYSIS_CHUNK_MAX_ITEMS", "150"))
+ANALYSIS_CHUNK_MAX_CHARS = int(os.getenv("ANALYSIS_CHUNK_MAX_CHARS", "24000"))
+
+# 청크를 나누는 시간 구간 (분, 기본값: 15분)
+# 구간이 바뀌어도 청크가 최소 아이템 수(기본값: 30개)보다 작으면 이어서 채움 (작은 청크 남발 방지)
+ANALYSIS_CHUNK_MINUTES = int(os.getenv("ANALYSIS_CHUNK_MINUTES", "15"))
+ANALYSIS_CHUNK_MIN_ITEMS = int(os.getenv("ANALYSIS_CHUNK_MIN_ITEMS", "30"))
+
+# 분석 중인 아이템 배치 (메모리 압박 통계용, 실행 중인 배치는 줄이지 않음)
+_analysis_batches: List[List[CollectedItem]] = []
+
+# 메모리 압박으로 회수가 실행된 뒤 다음 분석 실행의 적재량을 한 번 더 절반으로 줄일지 여부
+_shed_next_run = False
+
+
+def _analysis_batch_limits() -> Tuple[int, int]:
+    """
+    분석 모드별 (최대 적재 아이템 수, 최소 적재 아이템 수)를 반환합니다.
+    """
+    if ANALYSIS_MODE == "mapreduce":
+        return ANALYSIS_MAX_ITEMS, ANALYSIS_CHUNK_MAX_ITEMS
+    return 100, 20
 
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-    # gemini-2.0-flash-lite 사용
-    gemini_model = genai.GenerativeModel('gemini-2.0-flash-lite')
-    logger.info("✅ Gemini 클라이언트 초기화 완료 (gemini-2.0-flash-lite)")
-else:
-    logger.warning("⚠️ GEMINI_API_KEY가 설정되지 않았습니다. AI 분석 기능이 작동하지 않습니다.")
+
+def _reclaim_analysis_batches() -> int:
+    """
+    메모리 압박 시 다음 분석 실행의 적재량을 절반으로 줄이도록 표시합니다.
+    실행 중인 배치는 맵 단계가 청크를 나눠 쓰고 있으므로 자르지 않습니다.
+
+    Returns:
+        다음 실행에서 덜 적재할 아이템 수 (이미 줄이도록 표시되어 있으면 0)
+    """
+    global _shed_next_run
+    if _shed_next_run:
+        return 0
+    _shed_next_run = True
+    limit, minimum = _analysis_batch_limits()
+    planned = shed_limit(limit, minimum=minimum)
+    return planned - max(minimum, planned // 2)
+
+
+def _analysis_limit() -> int:
+    """
+    이번 분석 실행에서 적재할 아이템 수를 계산합니다.
+    지금 메모리 압박 중이면 shed_limit으로, 직전 압박 때 회수가 실행됐으면 한 번 더 절반으로 줄입니다.
+    """
+    global _shed_next_run
+    limit, minimum = _analysis_batch_limits()
+    limit = shed_limit(limit, minimum=minimum)
+    if _shed_next_run:
+        _shed_next_run = False
+        limit = max(minimum, limit // 2)
+    return limit
+
+
+register_reclaimer(
+    "analysis_batches",
+    lambda: sum(len(batch) for batch in _analysis_batches),
+    _reclaim_analysis_batches
+)
 
 
 async def analyze_text_with_ai(text: str, analysis_type: str = "summary") -> Optional[Dict[str, Any]]:
@@ -35,12 +98,12 @@ async def analyze_text_with_ai(text: str, analysis_type: str = "summary") -> Opt
     
     Args:
         text: 분석할 텍스트
-        analysis_type: 분석 타입 ("summary", "keywords", "sentiment")
+        analysis_type: 분석 타입 ("summary", "keywords", "sentiment", 맵리듀스용 "extract", "reduce")
     
     Returns:
         분석 결과 딕셔너리
     """
-    if not gemini_model:
+    if not llm_available():
         logger.error("❌ Gemini 클라이언트가 초기화되지 않았습니다.")
         return None
     
@@ -129,6 +192,43 @@ Issues:
 
 Summary: Current focus is on AI regulation urgency and climate tech investment surge, both driven by recent developments creating critical decision points.
 Keywords: AI, regulation, safety, climate, tech, investment, policy, urgency
+"""
+        elif analysis_type == "extract":
+            # 맵 단계: 한 청크(같은 소스, 인접 시간대)에서 이슈 후보만 추출
+            prompt = f"""You are a multi-source trend analyst. The following items come from ONE source over a short time span, and are only a part of the data collected in the last hour. Extract the issues that these items show are becoming important RIGHT NOW. Skip isolated items that do not form an issue.
+
+{text[:32000]}
+
+Format your response as:
+Issues:
+1. [Descriptive Issue Title]
+   What: [Brief description of what this issue is about]
+   Why Now: [Why this is becoming an issue right now]
+   Context: [Background context]
+
+Keywords: [3-8 relevant keywords, comma-separated]
+
+List at most 5 issues, most important first.
+"""
+        elif analysis_type == "reduce":
+            # 리듀스 단계: 청크별 이슈 후보를 병합해 최종 이슈 선정
+            prompt = f"""You are an expert multi-source trend analyst. The following candidate issues were extracted separately from chunks of the data collected in the last hour (news, social media, GitHub, YouTube, etc.). Each candidate shows how many chunks and which sources mentioned it.
+
+Merge candidates that describe the same issue, then select the issues that are most important RIGHT NOW. Prefer issues mentioned in many chunks and across several source types.
+
+{text[:32000]}
+
+Format your response as:
+Issues:
+1. [Descriptive Issue Title]
+   What: [Brief description of what this issue is about]
+   Why Now: [Explain why this is becoming an issue RIGHT NOW - what changed, what makes it timely]
+   Context: [Background context that explains the significance]
+
+Summary: [Overall summary of the main trends and why they matter now, one sentence under 200 characters]
+Keywords: [5-10 relevant keywords, comma-separated]
+
+List at most 10 issues, most important first.
 """
         elif analysis_type == "keywords":
             prompt = f"""다음 텍스트에서 가장 중요한 키워드와 주제를 추출해주세요.
@@ -151,38 +251,11 @@ Keywords: AI, regulation, safety, climate, tech, investment, policy, urgency
 - 이유: (간단한 설명)
 """
         
-        # Gemini API 호출 (비동기 실행을 위해 run_in_executor 사용)
-        # 안전 설정을 최대한 완화
-        safety_settings = [
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-        ]
-        
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,  # 창의성 증가 (맥락과 설명을 위해)
-                    max_output_tokens=8000,  # 4M TPM 활용하여 더 긴 응답 (2000 -> 8000으로 증가)
-                ),
-                safety_settings=safety_settings
-            )
+        # Gemini API 호출 (공유 LLM 클라이언트: RPM/TPM 제한, 재시도, 안전 설정 적용)
+        response = await generate_content(
+            prompt,
+            temperature=0.7,  # 창의성 증가 (맥락과 설명을 위해)
+            max_output_tokens=3000 if analysis_type == "extract" else 8000,  # 4M TPM 활용하여 더 긴 응답 (청크 추출은 이슈 5개 이내라 짧게)
         )
         
         # Gemini 응답에서 텍스트 추출
@@ -413,7 +486,7 @@ async def estimate_news_interest_score(title: str, description: str = "") -> Opt
     Returns:
         추정 조회수 (0-100000 범위의 점수를 조회수로 변환)
     """
-    if not gemini_model:
+    if not llm_available():
         logger.warning("⚠️ Gemini 클라이언트가 초기화되지 않았습니다. 뉴스 관심도 추정을 건너뜁니다.")
         return None
     
@@ -447,37 +520,11 @@ Provide your assessment as a single number from 0 to 100, where:
 
 Respond with ONLY a number between 0 and 100, nothing else."""
         
-        # Gemini API 호출
-        safety_settings = [
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-        ]
-        
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # 낮은 온도로 일관성 있는 점수
-                    max_output_tokens=10,  # 숫자만 필요하므로 짧게
-                ),
-                safety_settings=safety_settings
-            )
+        # Gemini API 호출 (공유 LLM 클라이언트)
+        response = await generate_content(
+            prompt,
+            temperature=0.3,  # 낮은 온도로 일관성 있는 점수
+            max_output_tokens=10,  # 숫자만 필요하므로 짧게
         )
         
         # 응답 파싱
@@ -536,7 +583,7 @@ async def get_recent_items_for_analysis(hours: int = 1, limit: int = 1000) -> Li
                 CollectedItem.source_type,
                 func.count(CollectedItem.id)
             ).where(
-                CollectedItem.collected_at >= cutoff_time
+                collected_window(cutoff_time)
             ).group_by(CollectedItem.source_type)
             
             source_type_result = await session.execute(source_type_query)
@@ -557,7 +604,7 @@ async def get_recent_items_for_analysis(hours: int = 1, limit: int = 1000) -> Li
                 try:
                     # 각 소스 타입에서 최신 데이터 가져오기
                     query = select(CollectedItem).where(
-                        CollectedItem.collected_at >= cutoff_time,
+                        collected_window(cutoff_time),
                         CollectedItem.source_type == source_type
                     ).order_by(CollectedItem.collected_at.desc()).limit(items_per_source * 2)  # 2배 가져와서 다양성 확보
                     
@@ -599,6 +646,77 @@ async def get_recent_items_for_analysis(hours: int = 1, limit: int = 1000) -> Li
             return []
 
 
+def _format_item_text(item: CollectedItem) -> Optional[str]:
+    """
+    아이템 하나를 분석 텍스트 한 줄로 변환합니다. (너무 짧으면 None)
+    """
+    # 제목과 내용 모두 사용 (내용 기반 분석)
+    title = item.title or ""
+    content = item.content or ""
+    
+    # HTML 엔티티 디코딩
+    title = html.unescape(title)
+    content = html.unescape(content)
+    
+    # 특수 문자 제거 및 정리
+    title = title.replace('\n', ' ').replace('\r', ' ').strip()
+    content = content.replace('\n', ' ').replace('\r', ' ').strip()
+    
+    # 소스 타입 정보 포함 (다양성 강조)
+    source_type_label = (item.source_type or "unknown").upper()
+    
+    # 제목과 내용 조합 (내용이 있으면 포함, 4M TPM 활용하여 더 긴 텍스트)
+    if content and len(content) > 20:
+        # YouTube는 설명이 더 길 수 있으므로 더 많은 텍스트 사용
+        if source_type_label == "YOUTUBE":
+            # 제목 + 내용 (최대 1000자로 증가)
+            text = f"[{source_type_label}] {title[:150]} | {content[:1000]}"
+        else:
+            # 제목 + 내용 요약 (최대 500자)
+            text = f"[{source_type_label}] {title[:150]} | {content[:500]}"
+    else:
+        # 제목만 사용
+        text = f"[{source_type_label}] {title[:200]}"
+    
+    if len(text.strip()) > 10:  # 최소 길이 체크
+        return text
+    return None
+
+
+async def get_window_items_for_analysis(hours: int = 1, limit: int = ANALYSIS_MAX_ITEMS) -> List[CollectedItem]:
+    """
+    맵리듀스 분석용으로 수집 윈도우의 아이템을 샘플링 없이 가져옵니다.
+    (윈도우가 limit보다 크면 최신 아이템 우선)
+    
+    Args:
+        hours: 최근 몇 시간 내 데이터
+        limit: 최대 개수
+    
+    Returns:
+        CollectedItem 리스트 (최신순)
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            from datetime import timezone
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+            
+            result = await session.execute(
+                select(CollectedItem)
+                .where(collected_window(cutoff_time))
+                .order_by(CollectedItem.collected_at.desc())
+                .limit(limit)
+            )
+            items = list(result.scalars().all())
+            
+            source_dist = Counter(item.source_type for item in items)
+            logger.info(f"📊 분석 대상: 최근 {hours}시간 내 {len(items)}개 아이템 전체 (소스 분포: {dict(source_dist)})")
+            return items
+            
+        except Exception as e:
+            logger.error(f"❌ 데이터 조회 실패: {type(e).__name__} - {e}")
+            return []
+
+
 async def prepare_text_for_analysis(items: List[CollectedItem]) -> str:
     """
     수집된 아이템들을 분석 가능한 텍스트로 변환합니다.
@@ -619,36 +737,8 @@ async def prepare_text_for_analysis(items: List[CollectedItem]) -> str:
     logger.info(f"📝 분석 텍스트 준비: {len(selected_items)}개 아이템 (소스 분포: {source_stats})")
     
     for item in selected_items:
-        # 제목과 내용 모두 사용 (내용 기반 분석)
-        title = item.title or ""
-        content = item.content or ""
-        
-        # HTML 엔티티 디코딩
-        import html
-        title = html.unescape(title)
-        content = html.unescape(content)
-        
-        # 특수 문자 제거 및 정리
-        title = title.replace('\n', ' ').replace('\r', ' ').strip()
-        content = content.replace('\n', ' ').replace('\r', ' ').strip()
-        
-        # 소스 타입 정보 포함 (다양성 강조)
-        source_type_label = item.source_type.upper()
-        
-        # 제목과 내용 조합 (내용이 있으면 포함, 4M TPM 활용하여 더 긴 텍스트)
-        if content and len(content) > 20:
-            # YouTube는 설명이 더 길 수 있으므로 더 많은 텍스트 사용
-            if source_type_label == "YOUTUBE":
-                # 제목 + 내용 (최대 1000자로 증가)
-                text = f"[{source_type_label}] {title[:150]} | {content[:1000]}"
-            else:
-                # 제목 + 내용 요약 (최대 500자)
-                text = f"[{source_type_label}] {title[:150]} | {content[:500]}"
-        else:
-            # 제목만 사용
-            text = f"[{source_type_label}] {title[:200]}"
-        
-        if text and len(text.strip()) > 10:  # 최소 길이 체크
+        text = _format_item_text(item)
+        if text:
             texts.append(text)
     
     final_text = "\n".join(texts)
@@ -656,13 +746,14 @@ async def prepare_text_for_analysis(items: List[CollectedItem]) -> str:
     return final_text
 
 
-async def calculate_importance_score(topic: str, items: List[CollectedItem]) -> float:
+async def calculate_importance_score(topic: str, items: List[CollectedItem], mention_count: Optional[int] = None) -> float:
     """
     토픽의 중요도 점수를 계산합니다.
     
     Args:
         topic: 토픽/키워드
         items: 관련 아이템 리스트
+        mention_count: 미리 계산한 언급 횟수 (None이면 아이템 제목/내용에서 직접 계산)
     
     Returns:
         중요도 점수 (0.0 ~ 1.0)
@@ -671,8 +762,9 @@ async def calculate_importance_score(topic: str, items: List[CollectedItem]) ->
         return 0.0
     
     # 1. 언급 횟수 (빈도)
-    mention_count = sum(1 for item in items if topic.lower() in item.title.lower() or 
-                       (item.content and topic.lower() in item.content.lower()))
+    if mention_count is None:
+        mention_count = sum(1 for item in items if topic.lower() in item.title.lower() or 
+                           (item.content and topic.lower() in item.content.lower()))
     
     # 2. 소스 다양성 (다양한 소스에서 언급되었는지)
     unique_sources = len(set(item.source_type for item in items))
@@ -711,6 +803,161 @@ async def calculate_importance_score(topic: str, items: List[CollectedItem]) ->
     return min(importance, 1.0)
 
 
+def build_analysis_chunks(items: List[CollectedItem]) -> List[List[CollectedItem]]:
+    """
+    아이템을 소스별, 시간 구간별 청크로 나눕니다.
+    같은 소스 안에서 시간순으로 채우며, 최대 아이템 수/글자 수를 넘거나
+    ANALYSIS_CHUNK_MINUTES 구간이 바뀌면(청크가 최소 크기 이상일 때) 새 청크를 시작합니다.
+    
+    Args:
+        items: 분석할 아이템
+    
+    Returns:
+        청크 리스트 (청크마다 하나의 소스)
+    """
+    items_by_source: Dict[str, List[CollectedItem]] = {}
+    for item in items:
+        items_by_source.setdefault(item.source_type or 'unknown', []).append(item)
+    
+    chunks = []
+    slice_seconds = max(1, ANALYSIS_CHUNK_MINUTES) * 60
+    for source_items in items_by_source.values():
+        source_items.sort(key=lambda x: x.collected_at or datetime.min)
+        chunk, chunk_chars, chunk_slice = [], 0, None
+        for item in source_items:
+            item_slice = int(item.collected_at.timestamp() // slice_seconds) if item.collected_at else None
+            item_chars = len(item.title or "") + min(len(item.content or ""), 1000)
+            
+            is_full = len(chunk) >= ANALYSIS_CHUNK_MAX_ITEMS or chunk_chars + item_chars > ANALYSIS_CHUNK_MAX_CHARS
+            slice_changed = item_slice != chunk_slice and len(chunk) >= ANALYSIS_CHUNK_MIN_ITEMS
+            if chunk and (is_full or slice_changed):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            
+            if not chunk:
+                chunk_slice = item_slice
+            chunk.append(item)
+            chunk_chars += item_chars
+        if chunk:
+            chunks.append(chunk)
+    
+    return chunks
+
+
+async def _extract_chunk_issues(chunk: List[CollectedItem]) -> Optional[Dict[str, Any]]:
+    """
+    맵 단계: 청크 하나에서 이슈 후보를 추출합니다. (청크 입력이 같거나 거의 같으면 캐시된 결과 재사용)
+    """
+    cached = get_cached_analysis(chunk, scope="chunk")
+    if cached is not None:
+        return cached
+    
+    texts = [text for text in (_format_item_text(item) for item in chunk) if text]
+    if not texts:
+        return None
+    
+    result = await analyze_text_with_ai("\n".join(texts), analysis_type="extract")
+    if result:
+        store_analysis(chunk, result, scope="chunk")
+    return result
+
+
+def _normalize_issue_title(title: str) -> str:
+    return re.sub(r'[^\w]+', ' ', title.lower()).strip()
+
+
+def _merge_chunk_issues(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    청크별 이슈 후보를 제목 기준으로 병합하고 언급된 청크 수 순으로 정렬합니다.
+    (리듀스 프롬프트의 입력이자, 리듀스 호출이 실패했을 때의 최종 결과)
+    
+    Args:
+        partials: [{"source_type", "result"}] 청크별 추출 결과
+    
+    Returns:
+        parse_ai_response와 같은 형식의 분석 결과 (이슈마다 chunk_count, sources 포함)
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    keyword_counts: Counter = Counter()
+    for partial in partials:
+        result = partial["result"]
+        keyword_counts.update(k.lower() for k in result.get('keywords', []))
+        for issue in result.get('issues', []):
+            title = issue.get('title', '')
+            key = _normalize_issue_title(title)
+            if not key:
+                continue
+            entry = merged.get(key)
+            if entry is None:
+                entry = merged[key] = {**issue, 'chunk_count': 0, 'sources': set()}
+            entry['chunk_count'] += 1
+            entry['sources'].add(partial["source_type"])
+    
+    issues = sorted(merged.values(), key=lambda x: (x['chunk_count'], len(x['sources'])), reverse=True)
+    for issue in issues:
+        issue['sources'] = sorted(issue['sources'])
+    
+    result: Dict[str, Any] = {
+        'issues': issues,
+        'topics': [issue['title'] for issue in issues],
+        'keywords': [keyword for keyword, _ in keyword_counts.most_common(10)],
+        'sentiment': 'neutral',
+    }
+    if issues:
+        result['summary'] = issues[0].get('why_now') or issues[0].get('what') or issues[0].get('description', '')
+    else:
+        result['summary'] = ''
+    return result
+
+
+async def map_reduce_analysis(items: List[CollectedItem]) -> Optional[Dict[str, Any]]:
+    """
+    수집 윈도우 전체를 맵리듀스로 분석합니다.
+    1. 맵: 소스/시간 청크마다 이슈 후보 추출 (공유 LLM 클라이언트의 RPM/TPM 제한 안에서 동시 실행)
+    2. 리듀스: 후보를 제목 기준으로 묶은 뒤 모델이 같은 이슈를 병합하고 최종 이슈 선정
+       (리듀스 호출이 실패하면 청크 수 기준 병합 결과를 그대로 사용)
+    
+    Args:
+        items: 분석할 아이템
+    
+    Returns:
+        parse_ai_response와 같은 형식의 분석 결과, 실패하면 None
+    """
+    chunks = build_analysis_chunks(items)
+    logger.info(f"🧩 맵리듀스 분석: {len(items)}개 아이템을 {len(chunks)}개 청크로 분할")
+    
+    chunk_results = await asyncio.gather(*[_extract_chunk_issues(chunk) for chunk in chunks])
+    partials = [
+        {"source_type": chunk[0].source_type or 'unknown', "result": result}
+        for chunk, result in zip(chunks, chunk_results)
+        if result and result.get('issues')
+    ]
+    logger.info(f"🧩 맵 단계 완료: {len(partials)}/{len(chunks)}개 청크에서 이슈 추출")
+    
+    if not partials:
+        return None
+    
+    merged = _merge_chunk_issues(partials)
+    if len(partials) == 1:
+        return merged
+    
+    candidates = []
+    for index, issue in enumerate(merged['issues'][:60], 1):
+        candidates.append(
+            f"{index}. {issue['title']} (chunks: {issue['chunk_count']}, sources: {', '.join(issue['sources'])})\n"
+            f"   What: {issue.get('what', '')}\n"
+            f"   Why Now: {issue.get('why_now', '')}\n"
+            f"   Context: {issue.get('context', '')}"
+        )
+    
+    reduced = await analyze_text_with_ai("\n".join(candidates), analysis_type="reduce")
+    if not reduced or not reduced.get('issues'):
+        logger.warning("⚠️ 리듀스 단계 실패, 청크 수 기준 병합 결과 사용")
+        return merged
+    
+    return reduced
+
+
 async def analyze_collected_data(hours: int = 1) -> List[Dict[str, Any]]:
     """
     최근 수집된 데이터를 분석합니다.
@@ -721,32 +968,68 @@ async def analyze_collected_data(hours: int = 1) -> List[Dict[str, Any]]:
     Returns:
         분석 결과 리스트
     """
-    if not gemini_model:
+    if not llm_available():
         logger.warning("⚠️ Gemini API Key가 설정되지 않아 AI 분석을 건너뜁니다.")
         return []
     
     logger.info("🤖 AI 분석 시작...")
     
-    # 1. 최근 수집 데이터 가져오기
-    items = await get_recent_items_for_analysis(hours=hours, limit=100)
+    # 1. 최근 수집 데이터 가져오기 (메모리 압박 중이면 배치 크기 축소)
+    if ANALYSIS_MODE == "mapreduce":
+        items = await get_window_items_for_analysis(hours=hours, limit=_analysis_limit())
+    else:
+        items = await get_recent_items_for_analysis(hours=hours, limit=_analysis_limit())
     
     if not items:
         logger.warning("⚠️ 분석할 데이터가 없습니다.")
         return []
     
-    # 2. 텍스트 준비 (내용 포함)
-    analysis_text = await prepare_text_for_analysis(items)
+    _analysis_batches.append(items)
+    try:
+        return await _analyze_items(items)
+    finally:
+        _analysis_batches[:] = [batch for batch in _analysis_batches if batch is not items]
+
+
+async def _analyze_items(items: List[CollectedItem]) -> List[Dict[str, Any]]:
+    """
+    아이템 배치로 AI 분석을 수행합니다.
+    
+    Args:
+        items: 분석할 아이템 배치
     
-    if len(analysis_text) < 50:
-        logger.warning("⚠️ 분석할 텍스트가 너무 짧습니다.")
-        return []
+    Returns:
+        분석 결과 리스트
+    """
+    # 2. 입력이 직전 분석과 같거나 거의 같으면 파싱된 결과 재사용 (큰 모델 호출 생략)
+    ai_result = get_cached_analysis(items, scope="summary")
     
-    # 3. AI 분석 수행 (내용 기반 이슈 추출)
-    ai_result = await analyze_text_with_ai(analysis_text, analysis_type="summary")
+    if ai_result is None and ANALYSIS_MODE == "mapreduce" and len(items) > ANALYSIS_CHUNK_MAX_ITEMS:
+        # 3. 한 프롬프트에 담기 어려운 윈도우는 청크별 추출 후 병합 (청크별 결과도 캐시 재사용)
+        ai_result = await map_reduce_analysis(items)
+        
+        if not ai_result:
+            logger.error("❌ AI 분석 실패")
+            return []
+        
+        store_analysis(items, ai_result, scope="summary")
     
-    if not ai_result:
-        logger.error("❌ AI 분석 실패")
-        return []
+    elif ai_result is None:
+        # 텍스트 준비 (내용 포함)
+        analysis_text = await prepare_text_for_analysis(items)
+        
+        if len(analysis_text) < 50:
+            logger.warning("⚠️ 분석할 텍스트가 너무 짧습니다.")
+            return []
+        
+        # 3. AI 분석 수행 (내용 기반 이슈 추출)
+        ai_result = await analyze_text_with_ai(analysis_text, analysis_type="summary")
+        
+        if not ai_result:
+            logger.error("❌ AI 분석 실패")
+            return []
+        
+        store_analysis(items, ai_result, scope="summary")
     
     # 4. 각 토픽에 대해 상세 분석
     analysis_results = []
@@ -764,6 +1047,12 @@ async def analyze_collected_data(hours: int = 1) -> List[Dict[str, Any]]:
         keywords = ai_result.get('keywords', [])[:5]
         issues = [{'title': kw, 'description': ''} for kw in keywords]
     
+    # 이슈-아이템 매칭용 역색인과 소스 타입별 분류는 분석 실행마다 한 번만 생성
+    keyword_index = KeywordIndex(items)
+    items_by_source: Dict[str, List[CollectedItem]] = {}
+    for item in items:
+        items_by_source.setdefault(item.source_type or 'unknown', []).append(item)
+    
     for issue in issues[:10]:  # 최대 10개 이슈만 분석
         issue_title = issue.get('title', '') if isinstance(issue, dict) else str(issue)
         issue_desc = issue.get('description', '') if isinstance(issue, dict) else ''
@@ -771,47 +1060,25 @@ async def analyze_collected_data(hours: int = 1) -> List[Dict[str, Any]]:
         if not issue_title:
             continue
         
-        # 해당 이슈와 관련된 아이템 필터링 (내용 기반 매칭)
+        # 해당 이슈와 관련된 아이템 필터링 (내용 기반 매칭, 역색인 포스팅 조회)
         # 소스 타입별로 균등하게 포함하여 출처 다양성 확보
         related_items = []
-        issue_keywords = issue_title.lower().split()
+        issue_keywords = [keyword for keyword in tokenize(issue_title) if len(keyword) > 2]  # 2글자 이상인 키워드도 포함 (기존 3글자 → 2글자)
         
-        # 소스 타입별로 아이템 분류
-        items_by_source = {}
-        for item in items:
-            source_type = item.source_type or 'unknown'
-            if source_type not in items_by_source:
-                items_by_source[source_type] = []
-            items_by_source[source_type].append(item)
+        # 이슈 제목의 주요 단어들이 제목(2점)이나 내용(1점)에 포함되는지 확인
+        # 최소 1점 이상이면 관련 아이템으로 간주 (기존 2점 → 1점으로 완화)
+        match_scores = keyword_index.score_keywords(issue_keywords)
+        title_matches = None
         
         # 각 소스 타입별로 최소 1개 이상 포함하도록 매칭
         for source_type, source_items in items_by_source.items():
-            source_matched = []
-            
-            for item in source_items:
-                title_lower = (item.title or "").lower()
-                content_lower = (item.content or "").lower()
-                
-                # 이슈 제목의 주요 단어들이 제목이나 내용에 포함되는지 확인
-                match_score = 0
-                for keyword in issue_keywords:
-                    if len(keyword) > 2:  # 2글자 이상인 키워드도 포함 (기존 3글자 → 2글자)
-                        if keyword in title_lower:
-                            match_score += 2
-                        elif keyword in content_lower:
-                            match_score += 1
-                
-                # 최소 1점 이상이면 관련 아이템으로 간주 (기존 2점 → 1점으로 완화)
-                if match_score >= 1:
-                    source_matched.append((item, match_score))
+            source_matched = [(item, match_scores[item.id]) for item in source_items if item.id in match_scores]
             
             # 매칭이 안 되면 이슈 제목 자체가 포함된 경우도 포함
             if not source_matched:
-                for item in source_items:
-                    title_lower = (item.title or "").lower()
-                    content_lower = (item.content or "").lower()
-                    if issue_title.lower() in title_lower or issue_title.lower() in content_lower:
-                        source_matched.append((item, 3))  # 높은 점수 부여
+                if title_matches is None:
+                    title_matches = keyword_index.phrase_matches(issue_title)
+                source_matched = [(item, 3) for item in source_items if item.id in title_matches]  # 높은 점수 부여
             
             # 각 소스 타입별로 최대 10개까지 점수 순으로 선택
             source_matched.sort(key=lambda x: x[1], reverse=True)
@@ -819,19 +1086,20 @@ async def analyze_collected_data(hours: int = 1) -> List[Dict[str, Any]]:
         
         # 전체 아이템에서도 추가 매칭 시도 (소스 타입 무관)
         if len(related_items) < 5:
-            for item in items:
-                if item in related_items:
-                    continue
-                title_lower = (item.title or "").lower()
-                content_lower = (item.content or "").lower()
-                if issue_title.lower() in title_lower or issue_title.lower() in content_lower:
-                    related_items.append(item)
+            if title_matches is None:
+                title_matches = keyword_index.phrase_matches(issue_title)
+            related_ids = {item.id for item in related_items}
+            for item_id in sorted(title_matches - related_ids, key=keyword_index.position.get):
+                related_items.append(items[keyword_index.position[item_id]])
         
         if not related_items:
             continue
         
-        # 중요도 점수 계산
-        importance_score = await calculate_importance_score(issue_title, related_items)
+        # 중요도 점수 계산 (언급 횟수는 역색인의 구문 일치 결과 사용)
+        if title_matches is None:
+            title_matches = keyword_index.phrase_matches(issue_title)
+        mention_count = sum(1 for item in related_items if item.id in title_matches)
+        importance_score = await calculate_importance_score(issue_title, related_items, mention_count=mention_count)
         
         # 관련 아이템 ID 수집
         related_ids = [item.id for item in related_items]
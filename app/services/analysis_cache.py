@@ -0,0 +1,134 @@
+"""
+AI 분석 결과 캐시 (내용 주소 기반)
+분석 입력(아이템 ID + 제목/내용 해시)의 지문으로 파싱된 분석 결과를 보관합니다.
+5분 주기 사이에 수집 윈도우가 거의 바뀌지 않으면 큰 모델 호출 대신 직전 결과를 재사용합니다.
+- 정확히 같은 입력: 정렬된 지문의 해시 키로 조회
+- 거의 같은 입력: 지문 집합의 Jaccard 유사도가 임계값 이상이면 재사용
+"""
+import os
+import time
+import hashlib
+import logging
+from typing import Dict, Any, List, Optional, FrozenSet
+from app.core.memory_pressure import register_reclaimer
+
+logger = logging.getLogger("hourly_pulse")
+
+# 캐시 유효 시간 (초, 기본값: 900초 - 수집 주기 3번)
+ANALYSIS_CACHE_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "900"))
+
+# 재사용할 최소 Jaccard 유사도 (기본값: 0.9)
+ANALYSIS_CACHE_SIMILARITY = float(os.getenv("ANALYSIS_CACHE_SIMILARITY", "0.9"))
+
+# 보관할 최대 항목 수 (맵리듀스 분석의 청크별 결과 포함, 기본값: 256개)
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "256"))
+
+# 입력 키 -> {"scope", "fingerprint", "result", "stored_at"}
+_entries: Dict[str, Dict[str, Any]] = {}
+
+_stats: Dict[str, int] = {
+    "exact_hits": 0,
+    "similar_hits": 0,
+    "misses": 0,
+    "expired": 0,
+}
+
+
+def _reclaim_entries() -> int:
+    """
+    메모리 압박 시 분석 캐시를 비웁니다.
+    """
+    count = len(_entries)
+    _entries.clear()
+    return count
+
+
+register_reclaimer("analysis_cache", lambda: len(_entries), _reclaim_entries)
+
+
+def item_fingerprint(items: List[Any]) -> FrozenSet[str]:
+    """
+    아이템들의 지문을 만듭니다. (아이템 ID + 제목/내용 해시, 참여도 지표 변화는 무시)
+    """
+    fingerprint = set()
+    for item in items:
+        content_hash = hashlib.sha1(f"{item.title or ''}\n{item.content or ''}".encode("utf-8")).hexdigest()[:16]
+        fingerprint.add(f"{item.id}:{content_hash}")
+    return frozenset(fingerprint)
+
+
+def _entry_key(scope: str, fingerprint: FrozenSet[str]) -> str:
+    payload = scope + "\n" + "\n".join(sorted(fingerprint))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _evict_expired(now: float) -> None:
+    for key in [key for key, entry in _entries.items() if now - entry["stored_at"] > ANALYSIS_CACHE_TTL_SECONDS]:
+        del _entries[key]
+        _stats["expired"] += 1
+
+
+def get_cached_analysis(items: List[Any], scope: str = "summary") -> Optional[Dict[str, Any]]:
+    """
+    같거나 거의 같은 입력의 분석 결과를 찾습니다.
+
+    Args:
+        items: 분석할 아이템
+        scope: 캐시 범위 (분석 종류 등, 범위가 다르면 재사용하지 않음)
+
+    Returns:
+        파싱된 분석 결과, 없으면 None
+    """
+    now = time.time()
+    _evict_expired(now)
+
+    fingerprint = item_fingerprint(items)
+    entry = _entries.get(_entry_key(scope, fingerprint))
+    if entry is not None:
+        _stats["exact_hits"] += 1
+        return entry["result"]
+
+    best_entry, best_similarity = None, 0.0
+    for candidate in _entries.values():
+        if candidate["scope"] != scope:
+            continue
+        similarity = _jaccard(fingerprint, candidate["fingerprint"])
+        if similarity > best_similarity:
+            best_entry, best_similarity = candidate, similarity
+
+    if best_entry is not None and best_similarity >= ANALYSIS_CACHE_SIMILARITY:
+        _stats["similar_hits"] += 1
+        logger.info(f"♻️ 직전 분석 결과 재사용 (입력 유사도 {best_similarity:.2f})")
+        return best_entry["result"]
+
+    _stats["misses"] += 1
+    return None
+
+
+def store_analysis(items: List[Any], result: Dict[str, Any], scope: str = "summary") -> None:
+    """
+    분석 결과를 입력 지문과 함께 저장합니다. (최대 항목 수를 넘으면 가장 오래된 항목 제거)
+    """
+    fingerprint = item_fingerprint(items)
+    _entries[_entry_key(scope, fingerprint)] = {
+        "scope": scope,
+        "fingerprint": fingerprint,
+        "result": result,
+        "stored_at": time.time(),
+    }
+    while len(_entries) > ANALYSIS_CACHE_MAX_ENTRIES:
+        oldest_key = min(_entries, key=lambda key: _entries[key]["stored_at"])
+        del _entries[oldest_key]
+
+
+def get_analysis_cache_stats() -> Dict[str, int]:
+    """
+    분석 캐시 적중/미스 통계를 반환합니다.
+    """
+    return {**_stats, "entries": len(_entries)}
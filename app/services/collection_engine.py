@@ -0,0 +1,110 @@
+"""
+여러 수집 작업을 동시에 실행하는 수집 엔진
+각 소스(및 서브 피드)를 동시에 실행하여 한 주기의 수집 시간이
+모든 소스 시간의 합이 아닌 가장 느린 소스의 시간에 가깝도록 합니다.
+"""
+import os
+import time
+import asyncio
+import logging
+from typing import List, Dict, Any, Tuple, Callable, Awaitable
+
+logger = logging.getLogger("hourly_pulse")
+
+# 동시에 실행할 최대 수집 작업 수 (환경 변수로 설정 가능, 기본값: 16개)
+COLLECTION_MAX_CONCURRENCY = int(os.getenv("COLLECTION_MAX_CONCURRENCY", "16"))
+
+# 소스 하나당 최대 대기 시간 (초, 기본값: 15초)
+COLLECTION_SOURCE_TIMEOUT = float(os.getenv("COLLECTION_SOURCE_TIMEOUT", "15"))
+
+# 한 수집 주기 전체의 시간 예산 (초, 기본값: 60초)
+COLLECTION_TOTAL_BUDGET = float(os.getenv("COLLECTION_TOTAL_BUDGET", "60"))
+
+# (결과 키, 작업 이름, 코루틴 팩토리)
+# 팩토리는 세마포어를 획득한 뒤에 호출되므로, 시작되지 못한 작업의 코루틴이 생성되지 않습니다.
+CollectionTask = Tuple[str, str, Callable[[], Awaitable[List[Dict[str, Any]]]]]
+
+
+async def _run_one(
+    name: str,
+    factory: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    semaphore: asyncio.Semaphore,
+    source_timeout: float
+) -> List[Dict[str, Any]]:
+    """
+    수집 작업 하나를 동시 실행 제한과 소스별 타임아웃 안에서 실행합니다.
+
+    Args:
+        name: 작업 이름 (로그용)
+        factory: 수집 코루틴을 생성하는 함수
+        semaphore: 동시 실행 제한 세마포어
+        source_timeout: 소스별 최대 대기 시간 (초)
+
+    Returns:
+        수집된 아이템 리스트 (실패 또는 타임아웃 시 빈 리스트)
+    """
+    async with semaphore:
+        started = time.monotonic()
+        try:
+            items = await asyncio.wait_for(factory(), timeout=source_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ {name} 수집 타임아웃 ({source_timeout:.0f}초 초과), 건너뜁니다.")
+            return []
+        except Exception as e:
+            logger.error(f"❌ {name} 수집 실패: {type(e).__name__} - {e}")
+            return []
+
+        elapsed = time.monotonic() - started
+        logger.debug(f"⏱️ {name}: {len(items or [])}개, {elapsed:.2f}초")
+        return items or []
+
+
+async def run_collection_tasks(
+    tasks: List[CollectionTask],
+    max_concurrency: int = COLLECTION_MAX_CONCURRENCY,
+    source_timeout: float = COLLECTION_SOURCE_TIMEOUT,
+    total_budget: float = COLLECTION_TOTAL_BUDGET
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    여러 수집 작업을 동시에 실행하고 결과 키별로 합칩니다.
+
+    Args:
+        tasks: (결과 키, 작업 이름, 코루틴 팩토리) 리스트
+        max_concurrency: 동시에 실행할 최대 작업 수
+        source_timeout: 소스별 최대 대기 시간 (초)
+        total_budget: 전체 수집 시간 예산 (초), 초과 시 남은 작업은 취소
+
+    Returns:
+        결과 키별 아이템 리스트 딕셔너리 (같은 키의 결과는 작업 등록 순서대로 합쳐짐)
+    """
+    results: Dict[str, List[Dict[str, Any]]] = {key: [] for key, _, _ in tasks}
+    if not tasks:
+        return results
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    started = time.monotonic()
+
+    running = [
+        asyncio.ensure_future(_run_one(name, factory, semaphore, source_timeout))
+        for _, name, factory in tasks
+    ]
+
+    done, pending = await asyncio.wait(running, timeout=total_budget)
+
+    if pending:
+        # 전체 시간 예산 초과: 남은 작업 취소
+        timed_out_names = [tasks[i][1] for i, future in enumerate(running) if future in pending]
+        logger.warning(f"⏱️ 전체 수집 시간 예산({total_budget:.0f}초) 초과, {len(pending)}개 작업 취소: {', '.join(timed_out_names)}")
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # 등록 순서대로 결과 합치기 (같은 키의 서브 피드 순서 유지)
+    for (key, _, _), future in zip(tasks, running):
+        if future in done and not future.cancelled() and future.exception() is None:
+            results[key].extend(future.result())
+
+    elapsed = time.monotonic() - started
+    logger.info(f"⏱️ 수집 작업 {len(tasks)}개 완료 ({len(done)}개 성공/종료, {len(pending)}개 취소), 소요 시간: {elapsed:.2f}초")
+
+    return results
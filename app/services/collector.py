@@ -2,6 +2,7 @@ import httpx
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
+from app.services.conditional_fetch import conditional_get, record_validators
 
 logger = logging.getLogger("hourly_pulse")
 
@@ -24,39 +25,45 @@ async def fetch_reddit_subreddit(subreddit: str, limit: int = 10) -> List[Dict[s
     
     logger.info(f"🔴 Reddit r/{subreddit} 수집 시작...")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers, follow_redirects=True) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            posts = []
-            
-            if "data" in data and "children" in data["data"]:
-                for post_data in data["data"]["children"]:
-                    post = post_data.get("data", {})
-                    if post.get("title"):
-                        post_item = {
-                            "source": f"Reddit r/{subreddit}",
-                            "title": post.get("title", "")[:200],  # 최대 200자
-                            "url": f"https://reddit.com{post.get('permalink', '')}",
-                            "upvotes": post.get("ups", 0),
-                            "comments": post.get("num_comments", 0),
-                            "subreddit": subreddit,
-                            "collected_at": datetime.now().isoformat()
-                        }
-                        posts.append(post_item)
-            
-            if posts:
-                logger.info(f"✅ r/{subreddit} 수집 성공! {len(posts)}개 게시물 발견")
-            return posts
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"❌ r/{subreddit} HTTP 오류 ({e.response.status_code}): {e}")
-            return []
-        except Exception as e:
-            logger.error(f"❌ r/{subreddit} 수집 실패: {type(e).__name__} - {e}")
+    try:
+        response = await conditional_get(url, headers=headers, follow_redirects=True)
+        if response is None:
+            logger.info(f"♻️ r/{subreddit} 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
             return []
+        
+        response.raise_for_status()
+        
+        data = response.json()
+        posts = []
+        
+        if "data" in data and "children" in data["data"]:
+            for post_data in data["data"]["children"]:
+                post = post_data.get("data", {})
+                if post.get("title"):
+                    post_item = {
+                        "source": f"Reddit r/{subreddit}",
+                        "title": post.get("title", "")[:200],  # 최대 200자
+                        "url": f"https://reddit.com{post.get('permalink', '')}",
+                        "upvotes": post.get("ups", 0),
+                        "comments": post.get("num_comments", 0),
+                        "subreddit": subreddit,
+                        "collected_at": datetime.now().isoformat()
+                    }
+                    posts.append(post_item)
+        
+        # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+        record_validators(url, response, source=f"Reddit r/{subreddit}")
+        
+        if posts:
+            logger.info(f"✅ r/{subreddit} 수집 성공! {len(posts)}개 게시물 발견")
+        return posts
+        
+    except httpx.HTTPStatusError as e:
+        logger.error(f"❌ r/{subreddit} HTTP 오류 ({e.response.status_code}): {e}")
+        return []
+    except Exception as e:
+        logger.error(f"❌ r/{subreddit} 수집 실패: {type(e).__name__} - {e}")
+        return []
 
 
 async def fetch_google_trends() -> List[Dict[str, Any]]:
@@ -79,46 +86,52 @@ async def fetch_google_trends() -> List[Dict[str, Any]]:
     
     logger.info("🌍 Reddit 인기 게시물 데이터 수집 시작...")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers, follow_redirects=True) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Reddit JSON 구조: data -> children -> data -> title, upvotes, comments 등
-            posts = []
-            if "data" in data and "children" in data["data"]:
-                for post_data in data["data"]["children"]:
-                    post = post_data.get("data", {})
-                    if post.get("title"):
-                        title = post.get("title", "")
-                        # 너무 긴 제목은 잘라내기
-                        if len(title) > 200:
-                            title = title[:197] + "..."
-                        
-                        post_item = {
-                            "source": "Reddit Popular",
-                            "title": title,
-                            "url": f"https://reddit.com{post.get('permalink', '')}",
-                            "upvotes": post.get("ups", 0),
-                            "comments": post.get("num_comments", 0),  # 댓글 수 추가
-                            "subreddit": post.get("subreddit", "popular"),
-                            "collected_at": datetime.now().isoformat()
-                        }
-                        posts.append(post_item)
-            
-            if posts:
-                logger.info(f"✅ 수집 성공! 총 {len(posts)}개의 인기 게시물을 찾았습니다.")
-                return posts[:50]  # 상위 50개 반환
-            else:
-                logger.warning("⚠️ 데이터를 찾을 수 없습니다.")
-                return []
-                
-        except httpx.HTTPStatusError as e:
-            logger.error(f"❌ HTTP 오류 ({e.response.status_code}): {e}")
+    try:
+        response = await conditional_get(url, headers=headers, follow_redirects=True)
+        if response is None:
+            logger.info("♻️ Reddit 인기 게시물 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
             return []
-        except Exception as e:
-            logger.error(f"❌ 수집 중 에러 발생: {type(e).__name__} - {e}")
+        
+        response.raise_for_status()
+        
+        data = response.json()
+        
+        # Reddit JSON 구조: data -> children -> data -> title, upvotes, comments 등
+        posts = []
+        if "data" in data and "children" in data["data"]:
+            for post_data in data["data"]["children"]:
+                post = post_data.get("data", {})
+                if post.get("title"):
+                    title = post.get("title", "")
+                    # 너무 긴 제목은 잘라내기
+                    if len(title) > 200:
+                        title = title[:197] + "..."
+                    
+                    post_item = {
+                        "source": "Reddit Popular",
+                        "title": title,
+                        "url": f"https://reddit.com{post.get('permalink', '')}",
+                        "upvotes": post.get("ups", 0),
+                        "comments": post.get("num_comments", 0),  # 댓글 수 추가
+                        "subreddit": post.get("subreddit", "popular"),
+                        "collected_at": datetime.now().isoformat()
+                    }
+                    posts.append(post_item)
+        
+        # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+        record_validators(url, response, source="Reddit Popular")
+        
+        if posts:
+            logger.info(f"✅ 수집 성공! 총 {len(posts)}개의 인기 게시물을 찾았습니다.")
+            return posts[:50]  # 상위 50개 반환
+        else:
+            logger.warning("⚠️ 데이터를 찾을 수 없습니다.")
             return []
+            
+    except httpx.HTTPStatusError as e:
+        logger.error(f"❌ HTTP 오류 ({e.response.status_code}): {e}")
+        return []
+    except Exception as e:
+        logger.error(f"❌ 수집 중 에러 발생: {type(e).__name__} - {e}")
+        return []
 
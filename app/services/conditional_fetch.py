@@ -0,0 +1,315 @@
+"""
+조건부 GET (ETag / Last-Modified) 검증자 캐시
+URL별 검증자를 데이터베이스에 저장해 두고 If-None-Match / If-Modified-Since 헤더를 보냅니다.
+304 응답이면 본문 파싱과 저장을 모두 건너뛸 수 있습니다.
+
+새 검증자는 바로 쓰지 않고 단계적으로 반영합니다. (파싱이나 저장에 실패한 응답이 다음 주기에 304로 버려지지 않도록)
+1. 수집기가 본문 파싱에 성공하면 record_validators로 수집 주기의 배치에 보관
+2. 수집 데이터가 데이터베이스에 커밋된 뒤 flush_validators(배치)로 캐시와 데이터베이스에 반영
+
+304 응답은 아이템의 collected_at을 갱신하지 않으므로, 피드마다 마지막 200 응답 시각(fetched_at)과
+마지막으로 200/304 응답을 받은 시각(last_seen_at)을 함께 저장합니다.
+collected_window는 윈도우 안에 304를 받은 피드의 현재 본문 아이템(fetched_at 이후 저장)을 윈도우 안의 아이템으로 취급합니다.
+"""
+import asyncio
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, AsyncIterator
+import httpx
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.core.database import AsyncSessionLocal
+from app.core.models import FeedValidator
+from app.core.http_client import get_http_client
+
+logger = logging.getLogger("hourly_pulse")
+
+# 200 응답의 fetched_at을 파싱 시작 전으로 잡기 위한 여유 (초, 기본값: 60초)
+# 아이템의 collected_at은 파싱 중에 정해지고 검증자는 파싱이 끝난 뒤 기록되므로, 이만큼 앞당겨 현재 본문 아이템이 모두 포함되게 함
+# (수집 주기 간격 5분보다 작아야 이전 본문의 아이템이 섞이지 않음)
+FEED_FETCH_MARGIN_SECONDS = 60
+
+# URL 해시 -> {"etag": ..., "last_modified": ..., "source": ..., "fetched_at": ...}
+_validators: Dict[str, Dict[str, Any]] = {}
+# 데이터베이스에 아직 반영되지 않은 URL 해시
+_dirty: set = set()
+_loaded = False
+_load_lock = asyncio.Lock()
+
+# 현재 수집 주기의 보류 중인 검증자 ({"validators": URL 해시 -> 검증자, "not_modified": 304를 받은 URL 해시 집합},
+# 주기마다 begin_validator_batch로 새로 만듦)
+# 수집 작업은 주기 안에서 생성된 태스크로 실행되므로 컨텍스트를 통해 같은 배치를 공유하고,
+# 겹쳐 실행되는 주기끼리는 서로의 배치를 반영하지 않음
+_batch: ContextVar[Optional[Dict[str, Any]]] = ContextVar("validator_batch", default=None)
+
+_stats: Dict[str, int] = {
+    "conditional_requests": 0,
+    "not_modified": 0,
+}
+
+
+def _url_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    요청 URL(쿼리 파라미터 포함)의 캐시 키를 만듭니다.
+    """
+    full_url = str(httpx.URL(url, params=params)) if params else url
+    return hashlib.sha256(full_url.encode("utf-8")).hexdigest()
+
+
+async def load_validators() -> None:
+    """
+    저장된 검증자를 데이터베이스에서 한 번만 읽어옵니다.
+    데이터베이스를 사용할 수 없으면 메모리 캐시로만 동작합니다.
+    """
+    global _loaded
+    if _loaded:
+        return
+
+    async with _load_lock:
+        if _loaded:
+            return
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(select(FeedValidator))
+                for row in result.scalars().all():
+                    _validators[row.url_hash] = {
+                        "etag": row.etag,
+                        "last_modified": row.last_modified
+                    }
+            logger.info(f"🗂️ 조건부 GET 검증자 {len(_validators)}개 로드")
+        except Exception as e:
+            logger.warning(f"⚠️ 조건부 GET 검증자 로드 실패, 메모리 캐시만 사용: {type(e).__name__} - {e}")
+        _loaded = True
+
+
+def conditional_headers(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    저장된 검증자로 조건부 요청 헤더를 만듭니다.
+    """
+    validator = _validators.get(_url_key(url, params))
+    headers = {}
+    if validator:
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
+
+
+def begin_validator_batch() -> Dict[str, Any]:
+    """
+    수집 주기를 시작하며 보류 검증자 배치를 만듭니다. (수집 결과 커밋 후 flush_validators에 전달)
+    """
+    batch: Dict[str, Any] = {"validators": {}, "not_modified": set()}
+    _batch.set(batch)
+    return batch
+
+
+def _apply_validator(key: str, value: Dict[str, Any]) -> None:
+    if _validators.get(key) != value:
+        _validators[key] = value
+        _dirty.add(key)
+
+
+def record_validators(
+    url: str,
+    response: httpx.Response,
+    params: Optional[Dict[str, Any]] = None,
+    source: Optional[str] = None
+) -> None:
+    """
+    200 응답의 ETag / Last-Modified를 기록합니다. (수집기가 본문 파싱에 성공한 뒤 호출)
+    수집 주기 배치가 있으면 배치에 보류하고, 없으면(단독 실행 스크립트 등) 메모리 캐시에 바로 반영합니다.
+
+    Args:
+        url: 요청 URL
+        response: 200 응답
+        params: 쿼리 파라미터
+        source: 이 응답에서 만든 아이템의 source 값 (304 응답이 이어지는 동안 현재 본문 아이템을 찾는 데 사용)
+    """
+    if response.status_code != 200:
+        return
+
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if not etag and not last_modified:
+        return
+
+    key = _url_key(url, params)
+    new_value = {
+        "etag": etag,
+        "last_modified": last_modified,
+        "source": source,
+        "fetched_at": datetime.now(timezone.utc) - timedelta(seconds=FEED_FETCH_MARGIN_SECONDS),
+    }
+    batch = _batch.get()
+    if batch is not None:
+        batch["validators"][key] = new_value
+    else:
+        _apply_validator(key, new_value)
+
+
+def _record_not_modified(url: str, params: Optional[Dict[str, Any]] = None) -> None:
+    """
+    304 응답을 받은 URL을 수집 주기 배치에 기록합니다. (flush_validators에서 last_seen_at 갱신)
+    """
+    batch = _batch.get()
+    if batch is not None:
+        batch["not_modified"].add(_url_key(url, params))
+
+
+def is_not_modified(response: httpx.Response) -> bool:
+    """
+    304 Not Modified 응답인지 확인하고 통계를 기록합니다.
+    """
+    if response.status_code == 304:
+        _stats["not_modified"] += 1
+        return True
+    return False
+
+
+async def conditional_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    **kwargs
+) -> Optional[httpx.Response]:
+    """
+    저장된 검증자를 사용하여 조건부 GET 요청을 보냅니다.
+    응답의 새 검증자는 호출자가 본문 파싱에 성공한 뒤 record_validators로 기록합니다.
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        headers: 추가 요청 헤더
+        **kwargs: httpx 요청 옵션 (follow_redirects 등)
+
+    Returns:
+        응답 객체, 304(변경 없음)이면 None
+    """
+    await load_validators()
+
+    request_headers = dict(headers or {})
+    validator_headers = conditional_headers(url, params)
+    request_headers.update(validator_headers)
+    if validator_headers:
+        _stats["conditional_requests"] += 1
+
+    client = get_http_client()
+    response = await client.get(url, params=params, headers=request_headers, **kwargs)
+
+    if is_not_modified(response):
+        _record_not_modified(url, params)
+        return None
+
+    return response
+
+
+@asynccontextmanager
+async def conditional_stream(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    **kwargs
+) -> AsyncIterator[Optional[httpx.Response]]:
+    """
+    conditional_get의 스트리밍 버전입니다. 본문을 읽지 않은 응답을 넘겨주므로
+    호출자가 바이트 스트림을 직접 소비하다가 필요하면 중간에 멈출 수 있습니다.
+    본문을 끝까지 처리하지 못했을 때 다음 주기에 304를 받지 않도록,
+    검증자는 호출자가 처리에 성공한 뒤 record_validators로 저장합니다.
+
+    Yields:
+        스트리밍 응답 객체, 304(변경 없음)이면 None
+    """
+    await load_validators()
+
+    request_headers = dict(headers or {})
+    validator_headers = conditional_headers(url, params)
+    request_headers.update(validator_headers)
+    if validator_headers:
+        _stats["conditional_requests"] += 1
+
+    client = get_http_client()
+    async with client.stream("GET", url, params=params, headers=request_headers, **kwargs) as response:
+        if is_not_modified(response):
+            _record_not_modified(url, params)
+            yield None
+            return
+
+        yield response
+
+
+async def flush_validators(batch: Optional[Dict[str, Any]] = None) -> int:
+    """
+    보류 중인 검증자를 캐시에 반영하고, 변경된 검증자를 데이터베이스에 일괄 저장합니다.
+    이번 주기에 200 또는 304 응답을 받은 피드의 last_seen_at도 함께 갱신합니다.
+    (수집 데이터가 데이터베이스에 커밋된 뒤 호출, 저장에 실패한 주기의 배치는 버림)
+
+    Args:
+        batch: begin_validator_batch로 만든 수집 주기 배치
+
+    Returns:
+        저장된 검증자 수
+    """
+    batch = batch or {"validators": {}, "not_modified": set()}
+    for key, value in batch["validators"].items():
+        _apply_validator(key, value)
+
+    not_modified = list(batch["not_modified"])
+    if not _dirty and not not_modified:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    keys = list(_dirty)
+    rows = [
+        {
+            "url_hash": key,
+            "etag": _validators[key].get("etag"),
+            "last_modified": _validators[key].get("last_modified"),
+            "source": _validators[key].get("source"),
+            "fetched_at": _validators[key].get("fetched_at"),
+            "last_seen_at": now,
+            "updated_at": now
+        }
+        for key in keys if key in _validators
+    ]
+
+    try:
+        async with AsyncSessionLocal() as session:
+            if rows:
+                stmt = pg_insert(FeedValidator).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[FeedValidator.url_hash],
+                    set_={
+                        "etag": stmt.excluded.etag,
+                        "last_modified": stmt.excluded.last_modified,
+                        "source": stmt.excluded.source,
+                        "fetched_at": stmt.excluded.fetched_at,
+                        "last_seen_at": stmt.excluded.last_seen_at,
+                        "updated_at": stmt.excluded.updated_at
+                    }
+                )
+                await session.execute(stmt)
+            if not_modified:
+                # 304 응답은 본문이 그대로이므로 fetched_at은 두고 last_seen_at만 갱신
+                await session.execute(
+                    update(FeedValidator)
+                    .where(FeedValidator.url_hash.in_(not_modified))
+                    .values(last_seen_at=now)
+                )
+            await session.commit()
+        _dirty.difference_update(keys)
+        return len(rows)
+    except Exception as e:
+        logger.warning(f"⚠️ 조건부 GET 검증자 저장 실패: {type(e).__name__} - {e}")
+        return 0
+
+
+def get_conditional_fetch_stats() -> Dict[str, int]:
+    """
+    조건부 GET 통계를 반환합니다.
+    """
+    return {**_stats, "cached_validators": len(_validators)}
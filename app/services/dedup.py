@@ -0,0 +1,105 @@
+"""
+수집 아이템 중복 제거 유틸리티
+정규화된 URL(없으면 내용 해시)로 아이템을 식별하여 주기마다 같은 게시물이
+새 행으로 쌓이지 않도록 하고, 참여도 지표는 압축된 이력으로 보관합니다.
+"""
+import os
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 아이템당 보관할 참여도 이력 최대 개수 (기본값: 24개 = 5분 주기 기준 2시간)
+MAX_ENGAGEMENT_HISTORY = int(os.getenv("MAX_ENGAGEMENT_HISTORY", "24"))
+
+# 이력에 기록할 참여도 지표
+ENGAGEMENT_FIELDS = ("upvotes", "comments", "likes", "views", "stars", "forks", "watchers", "retweets")
+
+# URL 비교 시 무시할 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src", "cmpid", "smid", "ocid", "mc_cid", "mc_eid"}
+
+
+def normalize_url(url: Optional[str]) -> str:
+    """
+    URL을 비교 가능한 형태로 정규화합니다.
+    (스킴/호스트 소문자, www. 제거, 프래그먼트와 추적 파라미터 제거, 끝 슬래시 제거)
+
+    Args:
+        url: 원본 URL
+
+    Returns:
+        정규화된 URL (빈 URL이면 빈 문자열)
+    """
+    if not url or not url.strip():
+        return ""
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip("/") or "/"
+
+    # http/https는 같은 리소스로 취급
+    return urlunsplit(("https", host, path, query, ""))
+
+
+def compute_dedup_key(item: Dict[str, Any], source_type: str) -> str:
+    """
+    아이템의 중복 제거 키를 계산합니다.
+    URL이 있으면 소스 타입 + 정규화된 URL, 없으면 소스 타입 + 제목 + 내용의 해시를 사용합니다.
+    (같은 기사 URL이라도 뉴스 피드와 Reddit 게시물은 참여도 지표가 다르므로 소스 타입별로 구분)
+
+    Args:
+        item: 수집된 아이템 딕셔너리
+        source_type: 소스 타입
+
+    Returns:
+        SHA-1 해시 문자열 (40자)
+    """
+    normalized = normalize_url(item.get("url"))
+    if normalized:
+        basis = f"url:{source_type}:{normalized}"
+    else:
+        title = " ".join((item.get("title") or "").lower().split())
+        content = " ".join((item.get("description") or item.get("content") or "").lower().split())
+        basis = f"content:{source_type}:{title}:{content}"
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+def build_engagement_sample(item: Dict[str, Any], collected_at: datetime) -> Dict[str, Any]:
+    """
+    아이템의 현재 참여도 지표를 이력용 샘플로 만듭니다. (값이 있는 지표만 기록)
+
+    Returns:
+        {"t": ISO 시각, "upvotes": ..., ...} 형태의 샘플
+    """
+    # 시간대 정보가 없으면 서버 로컬 시간으로 보고 UTC로 변환하여 기록
+    sample = {"t": collected_at.astimezone(timezone.utc).isoformat()}
+    for field in ENGAGEMENT_FIELDS:
+        value = item.get(field)
+        if value is not None:
+            sample[field] = value
+    return sample
+
+
+def merge_engagement_history(
+    history: Optional[List[Dict[str, Any]]],
+    samples: List[Dict[str, Any]],
+    max_length: int = MAX_ENGAGEMENT_HISTORY
+) -> List[Dict[str, Any]]:
+    """
+    기존 이력에 새 샘플을 추가하고 최근 max_length개만 남깁니다.
+    """
+    merged = list(history or []) + list(samples)
+    return merged[-max_length:]
@@ -1,10 +1,10 @@
 """
 GitHub Trending 저장소를 수집하는 모듈
 """
-import httpx
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict
+from app.services.conditional_fetch import conditional_get, record_validators
 
 logger = logging.getLogger("hourly_pulse")
 
@@ -34,33 +34,39 @@ async def fetch_github_trending(language: str = None, days: int = 7) -> List[Dic
     
     logger.info(f"💻 GitHub Trending 수집 시작... (언어: {language or '전체'})")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            trending_repos = []
-            
-            for repo in data.get("items", [])[:100]:  # 10 -> 100으로 증가
-                repo_item = {
-                    "source": "GitHub",
-                    "title": repo.get("full_name", ""),
-                    "description": repo.get("description", ""),
-                    "url": repo.get("html_url", ""),
-                    "language": repo.get("language", ""),
-                    "stars": repo.get("stargazers_count", 0),
-                    "forks": repo.get("forks_count", 0),  # 포크 수 추가
-                    "watchers": repo.get("watchers_count", 0),  # 워처 수 추가
-                    "collected_at": datetime.now().isoformat()
-                }
-                trending_repos.append(repo_item)
-            
-            logger.info(f"✅ GitHub Trending 수집 성공! {len(trending_repos)}개 저장소 발견")
-            return trending_repos
-            
-        except Exception as e:
-            logger.error(f"❌ GitHub Trending 수집 실패: {type(e).__name__} - {e}")
+    try:
+        response = await conditional_get(url, headers=headers)
+        if response is None:
+            logger.info("♻️ GitHub Trending 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
             return []
+        
+        response.raise_for_status()
+        
+        data = response.json()
+        trending_repos = []
+        
+        for repo in data.get("items", [])[:100]:  # 10 -> 100으로 증가
+            repo_item = {
+                "source": "GitHub",
+                "title": repo.get("full_name", ""),
+                "description": repo.get("description", ""),
+                "url": repo.get("html_url", ""),
+                "language": repo.get("language", ""),
+                "stars": repo.get("stargazers_count", 0),
+                "forks": repo.get("forks_count", 0),  # 포크 수 추가
+                "watchers": repo.get("watchers_count", 0),  # 워처 수 추가
+                "collected_at": datetime.now().isoformat()
+            }
+            trending_repos.append(repo_item)
+        
+        # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+        record_validators(url, response, source="GitHub")
+        
+        logger.info(f"✅ GitHub Trending 수집 성공! {len(trending_repos)}개 저장소 발견")
+        return trending_repos
+        
+    except Exception as e:
+        logger.error(f"❌ GitHub Trending 수집 실패: {type(e).__name__} - {e}")
+        return []
 
 
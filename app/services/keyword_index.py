@@ -0,0 +1,116 @@
+"""
+분석 실행 단위 키워드 역색인
+이슈-아이템 매칭을 위해 분석 배치마다 한 번만 만들어 두는 역색인입니다.
+- 용어 -> {아이템 ID: 필드 플래그(제목/내용)} 포스팅 리스트
+- 접두 일치 지원 (정렬된 용어 목록 + bisect, 한국어 조사/영어 복수형이 붙은 단어도 매칭)
+- 접두 일치가 하나도 없으면 기존 방식대로 소문자 제목/내용 부분 문자열 검사로 대체 (예: "ai" -> "OpenAI", "AI규제")
+- 아이템별 소문자 제목/내용은 한 번만 계산해 구문 확인에 재사용
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, List, Set, Tuple, Any
+
+# 필드 플래그
+FIELD_TITLE = 2
+FIELD_CONTENT = 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    텍스트를 소문자 단어 토큰으로 나눕니다.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordIndex:
+    """
+    아이템 배치의 제목/내용 역색인
+    """
+
+    def __init__(self, items: List[Any]):
+        self.items = items
+        self.position: Dict[int, int] = {}
+        self.lowered: Dict[int, Tuple[str, str]] = {}
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+        for position, item in enumerate(items):
+            title_lower = (item.title or "").lower()
+            content_lower = (item.content or "").lower()
+            self.position[item.id] = position
+            self.lowered[item.id] = (title_lower, content_lower)
+
+            for field, text in ((FIELD_TITLE, title_lower), (FIELD_CONTENT, content_lower)):
+                for term in _TOKEN_PATTERN.findall(text):
+                    posting = self.postings.setdefault(term, {})
+                    posting[item.id] = posting.get(item.id, 0) | field
+
+        self.terms = sorted(self.postings)
+
+    def _substring_matches(self, keyword: str) -> Dict[int, int]:
+        """
+        소문자 제목/내용에 keyword가 부분 문자열로 들어 있는 아이템을 찾습니다. (접두 일치 실패 시 대체 경로)
+        """
+        matches: Dict[int, int] = {}
+        for item_id, (title_lower, content_lower) in self.lowered.items():
+            fields = (FIELD_TITLE if keyword in title_lower else 0) | (FIELD_CONTENT if keyword in content_lower else 0)
+            if fields:
+                matches[item_id] = fields
+        return matches
+
+    def lookup(self, keyword: str) -> Dict[int, int]:
+        """
+        keyword로 시작하는 모든 용어의 포스팅을 합칩니다.
+        일치하는 용어가 없으면 부분 문자열 검사로 대체합니다. (단어 중간에 나온 키워드도 매칭)
+
+        Returns:
+            아이템 ID -> 필드 플래그 (제목/내용 중 어디에 나왔는지)
+        """
+        merged: Dict[int, int] = {}
+        start = bisect_left(self.terms, keyword)
+        for term in self.terms[start:]:
+            if not term.startswith(keyword):
+                break
+            for item_id, fields in self.postings[term].items():
+                merged[item_id] = merged.get(item_id, 0) | fields
+        if not merged and keyword:
+            return self._substring_matches(keyword)
+        return merged
+
+    def score_keywords(self, keywords: List[str]) -> Dict[int, int]:
+        """
+        키워드마다 제목에 나오면 2점, 내용에만 나오면 1점을 더한 아이템별 매칭 점수를 계산합니다.
+        """
+        scores: Dict[int, int] = {}
+        for keyword in keywords:
+            for item_id, fields in self.lookup(keyword).items():
+                scores[item_id] = scores.get(item_id, 0) + (2 if fields & FIELD_TITLE else 1)
+        return scores
+
+    def phrase_matches(self, phrase: str) -> Set[int]:
+        """
+        구문 전체가 제목이나 내용에 들어 있는 아이템 ID를 찾습니다.
+        (토큰 포스팅 교집합으로 후보를 줄인 뒤에만 문자열 확인)
+        구문의 첫 토큰은 본문에서 단어 중간에 나올 수 있으므로(예: "AI 규제" -> "OpenAI 규제") 두 번째 토큰부터만 후보를 줄입니다.
+        한 단어짜리 구문은 lookup과 같은 기준(접두 일치, 없으면 부분 문자열)으로 찾습니다.
+        """
+        phrase_lower = phrase.lower().strip()
+        tokens = tokenize(phrase_lower)
+        if not phrase_lower:
+            return set()
+
+        if tokens:
+            candidates = None
+            for token in (tokens[1:] or tokens):
+                ids = set(self.lookup(token))
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    return set()
+        else:
+            candidates = set(self.lowered)
+
+        return {
+            item_id for item_id in candidates
+            if phrase_lower in self.lowered[item_id][0] or phrase_lower in self.lowered[item_id][1]
+        }
@@ -0,0 +1,83 @@
+"""
+언어 감지 유틸리티
+한글 음절 범위를 컴파일된 정규식 하나로 검사하여 텍스트가 한국어/영어(ASCII)/기타인지 분류합니다.
+여러 텍스트를 한 번에 분류할 때는 앞부분들을 이어 붙여 정규식을 한 번만 실행합니다.
+"""
+import re
+from bisect import bisect_right
+from typing import List, Optional
+
+# 언어를 판단할 앞부분 길이 (기본값: 100자)
+DETECTION_WINDOW = 100
+
+# 한글 음절 (가-힣)
+_HANGUL_PATTERN = re.compile("[\uac00-\ud7a3]")
+
+# 분류 결과
+KOREAN = "ko"
+ENGLISH = "en"  # ASCII만 있는 텍스트
+OTHER = "other"  # 한글은 없지만 ASCII 외 문자가 있는 텍스트
+
+
+def detect_language(text: Optional[str], window: int = DETECTION_WINDOW) -> Optional[str]:
+    """
+    텍스트 앞부분으로 언어를 분류합니다.
+
+    Returns:
+        "ko", "en", "other" 중 하나 (빈 텍스트면 None)
+    """
+    if not text:
+        return None
+    if _HANGUL_PATTERN.search(text, 0, window):
+        return KOREAN
+    return ENGLISH if text[:window].isascii() else OTHER
+
+
+def detect_languages(texts: List[Optional[str]], window: int = DETECTION_WINDOW) -> List[Optional[str]]:
+    """
+    여러 텍스트를 한 번에 분류합니다.
+    각 텍스트의 앞부분을 줄바꿈으로 이어 붙여 정규식을 한 번 실행하고, 일치 위치로 한글이 있는 텍스트를 찾습니다.
+
+    Returns:
+        입력 순서와 같은 분류 결과 리스트
+    """
+    windows = [text[:window] if text else "" for text in texts]
+    starts = []
+    offset = 0
+    for part in windows:
+        starts.append(offset)
+        offset += len(part) + 1
+
+    korean = set()
+    for match in _HANGUL_PATTERN.finditer("\n".join(windows)):
+        korean.add(bisect_right(starts, match.start()) - 1)
+
+    results: List[Optional[str]] = []
+    for i, part in enumerate(windows):
+        if not part:
+            results.append(None)
+        elif i in korean:
+            results.append(KOREAN)
+        else:
+            results.append(ENGLISH if part.isascii() else OTHER)
+    return results
+
+
+def needs_translation(language: Optional[str], target_language: Optional[str]) -> bool:
+    """
+    감지된 언어로 번역이 필요한지 판단합니다. (ko: 한글이 없으면, en: 한글이 있으면)
+    """
+    if language is None:
+        return False
+    if target_language == KOREAN:
+        return language != KOREAN
+    if target_language == ENGLISH:
+        return language == KOREAN
+    return False
+
+
+def is_target_language(language: Optional[str], target_language: Optional[str]) -> bool:
+    """
+    감지된 언어가 이미 목표 언어인지 판단합니다. (en은 ASCII만 있는 경우)
+    """
+    return language is not None and language == target_language
@@ -0,0 +1,163 @@
+"""
+랭킹/급상승/통계 실시간 푸시 (Server-Sent Events)
+스케줄러 파이프라인이 끝날 때 한 번만 페이로드를 만들고 언어별로 한 번 직렬화한 뒤,
+같은 바이트 메시지를 모든 구독자 큐에 넣어 팬아웃합니다. (클라이언트별 폴링 대체)
+"""
+import os
+import json
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Any, Set
+
+logger = logging.getLogger("hourly_pulse")
+
+# 푸시할 언어
+LIVE_LANGUAGES = ("ko", "en")
+
+# 구독자별 대기 메시지 수 (느린 구독자는 오래된 메시지부터 버림, 기본값: 4개)
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "4"))
+
+# 연결 유지용 하트비트 주기 (초, 기본값: 15초 - 프록시 유휴 타임아웃 방지)
+LIVE_HEARTBEAT_SECONDS = float(os.getenv("LIVE_HEARTBEAT_SECONDS", "15"))
+
+# 푸시 페이로드에 담을 개수 (/rankings, /surge-trends 기본값과 동일)
+LIVE_RANKING_LIMIT = 10
+LIVE_SURGE_LIMIT = 5
+
+HEARTBEAT_MESSAGE = b": keep-alive\n\n"
+
+# 언어 -> 구독자 큐 집합
+_subscribers: Dict[str, Set[asyncio.Queue]] = {lang: set() for lang in LIVE_LANGUAGES}
+
+# 언어 -> 마지막으로 보낸 메시지 (새 구독자에게 바로 전송)
+_latest_messages: Dict[str, bytes] = {}
+
+_live_stats: Dict[str, Any] = {
+    "event_id": 0,
+    "published": 0,
+    "delivered": 0,
+    "dropped": 0,
+    "last_published_at": None,
+}
+
+
+def _format_event(event_id: int, payload: Dict[str, Any]) -> bytes:
+    """
+    SSE 메시지 한 개를 만듭니다. (data는 한 줄 JSON)
+    """
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event_id}\nevent: update\ndata: {data}\n\n".encode("utf-8")
+
+
+def subscribe(lang: str) -> asyncio.Queue:
+    """
+    구독자 큐를 등록합니다. 마지막 메시지가 있으면 바로 넣어 둡니다.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+    latest = _latest_messages.get(lang)
+    if latest is not None:
+        queue.put_nowait(latest)
+    _subscribers[lang].add(queue)
+    return queue
+
+
+def unsubscribe(lang: str, queue: asyncio.Queue) -> None:
+    """
+    구독자 큐를 제거합니다.
+    """
+    _subscribers[lang].discard(queue)
+
+
+def _deliver(queue: asyncio.Queue, message: bytes) -> None:
+    """
+    큐에 메시지를 넣습니다. 가득 차 있으면 가장 오래된 메시지를 버립니다.
+    """
+    if queue.full():
+        try:
+            queue.get_nowait()
+            _live_stats["dropped"] += 1
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(message)
+    _live_stats["delivered"] += 1
+
+
+def broadcast(lang: str, payload: Dict[str, Any]) -> int:
+    """
+    페이로드를 한 번 직렬화하여 해당 언어의 모든 구독자에게 보냅니다.
+
+    Returns:
+        메시지를 받은 구독자 수
+    """
+    _live_stats["event_id"] += 1
+    message = _format_event(_live_stats["event_id"], payload)
+    _latest_messages[lang] = message
+
+    subscribers = list(_subscribers[lang])
+    for queue in subscribers:
+        _deliver(queue, message)
+    return len(subscribers)
+
+
+async def publish_pipeline_update() -> Dict[str, int]:
+    """
+    파이프라인 완료 후 언어별 랭킹/급상승/통계 페이로드를 만들어 방송합니다.
+    (통계는 언어와 무관하므로 한 번만 조회)
+
+    Returns:
+        언어별 메시지를 받은 구독자 수
+    """
+    from app.services.ranking_snapshot import get_ranking_snapshot, render_surge_trends
+    from app.services.storage import get_collection_stats
+
+    stats = await get_collection_stats()
+    published_at = datetime.now().isoformat()
+
+    delivered = {}
+    for lang in LIVE_LANGUAGES:
+        # 랭킹은 save_issue_rankings가 만든 스냅샷을 재사용 (다시 렌더링/번역하지 않음)
+        snapshot = await get_ranking_snapshot(lang, LIVE_RANKING_LIMIT)
+        payload = {
+            "published_at": published_at,
+            "lang": lang,
+            "rankings": json.loads(snapshot["body"]) if snapshot else [],
+            "surge_trends": await render_surge_trends(limit=LIVE_SURGE_LIMIT, lang=lang),
+            "stats": stats,
+        }
+        delivered[lang] = broadcast(lang, payload)
+
+    _live_stats["published"] += 1
+    _live_stats["last_published_at"] = published_at
+    logger.info(f"📡 실시간 업데이트 전송 완료: 구독자 {delivered}")
+    return delivered
+
+
+async def event_stream(lang: str, is_disconnected):
+    """
+    구독자 한 명의 SSE 스트림입니다. 메시지가 없으면 하트비트를 보냅니다.
+
+    Args:
+        lang: 구독 언어
+        is_disconnected: 클라이언트 연결 종료 여부를 반환하는 코루틴 함수
+    """
+    queue = subscribe(lang)
+    try:
+        while not await is_disconnected():
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=LIVE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                message = HEARTBEAT_MESSAGE
+            yield message
+    finally:
+        unsubscribe(lang, queue)
+
+
+def get_live_stats() -> Dict[str, Any]:
+    """
+    구독자 수와 전송 통계를 반환합니다.
+    """
+    return {
+        **_live_stats,
+        "subscribers": {lang: len(queues) for lang, queues in _subscribers.items()},
+    }
@@ -0,0 +1,285 @@
+"""
+쓰기 시점 번역 (로컬라이제이션)
+분석 결과/랭킹/수집 아이템이 저장된 뒤 파이프라인 단계에서 ko/en 번역을 만들어
+각 행의 translations 컬럼에 {"ko": {필드: 값}, "en": {필드: 값}, "detected": {필드: 원문 언어}} 형태로 저장합니다.
+번역에 실패한 필드는 "pending"에 남겨 다음 파이프라인 단계에서 다시 번역합니다. (최대 LOCALIZE_MAX_ATTEMPTS회)
+요청 처리기는 저장된 값을 읽기만 하며, 아직 번역이 없는 값에만 요청 시 번역(localize_rows)을 사용합니다.
+"""
+import os
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import select, or_, and_
+from app.core.database import AsyncSessionLocal
+from app.core.models import CollectedItem, AnalysisResult, IssueRanking
+from app.core.partitions import collected_window
+from app.services.translator import translate_batch
+from app.services.language import detect_languages, needs_translation
+
+logger = logging.getLogger("hourly_pulse")
+
+# 번역을 만들어 둘 언어
+LOCALIZED_LANGUAGES = ("ko", "en")
+
+# 모델별 번역할 필드
+LOCALIZED_FIELDS = {
+    AnalysisResult: ("topic", "summary", "what", "why_now", "context"),
+    IssueRanking: ("topic", "description", "what", "why_now", "context"),
+    CollectedItem: ("title", "content"),
+}
+
+# translations 안에 저장하는 필드별 원문 언어 감지 결과의 키
+DETECTED_KEY = "detected"
+
+# translations 안에 저장하는 번역 실패 필드({언어: [필드]})와 번역 시도 횟수의 키
+PENDING_KEY = "pending"
+ATTEMPTS_KEY = "attempts"
+
+# 번역에 실패한 필드가 있는 행을 다시 번역할 최대 시도 횟수 (기본값: 3회, 이후에는 요청 시 번역으로 처리)
+LOCALIZE_MAX_ATTEMPTS = int(os.getenv("LOCALIZE_MAX_ATTEMPTS", "3"))
+
+# 한 번에 번역하는 행 수 (기본값: 100개, 파이프라인 단계는 번역할 행이 없을 때까지 배치를 반복)
+LOCALIZE_BATCH_SIZE = int(os.getenv("LOCALIZE_BATCH_SIZE", "100"))
+
+# 수집 아이템은 최근 이 시간 안의 행만 번역 (기본값: 1시간, 오래된 행은 요청 시 번역으로 처리)
+LOCALIZE_ITEM_WINDOW_HOURS = int(os.getenv("LOCALIZE_ITEM_WINDOW_HOURS", "1"))
+
+_stats: Dict[str, Any] = {
+    "rows_localized": 0,
+    "rows_pending": 0,
+    "request_fallbacks": 0,
+    "last_run_at": None,
+}
+
+
+def _detect_fields(entries: List[Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]]]) -> List[Dict[str, Optional[str]]]:
+    """
+    행별 필드 원문의 언어를 반환합니다.
+    translations에 저장된 감지 결과가 있으면 재사용하고, 없는 값만 모아 detect_languages로 한 번에 분류합니다.
+    """
+    detected: List[Dict[str, Optional[str]]] = []
+    missing: List[Tuple[int, str, str]] = []
+    for i, (translations, values) in enumerate(entries):
+        cached = (translations or {}).get(DETECTED_KEY, {})
+        row = {}
+        for field, value in values.items():
+            if field in cached:
+                row[field] = cached[field]
+            else:
+                missing.append((i, field, value or ""))
+        detected.append(row)
+
+    languages = detect_languages([value for _, _, value in missing])
+    for (i, field, _), language in zip(missing, languages):
+        detected[i][field] = language
+    return detected
+
+
+async def build_translations_many(rows_values: List[Dict[str, Optional[str]]]) -> List[Dict[str, Dict[str, str]]]:
+    """
+    여러 행의 필드 값들의 ko/en 버전을 만듭니다.
+    언어마다 번역이 필요한 값을 모두 모아 translate_batch로 한 번에 번역합니다. (이미 목표 언어인 값은 그대로 사용)
+
+    Args:
+        rows_values: 행별 {필드 이름: 원문}
+
+    Returns:
+        행별 {"ko": {필드: 값}, "en": {필드: 값}, "detected": {필드: 원문 언어}}
+        (번역에 실패한 필드는 빠지고 "pending": {언어: [필드]}에 기록됨)
+    """
+    detected_rows = _detect_fields([(None, values) for values in rows_values])
+    # 감지 결과도 행에 저장하여 요청 시 다시 분류하지 않도록 함
+    results: List[Dict[str, Dict[str, str]]] = [{DETECTED_KEY: detected} for detected in detected_rows]
+    for lang in LOCALIZED_LANGUAGES:
+        pending = list(dict.fromkeys(
+            values[field] for values, detected in zip(rows_values, detected_rows) for field in values
+            if needs_translation(detected[field], lang)
+        ))
+        translated = dict(zip(pending, await translate_batch(pending, lang))) if pending else {}
+
+        for values, detected, translations in zip(rows_values, detected_rows, results):
+            localized = {}
+            failed = []
+            for field, value in values.items():
+                value = value or ""
+                if not needs_translation(detected[field], lang):
+                    localized[field] = value
+                # 번역 실패(원문 반환)는 저장하지 않고 다시 번역할 필드로 남김
+                elif translated.get(value) and translated[value] != value:
+                    localized[field] = translated[value]
+                else:
+                    failed.append(field)
+            translations[lang] = localized
+            if failed:
+                translations.setdefault(PENDING_KEY, {})[lang] = failed
+    return results
+
+
+async def localize_rows(
+    entries: List[Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]]],
+    lang: Optional[str]
+) -> List[Dict[str, str]]:
+    """
+    요청 단위로 여러 행의 필드를 한꺼번에 로컬라이즈합니다.
+    저장된 번역이 없는 값(기존 행)만 모아 중복을 제거한 뒤 translate_batch로 동시에 번역하므로,
+    요청 지연이 필드 수의 합이 아니라 가장 느린 호출 하나 수준이 됩니다.
+
+    Args:
+        entries: 행별 (translations 컬럼 값, {필드 이름: 원문})
+        lang: 요청 언어
+
+    Returns:
+        행별 {필드 이름: 로컬라이즈된 값}
+    """
+    if lang not in LOCALIZED_LANGUAGES:
+        return [{field: value or "" for field, value in values.items()} for _, values in entries]
+
+    detected_rows = _detect_fields(entries)
+    resolved: List[Dict[str, str]] = []
+    pending: Dict[str, None] = {}
+    for (translations, values), detected in zip(entries, detected_rows):
+        stored = (translations or {}).get(lang, {})
+        row = {}
+        for field, value in values.items():
+            value = value or ""
+            if stored.get(field) is not None:
+                row[field] = stored[field]
+            else:
+                row[field] = value
+                if needs_translation(detected[field], lang):
+                    pending[value] = None
+        resolved.append(row)
+
+    if not pending:
+        return resolved
+
+    _stats["request_fallbacks"] += len(pending)
+    texts = list(pending)
+    translated = dict(zip(texts, await translate_batch(texts, lang)))
+    for (translations, values), row in zip(entries, resolved):
+        stored = (translations or {}).get(lang, {})
+        for field, value in values.items():
+            if stored.get(field) is None and value in translated:
+                row[field] = translated[value]
+    return resolved
+
+
+async def _localize_rows(
+    session, model, conditions: List[Any], limit: int, before_id: Optional[int] = None
+) -> Tuple[int, int, Optional[int]]:
+    """
+    translations가 비어 있거나 번역에 실패한 필드가 남은(시도 횟수 LOCALIZE_MAX_ATTEMPTS 미만) 행을 최신순(ID 역순)으로 번역하여 저장합니다.
+    다시 번역하는 행도 전체 필드를 다시 만들지만, 이미 번역된 텍스트는 번역 캐시에서 가져오므로 모델은 실패한 값만 호출합니다.
+
+    Args:
+        before_id: 이 ID보다 작은 행만 처리 (한 실행 안에서 같은 행을 다시 시도하지 않도록 이전 배치의 마지막 ID를 전달)
+
+    Returns:
+        (처리한 행 수, 모든 필드가 번역된 행 수, 마지막 행 ID)
+    """
+    fields = LOCALIZED_FIELDS[model]
+    needs_localizing = or_(
+        model.translations.is_(None),
+        and_(
+            model.translations[PENDING_KEY].isnot(None),
+            model.translations[ATTEMPTS_KEY].as_integer() < LOCALIZE_MAX_ATTEMPTS,
+        ),
+    )
+    if before_id is not None:
+        conditions = [*conditions, model.id < before_id]
+    result = await session.execute(
+        select(model).where(needs_localizing, *conditions).order_by(model.id.desc()).limit(limit)
+    )
+    rows = list(result.scalars().all())
+    if not rows:
+        return 0, 0, None
+    
+    translations = await build_translations_many([{field: getattr(row, field) for field in fields} for row in rows])
+    completed = 0
+    for row, row_translations in zip(rows, translations):
+        if PENDING_KEY in row_translations:
+            row_translations[ATTEMPTS_KEY] = (row.translations or {}).get(ATTEMPTS_KEY, 0) + 1
+            _stats["rows_pending"] += 1
+        else:
+            completed += 1
+        row.translations = row_translations
+    last_id = rows[-1].id
+    await session.commit()
+    return len(rows), completed, last_id
+
+
+async def _localize_all(session, name: str, model, conditions: List[Any], batch_size: int) -> int:
+    """
+    번역할 행이 없을 때까지 batch_size행씩 최신순으로 번역합니다.
+    배치 전체가 번역에 실패하면(모델 장애, 쿼터 소진 등) 남은 행은 다음 실행으로 미룹니다.
+
+    Returns:
+        처리한 행 수
+    """
+    total = 0
+    before_id = None
+    while True:
+        count, completed, before_id = await _localize_rows(session, model, conditions, batch_size, before_id)
+        total += count
+        if count < batch_size:
+            break
+        if completed == 0:
+            logger.warning(f"⚠️ {name} 번역 배치 전체 실패, 남은 행은 다음 실행에서 번역")
+            break
+    return total
+
+
+async def localize_pending_rows(batch_size: int = LOCALIZE_BATCH_SIZE) -> Dict[str, int]:
+    """
+    파이프라인 단계: 아직 번역되지 않은 분석 결과/랭킹/최근 수집 아이템을 번역하여 저장합니다.
+    (save_analysis_results, save_issue_rankings 이후 실행, 수집 주기 하나가 만든 행을 모두 처리할 때까지 배치 반복)
+
+    Returns:
+        테이블별 번역한 행 수
+    """
+    item_cutoff = datetime.now(timezone.utc) - timedelta(hours=LOCALIZE_ITEM_WINDOW_HOURS)
+    async with AsyncSessionLocal() as session:
+        localized = {
+            "analysis_results": await _localize_all(session, "analysis_results", AnalysisResult, [], batch_size),
+            "issue_rankings": await _localize_all(session, "issue_rankings", IssueRanking, [], batch_size),
+            "collected_items": await _localize_all(
+                session, "collected_items", CollectedItem, [collected_window(item_cutoff)], batch_size
+            ),
+        }
+
+    _stats["rows_localized"] += sum(localized.values())
+    _stats["last_run_at"] = datetime.now().isoformat()
+    logger.info(f"🌐 쓰기 시점 번역 완료: {localized}")
+    return localized
+
+
+async def backfill_translations(item_hours: int = 24, batch_size: int = LOCALIZE_BATCH_SIZE) -> Dict[str, int]:
+    """
+    기존 행의 translations를 채웁니다. (번역할 행이 없을 때까지 배치 단위로 반복)
+    수집 아이템은 최근 item_hours 시간 안의 행만 처리합니다.
+
+    Returns:
+        테이블별 번역한 행 수
+    """
+    item_cutoff = datetime.now(timezone.utc) - timedelta(hours=item_hours)
+    targets = [
+        ("analysis_results", AnalysisResult, []),
+        ("issue_rankings", IssueRanking, []),
+        ("collected_items", CollectedItem, [collected_window(item_cutoff)]),
+    ]
+
+    totals = {}
+    async with AsyncSessionLocal() as session:
+        for name, model, conditions in targets:
+            totals[name] = await _localize_all(session, name, model, conditions, batch_size)
+            logger.info(f"🌐 {name} 번역 백필: {totals[name]}개")
+
+    _stats["rows_localized"] += sum(totals.values())
+    return totals
+
+
+def get_localization_stats() -> Dict[str, Any]:
+    """
+    쓰기 시점 번역 통계를 반환합니다. (request_fallbacks는 기존 행 때문에 요청 중 번역한 텍스트 수)
+    """
+    return dict(_stats)
@@ -1,17 +1,127 @@
 """
 뉴스 사이트 RSS 피드를 수집하는 모듈
 """
-import httpx
+import os
 import xml.etree.ElementTree as ET
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, AsyncIterator
+from app.services.conditional_fetch import conditional_stream, record_validators
+from app.services.collection_engine import run_collection_tasks
 
 logger = logging.getLogger("hourly_pulse")
 
+# 피드당 최대 수집 기사 수 (10 -> 50으로 증가, 4K RPM 활용)
+RSS_MAX_ITEMS = int(os.getenv("RSS_MAX_ITEMS", "50"))
+
+# Slash 네임스페이스 (일부 사이트가 댓글 수를 slash:comments로 제공)
+SLASH_NAMESPACE = "{http://purl.org/rss/1.0/modules/slash/}"
+
+
+def _parse_comment_count(text: Optional[str]) -> int:
+    """
+    댓글 수 텍스트를 정수로 변환합니다. (숫자가 아니면 0)
+    """
+    if not text:
+        return 0
+    try:
+        return int(text)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _build_news_item(item: ET.Element, source_name: str) -> Optional[Dict[str, str]]:
+    """
+    완성된 <item> 요소 하나를 뉴스 아이템 딕셔너리로 변환합니다.
+    
+    Returns:
+        뉴스 아이템 (제목이 없으면 None)
+    """
+    # 직계 자식 요소를 태그별 첫 번째 요소로 한 번에 정리
+    children = {}
+    for child in item:
+        if isinstance(child.tag, str) and child.tag not in children:
+            children[child.tag] = child
+    
+    title_elem = children.get("title")
+    if title_elem is None or not title_elem.text:
+        return None
+    
+    link_elem = children.get("link")
+    pub_date_elem = children.get("pubDate")
+    description_elem = children.get("description")
+    
+    # 댓글 수 필드 찾기: 표준 필드 -> Slash 네임스페이스 -> "comment"가 포함된 기타 필드
+    comments_count = _parse_comment_count(children["comments"].text if "comments" in children else None)
+    if comments_count == 0 and f"{SLASH_NAMESPACE}comments" in children:
+        comments_count = _parse_comment_count(children[f"{SLASH_NAMESPACE}comments"].text)
+    if comments_count == 0:
+        for tag, child in children.items():
+            if 'comment' in tag.lower() and child.text:
+                comments_count = _parse_comment_count(child.text)
+                if comments_count:
+                    break
+    
+    return {
+        "source": source_name,
+        "title": title_elem.text.strip(),
+        "url": link_elem.text if link_elem is not None else "",
+        "published": pub_date_elem.text if pub_date_elem is not None else "",
+        "description": description_elem.text if description_elem is not None else "",
+        "comments": comments_count,  # 댓글 수 추가 (있으면)
+        "collected_at": datetime.now().isoformat()
+    }
+
+
+async def parse_rss_stream(chunks: AsyncIterator[bytes], source_name: str, max_items: int = RSS_MAX_ITEMS) -> List[Dict[str, str]]:
+    """
+    RSS 바이트 스트림을 점진적으로 파싱합니다.
+    <item>이 끝날 때마다 변환 후 트리에서 제거하므로 메모리 사용량이 피드 크기와 무관하게 일정하며,
+    max_items개를 모으면 나머지 본문은 내려받지 않고 멈춥니다.
+    
+    Args:
+        chunks: 응답 본문 바이트 청크
+        source_name: 뉴스 소스 이름
+        max_items: 최대 수집 기사 수
+    
+    Returns:
+        뉴스 아이템 리스트
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    open_elements = []  # 현재 열려 있는 요소 스택 (부모 찾기용)
+    news_items = []
+    
+    async for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            
+            open_elements.pop()
+            if elem.tag != "item":
+                continue
+            
+            news_item = _build_news_item(elem, source_name)
+            if news_item:
+                news_items.append(news_item)
+            
+            # 처리한 <item>은 부모에서 떼어내 메모리 해제
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
+            
+            if len(news_items) >= max_items:
+                return news_items
+    
+    parser.close()
+    return news_items
+
+
 async def fetch_news_rss(url: str, source_name: str) -> List[Dict[str, str]]:
     """
     RSS 피드에서 뉴스 헤드라인을 수집합니다.
+    본문을 스트리밍으로 파싱하며 RSS_MAX_ITEMS개를 모으면 조기 종료합니다.
     
     Args:
         url: RSS 피드 URL
@@ -26,109 +136,57 @@ async def fetch_news_rss(url: str, source_name: str) -> List[Dict[str, str]]:
     
     logger.info(f"📰 {source_name} 뉴스 수집 시작...")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.text)
-            news_items = []
-            
-            # RSS 구조: channel -> item
-            # RSS 네임스페이스 처리 (일부 사이트는 확장 필드 사용)
-            namespaces = {
-                'slash': 'http://purl.org/rss/1.0/modules/slash/',
-                'wfw': 'http://wellformedweb.org/CommentAPI/',
-                'content': 'http://purl.org/rss/1.0/modules/content/',
-                'dc': 'http://purl.org/dc/elements/1.1/'
-            }
+    try:
+        async with conditional_stream(url, headers=headers) as response:
+            if response is None:
+                logger.info(f"♻️ {source_name} 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
+                return []
             
-            for item in root.findall(".//item"):
-                title_elem = item.find("title")
-                link_elem = item.find("link")
-                pub_date_elem = item.find("pubDate")
-                description_elem = item.find("description")
-                
-                # 댓글 수 필드 찾기 (다양한 네임스페이스 시도)
-                comments_count = 0
-                # 표준 필드
-                comments_elem = item.find("comments")
-                if comments_elem is not None and comments_elem.text:
-                    try:
-                        comments_count = int(comments_elem.text)
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Slash 네임스페이스 (일부 사이트 사용)
-                if comments_count == 0:
-                    slash_comments = item.find("slash:comments", namespaces)
-                    if slash_comments is not None and slash_comments.text:
-                        try:
-                            comments_count = int(slash_comments.text)
-                        except (ValueError, TypeError):
-                            pass
-                
-                # 기타 확장 필드 시도
-                if comments_count == 0:
-                    # 모든 자식 요소에서 "comment"가 포함된 필드 찾기
-                    for child in item:
-                        tag = child.tag.lower() if hasattr(child, 'tag') else ''
-                        text = child.text if hasattr(child, 'text') and child.text else ''
-                        if 'comment' in tag and text:
-                            try:
-                                comments_count = int(text)
-                                break
-                            except (ValueError, TypeError):
-                                pass
-                
-                if title_elem is not None and title_elem.text:
-                    news_item = {
-                        "source": source_name,
-                        "title": title_elem.text.strip(),
-                        "url": link_elem.text if link_elem is not None else "",
-                        "published": pub_date_elem.text if pub_date_elem is not None else "",
-                        "description": description_elem.text if description_elem is not None else "",
-                        "comments": comments_count,  # 댓글 수 추가 (있으면)
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    news_items.append(news_item)
+            response.raise_for_status()
             
-            logger.info(f"✅ {source_name} 수집 성공! {len(news_items)}개 기사 발견")
-            return news_items[:50]  # 상위 50개 반환 (10 -> 50으로 증가, 4K RPM 활용)
+            news_items = await parse_rss_stream(response.aiter_bytes(), source_name, RSS_MAX_ITEMS)
             
-        except Exception as e:
-            logger.error(f"❌ {source_name} 수집 실패: {type(e).__name__} - {e}")
-            return []
+            # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+            record_validators(url, response, source=source_name)
+        
+        logger.info(f"✅ {source_name} 수집 성공! {len(news_items)}개 기사 발견")
+        return news_items
+        
+    except Exception as e:
+        logger.error(f"❌ {source_name} 수집 실패: {type(e).__name__} - {e}")
+        return []
+
+
+# 수집 대상 뉴스 RSS 피드 (URL, 소스 이름)
+NEWS_SOURCES = [
+    # 국제 뉴스 (작동 확인됨)
+    ("https://feeds.bbci.co.uk/news/rss.xml", "BBC"),
+    ("https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml", "NYTimes"),
+    ("https://rss.cbc.ca/lineup/topstories.xml", "CBC"),
+    ("https://feeds.washingtonpost.com/rss/world", "WashingtonPost"),
+    ("https://www.theguardian.com/world/rss", "TheGuardian"),
+    
+    # 기술 뉴스 (작동 확인됨)
+    ("https://hnrss.org/frontpage", "HackerNews"),
+    ("https://techcrunch.com/feed/", "TechCrunch"),
+    ("https://www.theverge.com/rss/index.xml", "TheVerge"),
+    ("https://www.wired.com/feed/rss", "Wired"),
+    ("https://feeds.arstechnica.com/arstechnica/index", "ArsTechnica"),
+    ("https://www.engadget.com/rss.xml", "Engadget"),
+    
+    # 경제 뉴스
+    ("https://feeds.bloomberg.com/markets/news.rss", "Bloomberg"),
+]
 
 
 async def fetch_multiple_news_sources() -> List[Dict[str, str]]:
     """
-    여러 뉴스 소스에서 데이터를 수집합니다.
+    여러 뉴스 소스에서 데이터를 동시에 수집합니다.
     """
-    news_sources = [
-        # 국제 뉴스 (작동 확인됨)
-        ("https://feeds.bbci.co.uk/news/rss.xml", "BBC"),
-        ("https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml", "NYTimes"),
-        ("https://rss.cbc.ca/lineup/topstories.xml", "CBC"),
-        ("https://feeds.washingtonpost.com/rss/world", "WashingtonPost"),
-        ("https://www.theguardian.com/world/rss", "TheGuardian"),
-        
-        # 기술 뉴스 (작동 확인됨)
-        ("https://hnrss.org/frontpage", "HackerNews"),
-        ("https://techcrunch.com/feed/", "TechCrunch"),
-        ("https://www.theverge.com/rss/index.xml", "TheVerge"),
-        ("https://www.wired.com/feed/rss", "Wired"),
-        ("https://feeds.arstechnica.com/arstechnica/index", "ArsTechnica"),
-        ("https://www.engadget.com/rss.xml", "Engadget"),
-        
-        # 경제 뉴스
-        ("https://feeds.bloomberg.com/markets/news.rss", "Bloomberg"),
+    tasks = [
+        ("news", source, lambda url=url, source=source: fetch_news_rss(url, source))
+        for url, source in NEWS_SOURCES
     ]
+    results = await run_collection_tasks(tasks)
     
-    all_news = []
-    for url, source in news_sources:
-        news = await fetch_news_rss(url, source)
-        all_news.extend(news)
-    
-    return all_news
-
+    return results["news"]
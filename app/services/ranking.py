@@ -3,31 +3,134 @@
 분석 결과를 기반으로 주요 이슈를 랭킹하고 저장합니다.
 """
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, and_
+from sqlalchemy import select, func, desc, and_, text, literal_column
 from app.core.database import AsyncSessionLocal
 from app.core.models import AnalysisResult, IssueRanking, CollectedItem
+from app.core.partitions import collected_window_sql
+from app.services.search import build_prefix_tsquery
 
 logger = logging.getLogger("hourly_pulse")
 
 
-async def calculate_item_interest_score(item: CollectedItem) -> int:
+# 뉴스 휴리스틱의 중요 키워드 (compute_interest_score와 SQL 식에서 함께 사용)
+NEWS_IMPORTANT_KEYWORDS = ['breaking', 'urgent', 'major', 'crisis', 'alert', 'important']
+
+# int()로 변환되는 문자열 지표 (그 외 문자열은 compute_interest_score에서 ValueError -> 기본값 100)
+_INT_STRING_PATTERN = "'^\\s*[-+]?[0-9]+\\s*$'"
+
+
+def _json_int_sql(alias: str, key: str) -> str:
     """
-    단일 아이템의 관심도 점수를 계산합니다.
+    extra_data 지표 하나를 int(extra.get(key, 0) or 0)와 같이 정수로 읽는 SQL 식 (변환할 수 없으면 0)
+    """
+    value = f"({alias}.extra_data ->> '{key}')"
+    return f"""(CASE json_typeof({alias}.extra_data -> '{key}')
+            WHEN 'number' THEN trunc({value}::numeric)
+            WHEN 'string' THEN CASE WHEN {value} ~ {_INT_STRING_PATTERN} THEN {value}::numeric ELSE 0 END
+            WHEN 'boolean' THEN CASE WHEN {value} = 'true' THEN 1 ELSE 0 END
+            ELSE 0 END)"""
+
+
+def _json_invalid_sql(alias: str, keys: List[str]) -> str:
+    """
+    지표 중 하나라도 int()로 변환할 수 없는 값인지 확인하는 SQL 식 (compute_interest_score의 오류 시 기본값 분기)
+    """
+    conditions = []
+    for key in keys:
+        node = f"({alias}.extra_data -> '{key}')"
+        value = f"({alias}.extra_data ->> '{key}')"
+        conditions.append(
+            f"(json_typeof({node}) = 'string' AND {value} <> '' AND {value} !~ {_INT_STRING_PATTERN})"
+            f" OR (json_typeof({node}) IN ('object', 'array') AND {value} NOT IN ('{{}}', '[]'))"
+        )
+    return "(" + " OR ".join(conditions) + ")"
+
+
+def interest_score_sql(alias: str = "ci") -> str:
+    """
+    compute_interest_score와 같은 규칙의 관심도 점수 SQL 식을 만듭니다.
+    (interest_score 컬럼 백필, 아직 백필되지 않은 행의 집계용)
     
     Args:
-        item: CollectedItem 객체
+        alias: collected_items 테이블 별칭
+    
+    Returns:
+        SQL 식 문자열
+    """
+    title = f"coalesce({alias}.title, '')"
+    content = f"coalesce({alias}.content, '')"
+    keyword_score = " + ".join(
+        f"CASE WHEN position('{kw}' in lower({title})) > 0 THEN 15 ELSE 0 END"
+        for kw in NEWS_IMPORTANT_KEYWORDS
+    )
+    news_heuristic = f"""(100
+            + CASE WHEN char_length({title}) BETWEEN 20 AND 100 THEN 30
+                   WHEN char_length({title}) BETWEEN 10 AND 150 THEN 20
+                   ELSE 10 END
+            + {keyword_score}
+            + LEAST(floor(char_length({content}) / 100.0), 20))"""
+    
+    def views_for(source_type: str, keys: List[str], expression: str) -> str:
+        return (
+            f"WHEN {alias}.source_type = '{source_type}' AND {_json_invalid_sql(alias, keys)} THEN 100\n"
+            f"            WHEN {alias}.source_type = '{source_type}' THEN {expression}"
+        )
+    
+    youtube = views_for('youtube', ['views'], _json_int_sql(alias, 'views'))
+    reddit = views_for(
+        'reddit', ['upvotes', 'comments'],
+        f"GREATEST(0, {_json_int_sql(alias, 'upvotes')}) * 15 + GREATEST(0, {_json_int_sql(alias, 'comments')}) * 5"
+    )
+    github = views_for(
+        'github', ['stars', 'forks', 'watchers'],
+        f"GREATEST(0, {_json_int_sql(alias, 'stars')}) * 20 + GREATEST(0, {_json_int_sql(alias, 'forks')}) * 10"
+        f" + GREATEST(0, {_json_int_sql(alias, 'watchers')}) * 3"
+    )
+    news_comments = f"GREATEST(0, {_json_int_sql(alias, 'comments')})"
+    news = views_for(
+        'news', ['comments'],
+        f"CASE WHEN {news_comments} > 0 THEN {news_comments} * 50 ELSE {news_heuristic} END"
+    )
+    return f"""(CASE
+        WHEN {alias}.extra_data IS NULL OR {alias}.extra_data::text IN ('null', '{{}}', '[]') THEN 100
+        ELSE LEAST(10000000000, GREATEST(0, CASE
+            {youtube}
+            {reddit}
+            {github}
+            {news}
+            ELSE 100 END))
+    END)::bigint"""
+
+
+def stored_interest_score():
+    """
+    저장된 관심도 점수 컬럼 식 (아직 백필되지 않은 행은 interest_score_sql로 계산)
+    """
+    return func.coalesce(CollectedItem.interest_score, literal_column(interest_score_sql("collected_items")))
+
+
+def compute_interest_score(source_type: Optional[str], extra: Optional[Dict[str, Any]], title: str = "", content: str = "") -> int:
+    """
+    소스 타입과 참여도 지표로 관심도 점수를 계산합니다.
+    (CollectedItem 행, 참여도 이력 샘플 모두에 사용)
+    
+    Args:
+        source_type: 소스 타입
+        extra: 참여도 지표가 담긴 딕셔너리 (extra_data 또는 이력 샘플)
+        title: 제목 (News 휴리스틱용)
+        content: 내용 (News 휴리스틱용)
     
     Returns:
         관심도 점수 (추정 조회수)
     """
-    if not item.extra_data:
+    if not extra:
         return 100  # 기본값
     
-    extra = item.extra_data if isinstance(item.extra_data, dict) else {}
-    source_type = item.source_type or 'unknown'
+    extra = extra if isinstance(extra, dict) else {}
+    source_type = source_type or 'unknown'
     
     estimated_views = 0
     
@@ -65,7 +168,7 @@ async def calculate_item_interest_score(item: CollectedItem) -> int:
                 estimated_views = comments * 50
             else:
                 # 개선된 휴리스틱 점수 계산
-                estimated_views = _calculate_news_heuristic_score(item)
+                estimated_views = _calculate_news_heuristic_score(title, content)
                 
         else:
             estimated_views = 100
@@ -77,24 +180,61 @@ async def calculate_item_interest_score(item: CollectedItem) -> int:
         estimated_views = min(estimated_views, 10_000_000_000)  # 100억 제한
         
     except (ValueError, TypeError) as e:
-        logger.warning(f"⚠️ 관심도 계산 중 오류 발생 (item_id={item.id}, source_type={source_type}): {e}")
+        logger.warning(f"⚠️ 관심도 계산 중 오류 발생 (source_type={source_type}): {e}")
         estimated_views = 100  # 오류 시 기본값
     
     return int(estimated_views)
 
 
-def _calculate_news_heuristic_score(item: CollectedItem) -> int:
+async def calculate_item_interest_score(item: CollectedItem) -> int:
     """
-    News 아이템의 휴리스틱 관심도 점수를 계산합니다.
+    단일 아이템의 관심도 점수를 반환합니다. (최신 참여도 지표 기준)
+    수집 시점에 저장된 interest_score가 있으면 그대로 사용하고, 없으면(백필 전 행) 계산합니다.
     
     Args:
         item: CollectedItem 객체
     
+    Returns:
+        관심도 점수 (추정 조회수)
+    """
+    if item.interest_score is not None:
+        return int(item.interest_score)
+    return compute_interest_score(item.source_type, item.extra_data, item.title or "", item.content or "")
+
+
+def calculate_sample_interest_score(item: CollectedItem, sample: Dict[str, Any]) -> int:
+    """
+    참여도 이력 샘플 하나의 관심도 점수를 반환합니다.
+    수집 시점에 샘플에 저장된 점수("score")가 있으면 그대로 사용하고,
+    없으면(이전 샘플) 샘플에 없는 지표를 아이템의 extra_data 값으로 채워 계산합니다.
+    
+    Args:
+        item: CollectedItem 객체
+        sample: engagement_history의 샘플 ({"t": ..., "upvotes": ..., ...})
+    
+    Returns:
+        관심도 점수 (추정 조회수)
+    """
+    if sample.get("score") is not None:
+        return int(sample["score"])
+    extra = dict(item.extra_data) if isinstance(item.extra_data, dict) else {}
+    extra.update({k: v for k, v in sample.items() if k not in ("t", "score")})
+    return compute_interest_score(item.source_type, extra, item.title or "", item.content or "")
+
+
+def _calculate_news_heuristic_score(title: str, content: str) -> int:
+    """
+    News 아이템의 휴리스틱 관심도 점수를 계산합니다.
+    
+    Args:
+        title: 제목
+        content: 내용
+    
     Returns:
         추정 조회수
     """
-    title = item.title or ""
-    content = item.content or ""
+    title = title or ""
+    content = content or ""
     
     # 1. 제목 길이 점수 (적절한 길이의 제목이 더 높은 점수)
     title_length = len(title)
@@ -106,8 +246,7 @@ def _calculate_news_heuristic_score(item: CollectedItem) -> int:
         length_score = 10  # 너무 짧거나 긴 제목
     
     # 2. 중요 키워드 점수 (중복 제거)
-    important_keywords = ['breaking', 'urgent', 'major', 'crisis', 'alert', 'important']
-    keyword_score = sum(15 for kw in important_keywords if kw.lower() in title.lower())
+    keyword_score = sum(15 for kw in NEWS_IMPORTANT_KEYWORDS if kw.lower() in title.lower())
     
     # 3. 내용 길이 점수 (내용이 있으면 추가 점수)
     content_length = len(content) if content else 0
@@ -120,6 +259,149 @@ def _calculate_news_heuristic_score(item: CollectedItem) -> int:
     return estimated_views
 
 
+def _topic_keywords(topic: Optional[str]) -> List[str]:
+    """
+    토픽에서 주요 키워드를 추출합니다. (공백으로 분리, 3글자 이상)
+    """
+    topic = topic.lower() if topic else ''
+    topic_keywords = [kw.strip() for kw in topic.split() if len(kw.strip()) > 2]
+    if not topic_keywords:
+        topic_keywords = [topic] if topic else []
+    return topic_keywords
+
+
+def _top_counts(counts: Dict[str, int]) -> List[tuple]:
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5]
+
+
+async def aggregate_issue_groups(session: AsyncSession, groups: List[Dict[str, Any]], window_start: datetime) -> Dict[int, Dict[str, Any]]:
+    """
+    모든 이슈 그룹의 관련 아이템 집계(관심도 합계, 언급 횟수, 소스 다양성, 상위 소스)를 집합 기반 SQL로 한 번에 계산합니다.
+    
+    관련 아이템 = collected_item_ids(그룹당 최대 200개) 중 윈도우 내 아이템 ∪ 윈도우 내 토픽 키워드 전문 검색 결과
+    - ID 배열과 키워드 tsquery 배열을 unnest해 (그룹, 아이템) 쌍을 만들고 UNION으로 중복 제거
+    - GROUPING SETS로 그룹별 합계 / 소스 타입별 / 소스 이름별 개수를 한 문장에서 집계
+    윈도우 내 관련 아이템이 없는 그룹은 collected_item_ids 전체(기간 무관)로 출처 정보만 한 번 더 집계합니다.
+    
+    Args:
+        session: 데이터베이스 세션
+        groups: calculate_issue_rankings의 이슈 그룹 리스트 ('topic', 'collected_item_ids' 포함)
+        window_start: 윈도우 시작 시각
+    
+    Returns:
+        그룹 인덱스 -> 집계 결과 (관련 아이템도, collected_item_ids도 없는 그룹은 제외)
+    """
+    id_groups, id_values, kw_groups, kw_queries = [], [], [], []
+    for group_index, data in enumerate(groups):
+        for item_id in list(data['collected_item_ids'])[:200]:  # 최대 200개까지 확인
+            id_groups.append(group_index)
+            id_values.append(item_id)
+        query = build_prefix_tsquery(_topic_keywords(data['topic']))
+        if query is not None:
+            kw_groups.append(group_index)
+            kw_queries.append(query)
+    
+    if not id_groups and not kw_groups:
+        return {}
+    
+    window_end = datetime.now(timezone.utc) + timedelta(hours=1)  # collected_window와 같은 상한 (파티션 프루닝)
+    result = await session.execute(
+        text(f"""
+            WITH recent AS MATERIALIZED (
+                SELECT ci.id, ci.source_type, ci.source, coalesce(ci.interest_score, {interest_score_sql('ci')}) AS interest_score
+                FROM collected_items ci
+                WHERE {collected_window_sql('ci')}
+            ),
+            members AS (
+                SELECT m.grp, m.item_id
+                FROM unnest(CAST(:id_groups AS integer[]), CAST(:id_values AS integer[])) AS m(grp, item_id)
+                JOIN recent r ON r.id = m.item_id
+                UNION
+                SELECT q.grp, ci.id
+                FROM unnest(CAST(:kw_groups AS integer[]), CAST(:kw_queries AS text[])) AS q(grp, query)
+                JOIN collected_items ci
+                  ON ci.search_vector @@ to_tsquery('simple', q.query)
+                 AND {collected_window_sql('ci')}
+            )
+            SELECT m.grp,
+                   GROUPING(r.source_type) AS by_type_rolled, GROUPING(r.source) AS by_name_rolled,
+                   r.source_type, r.source,
+                   count(*) AS item_count,
+                   coalesce(sum(r.interest_score), 0) AS interest_score,
+                   count(DISTINCT r.source_type) AS source_diversity
+            FROM members m
+            JOIN recent r ON r.id = m.item_id
+            GROUP BY GROUPING SETS ((m.grp), (m.grp, r.source_type), (m.grp, r.source))
+        """),
+        {
+            "window_start": window_start,
+            "window_end": window_end,
+            "id_groups": id_groups,
+            "id_values": id_values,
+            "kw_groups": kw_groups,
+            "kw_queries": kw_queries,
+        }
+    )
+    
+    stats: Dict[int, Dict[str, Any]] = {}
+    type_counts: Dict[int, Dict[str, int]] = {}
+    name_counts: Dict[int, Dict[str, int]] = {}
+    for grp, by_type_rolled, by_name_rolled, source_type, source, item_count, interest_score, source_diversity in result.all():
+        if by_type_rolled and by_name_rolled:
+            stats[grp] = {
+                'mention_count': int(item_count),
+                'interest_score': int(interest_score),
+                'source_diversity': int(source_diversity),
+            }
+        elif not by_type_rolled:
+            type_counts.setdefault(grp, {})[source_type or 'unknown'] = int(item_count)
+        else:
+            name_counts.setdefault(grp, {})[source or 'Unknown'] = int(item_count)
+    
+    for grp, group_stats in stats.items():
+        group_stats['top_source_types'] = _top_counts(type_counts.get(grp, {}))
+        group_stats['top_source_names'] = _top_counts(name_counts.get(grp, {}))
+    
+    # 윈도우 내 관련 아이템이 없으면 collected_item_ids로 소스 정보 조회 (관심도/언급 횟수는 0)
+    missing = [grp for grp, data in enumerate(groups) if grp not in stats and data['collected_item_ids']]
+    if missing:
+        missing_set = set(missing)
+        fallback_groups = [grp for grp in id_groups if grp in missing_set]
+        fallback_values = [item_id for grp, item_id in zip(id_groups, id_values) if grp in missing_set]
+        result = await session.execute(
+            text("""
+                SELECT m.grp,
+                       GROUPING(ci.source_type) AS by_type_rolled, GROUPING(ci.source) AS by_name_rolled,
+                       ci.source_type, ci.source,
+                       count(*) AS item_count,
+                       count(DISTINCT ci.source_type) AS source_diversity
+                FROM unnest(CAST(:id_groups AS integer[]), CAST(:id_values AS integer[])) AS m(grp, item_id)
+                JOIN collected_items ci ON ci.id = m.item_id
+                GROUP BY GROUPING SETS ((m.grp), (m.grp, ci.source_type), (m.grp, ci.source))
+            """),
+            {"id_groups": fallback_groups, "id_values": fallback_values}
+        )
+        fallback_diversity: Dict[int, int] = {}
+        for grp, by_type_rolled, by_name_rolled, source_type, source, item_count, source_diversity in result.all():
+            if by_type_rolled and by_name_rolled:
+                fallback_diversity[grp] = int(source_diversity)
+            elif not by_type_rolled:
+                type_counts.setdefault(grp, {})[source_type or 'unknown'] = int(item_count)
+            else:
+                name_counts.setdefault(grp, {})[source or 'Unknown'] = int(item_count)
+        
+        for grp in missing:
+            stats[grp] = {
+                'mention_count': 0,
+                'interest_score': 0,
+                'source_diversity': fallback_diversity.get(grp, 0),
+                'top_source_types': _top_counts(type_counts.get(grp, {})),
+                'top_source_names': _top_counts(name_counts.get(grp, {})),
+            }
+    
+    return stats
+
+
 async def calculate_issue_rankings(hours: int = 1) -> List[Dict[str, Any]]:
     """
     분석 결과를 기반으로 이슈 랭킹을 계산합니다.
@@ -236,147 +518,29 @@ async def calculate_issue_rankings(hours: int = 1) -> List[Dict[str, Any]]:
                     issue_scores[issue_key]['collected_item_ids'].update(result.collected_item_ids)
             
             # 각 이슈의 종합 점수 계산 (내용 기반 비교 분석)
+            # 관심도: 최근 5분 동안 수집된 유사한 내용의 모든 아이템 관심도 합산
+            # (모든 이슈 그룹의 관련 아이템 집계를 한 번의 SQL로 계산)
             ranked_issues = []
+            group_list = list(issue_scores.values())
+            now = datetime.now(timezone.utc)
+            five_minutes_ago = now - timedelta(minutes=5)
+            group_stats = await aggregate_issue_groups(session, group_list, five_minutes_ago)
             
-            for issue_key, data in issue_scores.items():
+            for group_index, data in enumerate(group_list):
                 # 평균 중요도 점수
                 avg_importance = sum(data['importance_scores']) / len(data['importance_scores']) if data['importance_scores'] else 0.0
                 
                 # 최대 소스 수
                 max_sources = max(data['source_counts']) if data['source_counts'] else 0
                 
-                # 출처 정보 초기화
-                top_source_types = []
-                top_source_names = []
-                
-                # 관심도 계산: 최근 5분 동안 수집된 유사한 내용의 모든 아이템 관심도 합산
-                # 5분마다 수집된 데이터로 내용 그룹의 관심도를 계산하여 순위를 매김
-                interest_score = 0
-                mention_count = 0
-                from datetime import timezone
-                now = datetime.now(timezone.utc)
-                # 최근 5분 기준 시간 (5분마다 수집된 데이터만 사용)
-                five_minutes_ago = now - timedelta(minutes=5)
-                logger.debug(f"📊 [{data['topic']}] 최근 5분 데이터 기준 시간: {five_minutes_ago.isoformat()} ~ {now.isoformat()}")
-                
-                # 토픽명과 관련 키워드 추출
-                topic = data['topic'].lower() if data['topic'] else ''
-                # 토픽에서 주요 키워드 추출 (공백으로 분리)
-                topic_keywords = [kw.strip() for kw in topic.split() if len(kw.strip()) > 2]
-                if not topic_keywords:
-                    topic_keywords = [topic] if topic else []
-                
-                # 변수 초기화
-                items = []
-                additional_items = []
-                
-                # 방법 1: collected_item_ids에 포함된 아이템 중 최근 5분 내 아이템
-                if data['collected_item_ids']:
-                    item_ids = list(data['collected_item_ids'])
-                    # 관련 아이템 가져오기 (최근 5분 필터 적용)
-                    items_query = select(CollectedItem).where(
-                        CollectedItem.id.in_(item_ids[:200]),  # 최대 200개까지 확인
-                        CollectedItem.collected_at >= five_minutes_ago  # 최근 5분 내 아이템만
-                    )
-                    items_result = await session.execute(items_query)
-                    items = list(items_result.scalars().all())
-                    
-                    # collected_item_ids에 포함된 아이템은 모두 관련 아이템으로 간주
-                    for item in items:
-                        # calculate_item_interest_score 함수 사용
-                        item_score = await calculate_item_interest_score(item)
-                        interest_score += item_score
-                        mention_count += 1
-                    
-                    logger.info(f"📊 [{data['topic']}] collected_item_ids 기반 최근 5분 내 아이템: {len(items)}개, 관심도 합계: {interest_score}")
-                
-                # 방법 2: collected_item_ids 외에도 토픽 키워드로 최근 5분 내 추가 검색
-                # (더 많은 유사한 내용의 아이템을 찾기 위해)
-                if topic_keywords:
-                    from sqlalchemy import or_
-                    # 최근 5분 내 모든 아이템 중 토픽 키워드가 포함된 아이템 검색
-                    keyword_items_query = select(CollectedItem).where(
-                        CollectedItem.collected_at >= five_minutes_ago
-                    )
-                    
-                    # 제목이나 내용에 토픽 키워드가 포함된 아이템 찾기
-                    title_conditions = [CollectedItem.title.ilike(f"%{kw}%") for kw in topic_keywords]
-                    content_conditions = [CollectedItem.content.ilike(f"%{kw}%") for kw in topic_keywords]
-                    keyword_items_query = keyword_items_query.where(
-                        or_(*title_conditions, *content_conditions)
-                    )
-                    
-                    keyword_items_result = await session.execute(keyword_items_query)
-                    keyword_items = list(keyword_items_result.scalars().all())
-                    
-                    # collected_item_ids에 포함되지 않은 아이템만 추가
-                    existing_item_ids = {item.id for item in items}
-                    additional_items = [item for item in keyword_items if item.id not in existing_item_ids]
-                    
-                    additional_interest = 0
-                    for item in additional_items:
-                        # calculate_item_interest_score 함수 사용
-                        item_score = await calculate_item_interest_score(item)
-                        interest_score += item_score
-                        additional_interest += item_score
-                        mention_count += 1
-                    
-                    if additional_items:
-                        logger.info(f"📊 [{data['topic']}] 토픽 키워드로 추가 발견: {len(additional_items)}개, 추가 관심도: {additional_interest}")
-                
-                logger.info(f"📊 [{data['topic']}] 최종 관심도 합계: {interest_score} (총 {mention_count}개 아이템)")
-                
-                # 소스 다양성 계산 (고유 소스 타입 수)
-                source_diversity = 0
-                top_source_types = []
-                top_source_names = []
-                
-                # 최근 5분 내 아이템들의 소스 정보 수집
-                all_recent_items = items + additional_items
-                if all_recent_items:
-                    # 최근 5분 내 아이템들의 소스 타입 확인
-                    source_type_set = {item.source_type for item in all_recent_items if item.source_type}
-                    source_diversity = len(source_type_set)
-                    
-                    # 주요 소스 타입 및 소스 이름 수집 (출처 정보)
-                    source_type_counts = {}
-                    source_name_counts = {}
-                    
-                    for item in all_recent_items[:100]:  # 최대 100개
-                        source_type = item.source_type or 'unknown'
-                        source_name = item.source or 'Unknown'
-                        source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-                        source_name_counts[source_name] = source_name_counts.get(source_name, 0) + 1
-                    
-                    # 상위 소스 타입 및 소스 이름 (빈도순)
-                    top_source_types = sorted(source_type_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-                    top_source_names = sorted(source_name_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-                elif data['collected_item_ids']:
-                    # 아이템이 없으면 collected_item_ids로 소스 정보 조회
-                    all_item_ids = list(data['collected_item_ids'])[:200]
-                    if all_item_ids:
-                        source_types_query = select(CollectedItem.source_type).where(
-                            CollectedItem.id.in_(all_item_ids)
-                        ).distinct()
-                        source_types_result = await session.execute(source_types_query)
-                        source_diversity = len(list(source_types_result.scalars().all()))
-                        
-                        all_items_query = select(CollectedItem.source_type, CollectedItem.source).where(
-                            CollectedItem.id.in_(all_item_ids)
-                        )
-                        all_items_result = await session.execute(all_items_query)
-                        all_source_data = list(all_items_result.all())
-                        
-                        source_type_counts = {}
-                        source_name_counts = {}
-                        for source_type, source_name in all_source_data:
-                            if source_type:
-                                source_type_counts[source_type] = source_type_counts.get(source_type, 0) + 1
-                            if source_name:
-                                source_name_counts[source_name] = source_name_counts.get(source_name, 0) + 1
-                        
-                        top_source_types = sorted(source_type_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-                        top_source_names = sorted(source_name_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+                stats = group_stats.get(group_index)
+                if stats is not None:
+                    mention_count = stats['mention_count']
+                    interest_score = stats['interest_score']
+                    source_diversity = stats['source_diversity']
+                    top_source_types = stats['top_source_types']
+                    top_source_names = stats['top_source_names']
+                    logger.info(f"📊 [{data['topic']}] 최종 관심도 합계: {interest_score} (총 {mention_count}개 아이템)")
                 else:
                     # 수집된 아이템이 없으면 분석 결과 수를 사용
                     mention_count = len(data['analysis_ids'])
@@ -708,6 +872,7 @@ async def detect_surge_trends(limit: int = 5) -> List[Dict[str, Any]]:
                         'what': current_ranking.what or '',
                         'why_now': current_ranking.why_now or '',
                         'context': current_ranking.context or '',
+                        'translations': current_ranking.translations,
                     })
             
             # 관심도 변화율 기준으로 정렬 (가장 급상승한 순서)
@@ -758,3 +923,103 @@ async def get_top_rankings(limit: int = 10) -> List[IssueRanking]:
             return []
 
 
+
+
+# 토픽별 최근 분석 결과 N개의 아이템 출처 집계 (최근 분석 5개, 분석당 아이템 ID 최대 20개)
+_TOPIC_SOURCES_SQL = text("""
+    WITH recent AS (
+        SELECT topic, collected_item_ids,
+               row_number() OVER (PARTITION BY topic ORDER BY analyzed_at DESC) AS rn
+        FROM analysis_results
+        WHERE topic = ANY(:topics)
+    ),
+    item_ids AS (
+        SELECT DISTINCT recent.topic, (elem.value)::int AS item_id
+        FROM recent
+        CROSS JOIN LATERAL json_array_elements_text(recent.collected_item_ids) WITH ORDINALITY AS elem(value, ord)
+        WHERE recent.rn <= :analyses_per_topic
+          AND json_typeof(recent.collected_item_ids) = 'array'
+          AND elem.ord <= :ids_per_analysis
+          AND elem.value ~ '^[0-9]+$'
+    )
+    SELECT item_ids.topic, collected_items.source_type, collected_items.source, count(*) AS cnt
+    FROM item_ids
+    JOIN collected_items ON collected_items.id = item_ids.item_id
+    GROUP BY item_ids.topic, collected_items.source_type, collected_items.source
+""")
+
+# 토픽별 최근 분석 결과 N개의 감정 분포 (동률이면 가장 최근 분석의 감정 우선)
+_TOPIC_SENTIMENTS_SQL = text("""
+    WITH recent AS (
+        SELECT topic, sentiment,
+               row_number() OVER (PARTITION BY topic ORDER BY analyzed_at DESC) AS rn
+        FROM analysis_results
+        WHERE topic = ANY(:topics)
+    )
+    SELECT topic, sentiment, count(*) AS cnt, min(rn) AS first_rn
+    FROM recent
+    WHERE rn <= :analyses_per_topic AND sentiment IS NOT NULL AND sentiment <> ''
+    GROUP BY topic, sentiment
+""")
+
+
+async def resolve_topic_sources(session: AsyncSession, topics: List[str], analyses_per_topic: int = 5, ids_per_analysis: int = 20) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 토픽의 출처 정보와 대표 감정을 한 번에 조회합니다.
+    토픽 수와 무관하게 그룹 쿼리 2개(출처 집계, 감정 집계)만 실행합니다.
+    
+    Args:
+        session: 데이터베이스 세션
+        topics: 토픽 리스트
+        analyses_per_topic: 토픽별로 참고할 최근 분석 결과 수
+        ids_per_analysis: 분석 결과당 참고할 최대 아이템 ID 수
+    
+    Returns:
+        토픽별 {"sources": {"types": [...], "names": [...]}, "sentiment": "..."} 딕셔너리
+    """
+    resolved = {topic: {"sources": {"types": [], "names": []}, "sentiment": "neutral"} for topic in topics}
+    if not topics:
+        return resolved
+    
+    params = {
+        "topics": list(set(topics)),
+        "analyses_per_topic": analyses_per_topic,
+        "ids_per_analysis": ids_per_analysis,
+    }
+    
+    # 1. 출처 집계 (토픽, 소스 타입, 소스 이름별 아이템 수)
+    type_counts: Dict[str, Dict[str, int]] = {}
+    name_counts: Dict[str, Dict[str, int]] = {}
+    try:
+        source_rows = await session.execute(_TOPIC_SOURCES_SQL, params)
+        for topic, source_type, source_name, count in source_rows.all():
+            topic_types = type_counts.setdefault(topic, {})
+            topic_types[source_type] = topic_types.get(source_type, 0) + count
+            topic_names = name_counts.setdefault(topic, {})
+            topic_names[source_name] = topic_names.get(source_name, 0) + count
+    except Exception as e:
+        logger.warning(f"⚠️ 토픽 출처 일괄 조회 실패: {type(e).__name__} - {e}")
+        await session.rollback()
+    
+    for topic in type_counts:
+        # 상위 3개씩만
+        resolved[topic]["sources"] = {
+            "types": [{"type": st, "count": cnt} for st, cnt in sorted(type_counts[topic].items(), key=lambda x: x[1], reverse=True)[:3]],
+            "names": [{"name": sn, "count": cnt} for sn, cnt in sorted(name_counts[topic].items(), key=lambda x: x[1], reverse=True)[:3]],
+        }
+    
+    # 2. 감정 집계 (가장 많이 나타난 감정)
+    try:
+        sentiment_rows = await session.execute(_TOPIC_SENTIMENTS_SQL, params)
+        best: Dict[str, tuple] = {}
+        for topic, sentiment, count, first_rn in sentiment_rows.all():
+            key = (count, -first_rn)
+            if topic not in best or key > best[topic][0]:
+                best[topic] = (key, sentiment)
+        for topic, (_, sentiment) in best.items():
+            resolved[topic]["sentiment"] = sentiment
+    except Exception as e:
+        logger.warning(f"⚠️ 토픽 감정 일괄 조회 실패: {type(e).__name__} - {e}")
+        await session.rollback()
+    
+    return resolved
@@ -0,0 +1,222 @@
+"""
+랭킹 응답 스냅샷 캐시
+랭킹이 저장되고 쓰기 시점 번역까지 끝나면 언어별 /rankings 응답을 미리 렌더링하고 직렬화해 두어,
+폴링 요청은 딕셔너리 조회와 ETag 비교만으로 처리합니다. (랭킹은 수집 주기마다 한 번만 바뀜)
+급상승 트렌드 응답 렌더링도 여기서 담당합니다. (엔드포인트와 실시간 푸시에서 공용)
+"""
+import json
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from app.core.database import AsyncSessionLocal
+from app.services.ranking import get_top_rankings, detect_surge_trends, resolve_topic_sources
+from app.services.localization import localize_rows
+
+logger = logging.getLogger("hourly_pulse")
+
+# 스냅샷으로 미리 만들어 둘 언어와 최대 개수 (/rankings의 limit 최대값과 동일)
+SNAPSHOT_LANGUAGES = ("ko", "en")
+SNAPSHOT_MAX_LIMIT = 10
+
+# (언어, limit) -> {"body": 직렬화된 JSON 바이트, "etag": ETag}
+_snapshots: Dict[tuple, Dict[str, Any]] = {}
+_snapshot_info: Dict[str, Any] = {"version": None, "built_at": None, "hits": 0, "not_modified": 0, "misses": 0}
+_build_lock = asyncio.Lock()
+
+
+async def render_rankings(limit: int = SNAPSHOT_MAX_LIMIT, lang: Optional[str] = "ko") -> List[dict]:
+    """
+    /rankings 응답 본문을 렌더링합니다. (DB 조회 + 저장된 번역 사용)
+    
+    Args:
+        limit: 가져올 최대 개수
+        lang: 언어 (ko 또는 en)
+    
+    Returns:
+        이슈 랭킹 리스트
+    """
+    rankings = await get_top_rankings(limit=limit)
+    
+    # 모든 토픽의 출처 정보와 감정을 한 번에 조회 (토픽 수와 무관하게 쿼리 2개)
+    async with AsyncSessionLocal() as session:
+        topic_info = await resolve_topic_sources(session, [r.topic for r in rankings])
+    
+    # 쓰기 시점에 저장된 번역 사용 (translations가 없는 기존 행만 모아서 한 번에 번역)
+    localized_rows = await localize_rows([
+        (r.translations, {"topic": r.topic, "description": r.description, "what": r.what, "why_now": r.why_now, "context": r.context})
+        for r in rankings
+    ], lang)
+    
+    result = []
+    for r, localized in zip(rankings, localized_rows):
+        source_info = topic_info[r.topic]["sources"]
+        topic = localized["topic"]
+        description = localized["description"]
+        what = localized["what"]
+        why_now = localized["why_now"]
+        context = localized["context"]
+        
+        # 감정 정보 (최근 분석 결과에서 가장 많이 나타난 감정)
+        sentiment = topic_info[r.topic]["sentiment"]
+        
+        # 출처 정보 가져오기 (IssueRanking에는 저장되지 않으므로, 최신 랭킹 계산 결과에서 가져옴)
+        # 실제로는 상세 분석 API에서 제공하지만, 간단한 출처 정보는 여기서도 제공
+        result_item = {
+            "rank": r.rank,
+            "topic": topic,
+            "description": description,
+            "what": what,
+            "why_now": why_now,
+            "context": context,
+            "score": r.score,
+            "mention_count": r.mention_count,  # 실제로는 interest_score가 저장됨
+            "interest_score": r.mention_count,  # 관심도 점수 (별도 필드로도 제공)
+            "source_diversity": r.source_diversity,
+            "trend_direction": r.trend_direction,
+            "sentiment": sentiment,  # 감정 정보 추가
+            "period_start": r.period_start.isoformat() if r.period_start else None,
+            "period_end": r.period_end.isoformat() if r.period_end else None,
+            "sources": source_info  # 출처 정보 추가
+        }
+        
+        result.append(result_item)
+
+    return result
+
+
+async def render_surge_trends(limit: int = 5, lang: Optional[str] = "ko") -> List[dict]:
+    """
+    /surge-trends 응답 본문을 렌더링합니다. (급상승 감지 + 저장된 번역 사용)
+    
+    Args:
+        limit: 가져올 최대 개수
+        lang: 언어 (ko 또는 en)
+    
+    Returns:
+        급상승 트렌드 리스트
+    """
+    surge_trends = await detect_surge_trends(limit=limit)
+    
+    if not surge_trends:
+        return []
+    
+    # 모든 토픽의 출처 정보를 한 번에 조회 (토픽 수와 무관하게 쿼리 2개)
+    async with AsyncSessionLocal() as session:
+        topic_info = await resolve_topic_sources(session, [trend['topic'] for trend in surge_trends])
+    
+    # 쓰기 시점에 저장된 번역 사용 (translations가 없는 기존 행만 모아서 한 번에 번역)
+    localized_rows = await localize_rows([
+        (trend.get('translations'), {
+            "topic": trend['topic'],
+            "description": trend.get('description', ''),
+            "what": trend.get('what', ''),
+            "why_now": trend.get('why_now', ''),
+            "context": trend.get('context', ''),
+        })
+        for trend in surge_trends
+    ], lang)
+    
+    result = []
+    for trend, localized in zip(surge_trends, localized_rows):
+        topic = trend['topic']
+        
+        source_info = topic_info[topic]["sources"]
+        topic_translated = localized["topic"]
+        description = localized["description"]
+        what = localized["what"]
+        why_now = localized["why_now"]
+        context = localized["context"]
+        
+        result.append({
+            "topic": topic_translated,
+            "current_rank": trend['current_rank'],
+            "previous_rank": trend['previous_rank'],
+            "rank_change": trend['rank_change'],
+            "current_interest": trend['current_interest'],
+            "previous_interest": trend['previous_interest'],
+            "interest_change_rate": trend['interest_change_rate'],
+            "interest_multiplier": trend['interest_multiplier'],
+            "surge_reason": trend['surge_reason'],
+            "description": description,
+            "what": what,
+            "why_now": why_now,
+            "context": context,
+            "sources": source_info,
+        })
+    
+    return result
+
+
+def _serialize(payload: List[dict]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def build_ranking_snapshots() -> int:
+    """
+    언어별 랭킹 응답을 렌더링하여 스냅샷으로 저장합니다. (파이프라인의 랭킹 저장 + 번역 단계 이후 호출)
+    limit별 응답은 최대 개수 응답의 앞부분이므로 언어당 한 번만 렌더링합니다.
+    
+    Returns:
+        만들어진 스냅샷 수
+    """
+    async with _build_lock:
+        snapshots = {}
+        for lang in SNAPSHOT_LANGUAGES:
+            payload = await render_rankings(limit=SNAPSHOT_MAX_LIMIT, lang=lang)
+            for limit in range(1, SNAPSHOT_MAX_LIMIT + 1):
+                body = _serialize(payload[:limit])
+                snapshots[(lang, limit)] = {
+                    "body": body,
+                    "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+                }
+        
+        # 한 번에 교체 (요청이 반쯤 갱신된 스냅샷을 보지 않도록)
+        _snapshots.clear()
+        _snapshots.update(snapshots)
+        _snapshot_info["version"] = hashlib.sha1(b"".join(s["body"] for s in snapshots.values())).hexdigest()[:12]
+        _snapshot_info["built_at"] = datetime.now().isoformat()
+    
+    logger.info(f"📸 랭킹 스냅샷 생성 완료: {len(snapshots)}개 (언어: {', '.join(SNAPSHOT_LANGUAGES)})")
+    return len(snapshots)
+
+
+async def get_ranking_snapshot(lang: Optional[str], limit: int) -> Optional[Dict[str, Any]]:
+    """
+    언어와 개수에 맞는 스냅샷을 반환합니다.
+    아직 스냅샷이 없으면(서버 시작 직후) 한 번 만들어 둡니다.
+    
+    Returns:
+        {"body": bytes, "etag": str}, 지원하지 않는 언어면 None
+    """
+    key = (lang, limit)
+    if lang not in SNAPSHOT_LANGUAGES:
+        return None
+    
+    if key not in _snapshots:
+        _snapshot_info["misses"] += 1
+        if _build_lock.locked():
+            # 다른 요청이 만드는 중이면 완료될 때까지 대기
+            async with _build_lock:
+                pass
+        if key not in _snapshots:
+            await build_ranking_snapshots()
+    
+    return _snapshots.get(key)
+
+
+def note_snapshot_served(not_modified: bool) -> None:
+    """
+    스냅샷 응답 통계를 기록합니다.
+    """
+    _snapshot_info["hits"] += 1
+    if not_modified:
+        _snapshot_info["not_modified"] += 1
+
+
+def get_snapshot_stats() -> Dict[str, Any]:
+    """
+    스냅샷 상태와 통계를 반환합니다.
+    """
+    return {**_snapshot_info, "snapshots": len(_snapshots)}
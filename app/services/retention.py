@@ -0,0 +1,299 @@
+"""
+데이터 보존(retention) 정리 작업
+저장 경로에서 분리된 별도 스케줄러 작업으로 실행되며, 행 개수와 DB 크기를 캐시해 두고
+오래된 데이터를 일 단위 파티션째로 삭제합니다. (파티션 마이그레이션 전에는 시간 구간 단위 DELETE)
+"""
+import os
+import time
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, delete, text
+from app.core.database import AsyncSessionLocal
+from app.core.models import CollectedItem
+from app.core.partitions import is_partitioned, ensure_partitions, list_day_partitions, drop_partition, delete_default_rows_before
+
+logger = logging.getLogger("hourly_pulse")
+
+# 최대 저장 개수 (환경 변수로 설정 가능, 기본값: 50,000개)
+MAX_STORED_ITEMS = int(os.getenv("MAX_STORED_ITEMS", "50000"))
+
+# 최대 디스크 용량 (GB, 환경 변수로 설정 가능, 기본값: 800GB)
+# Docker 제한이 1006.85GB이므로 80%인 800GB를 기본값으로 설정
+MAX_DISK_SIZE_GB = float(os.getenv("MAX_DISK_SIZE_GB", "800"))
+
+# 디스크 용량 임계값 (이 비율을 초과하면 정리 시작, 기본값: 80%)
+DISK_USAGE_THRESHOLD = float(os.getenv("DISK_USAGE_THRESHOLD", "0.8"))
+
+# 정리 작업 실행 주기 (분, 기본값: 15분)
+RETENTION_INTERVAL_MINUTES = int(os.getenv("RETENTION_INTERVAL_MINUTES", "15"))
+
+# 한 번에 삭제할 시간 구간 (분, 기본값: 60분)
+RETENTION_DELETE_SLICE_MINUTES = int(os.getenv("RETENTION_DELETE_SLICE_MINUTES", "60"))
+
+# 한 번의 정리 작업에서 처리할 최대 구간 수 (무한 루프 방지)
+RETENTION_MAX_SLICES = 50
+
+# 마지막 정리 작업에서 측정한 저장소 상태 (저장 경로와 /stats는 이 값을 사용)
+_storage_stats: Dict[str, Any] = {
+    "row_count": None,
+    "db_size_gb": None,
+    "deleted_last_run": 0,
+    "deleted_total": 0,
+    "last_run_at": None,
+    "last_run_ms": None,
+}
+
+
+async def get_database_size_gb(session: AsyncSession) -> float:
+    """
+    데이터베이스의 현재 크기를 GB 단위로 반환합니다.
+    
+    Args:
+        session: 데이터베이스 세션
+    
+    Returns:
+        데이터베이스 크기 (GB)
+    """
+    try:
+        # PostgreSQL의 pg_database_size 함수를 사용하여 데이터베이스 크기 확인
+        # 현재 데이터베이스 이름을 가져옴
+        db_name_result = await session.execute(text("SELECT current_database()"))
+        db_name = db_name_result.scalar()
+        
+        # 데이터베이스 크기 조회 (바이트 단위)
+        size_result = await session.execute(
+            text(f"SELECT pg_database_size('{db_name}')")
+        )
+        size_bytes = size_result.scalar() or 0
+        
+        # GB로 변환
+        size_gb = size_bytes / (1024 ** 3)
+        return size_gb
+    except Exception as e:
+        logger.error(f"❌ 데이터베이스 크기 조회 실패: {type(e).__name__} - {e}")
+        return 0.0
+
+
+def get_storage_stats() -> Dict[str, Any]:
+    """
+    캐시된 저장소 상태를 반환합니다. (쿼리를 실행하지 않음)
+    """
+    return dict(_storage_stats)
+
+
+def note_items_inserted(count: int) -> None:
+    """
+    저장 경로에서 새로 추가된 행 수를 캐시된 행 개수에 반영합니다.
+    """
+    if _storage_stats["row_count"] is not None and count > 0:
+        _storage_stats["row_count"] += count
+
+
+async def _delete_oldest_slice(session: AsyncSession, cutoff: Optional[datetime] = None) -> int:
+    """
+    가장 오래된 RETENTION_DELETE_SLICE_MINUTES 구간의 아이템을 삭제합니다.
+    (파티션 마이그레이션 전 기존 테이블용, collected_at 인덱스 범위 조건만 사용)
+
+    Args:
+        session: 데이터베이스 세션
+        cutoff: 이 시각 이후의 아이템은 삭제하지 않음 (None이면 제한 없음)
+
+    Returns:
+        삭제된 아이템 수
+    """
+    oldest_result = await session.execute(select(func.min(CollectedItem.collected_at)))
+    oldest = oldest_result.scalar()
+    if oldest is None or (cutoff is not None and oldest >= cutoff):
+        return 0
+
+    slice_end = oldest + timedelta(minutes=RETENTION_DELETE_SLICE_MINUTES)
+    if cutoff is not None:
+        slice_end = min(slice_end, cutoff)
+
+    delete_result = await session.execute(
+        delete(CollectedItem).where(
+            CollectedItem.collected_at >= oldest,
+            CollectedItem.collected_at < slice_end
+        )
+    )
+    await session.commit()
+    return delete_result.rowcount or 0
+
+
+async def _drop_oldest_partition(session: AsyncSession, cutoff: Optional[datetime] = None) -> int:
+    """
+    가장 오래된 일 단위 파티션을 통째로 삭제합니다.
+    파티션 전체가 cutoff 이전인 경우에만 삭제하며, 오늘 파티션은 삭제하지 않습니다.
+    기본 파티션에 남은 같은 기준 이전의 행이 있으면 그 행들을 먼저 삭제합니다.
+
+    Args:
+        session: 데이터베이스 세션
+        cutoff: 이 시각 이후의 데이터가 들어 있는 파티션은 삭제하지 않음 (None이면 오늘 시작 시각)
+
+    Returns:
+        삭제된 아이템 수
+    """
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    limit = min(cutoff, today_start) if cutoff is not None else today_start
+
+    default_count = await delete_default_rows_before(session, limit)
+    await session.commit()
+    if default_count > 0:
+        return default_count
+
+    partitions = await list_day_partitions(session)
+    for name, _, end in partitions:
+        if end > limit:
+            break
+        row_count = await drop_partition(session, name)
+        await session.commit()
+        if row_count > 0:
+            return row_count
+    return 0
+
+
+async def _reclaim_oldest(session: AsyncSession, cutoff: Optional[datetime] = None) -> int:
+    """
+    가장 오래된 데이터를 한 단위 삭제합니다.
+    파티션 테이블이면 파티션을 통째로 삭제하고, 기존 테이블이면 시간 구간 단위로 DELETE합니다.
+    """
+    if await is_partitioned(session):
+        return await _drop_oldest_partition(session, cutoff)
+    return await _delete_oldest_slice(session, cutoff)
+
+
+async def _find_count_cutoff(session: AsyncSession, excess: int) -> Optional[datetime]:
+    """
+    가장 오래된 excess개 아이템 바로 다음 아이템의 수집 시각을 찾습니다.
+    (이 시각 이전 아이템을 삭제하면 최대 저장 개수 이내로 유지됨)
+    """
+    cutoff_result = await session.execute(
+        select(CollectedItem.collected_at)
+        .order_by(CollectedItem.collected_at.asc())
+        .offset(excess)
+        .limit(1)
+    )
+    return cutoff_result.scalar()
+
+
+async def cleanup_by_disk_size(session: AsyncSession, max_size_gb: float = MAX_DISK_SIZE_GB, threshold: float = DISK_USAGE_THRESHOLD) -> int:
+    """
+    디스크 용량이 임계값을 초과하면 가장 오래된 데이터부터 파티션(또는 시간 구간) 단위로 삭제합니다.
+
+    Args:
+        session: 데이터베이스 세션
+        max_size_gb: 최대 디스크 용량 (GB)
+        threshold: 용량 임계값 비율 (0.0 ~ 1.0)
+
+    Returns:
+        삭제된 아이템 수
+    """
+    try:
+        current_size_gb = await get_database_size_gb(session)
+        _storage_stats["db_size_gb"] = current_size_gb
+        threshold_size_gb = max_size_gb * threshold
+
+        if current_size_gb < threshold_size_gb:
+            return 0
+
+        # 목표 크기는 최대 용량의 70%로 설정 (여유 공간 확보)
+        target_size_gb = max_size_gb * 0.7
+
+        deleted_total = 0
+        for _ in range(RETENTION_MAX_SLICES):
+            deleted_count = await _reclaim_oldest(session)
+            deleted_total += deleted_count
+            if deleted_count == 0:
+                break
+
+            current_size_gb = await get_database_size_gb(session)
+            _storage_stats["db_size_gb"] = current_size_gb
+            if current_size_gb <= target_size_gb:
+                break
+
+        if deleted_total > 0:
+            logger.info(f"🗑️ 디스크 용량 정리 완료: 총 {deleted_total}개 삭제 (최종 크기: {current_size_gb:.2f}GB)")
+
+        return deleted_total
+    except Exception as e:
+        logger.error(f"❌ 디스크 용량 기반 정리 실패: {type(e).__name__} - {e}")
+        return 0
+
+
+async def cleanup_old_items(session: AsyncSession, max_items: int = MAX_STORED_ITEMS) -> int:
+    """
+    데이터베이스에 저장된 아이템이 최대 개수를 초과하면 가장 오래된 데이터부터 파티션(또는 시간 구간) 단위로 삭제합니다.
+
+    Args:
+        session: 데이터베이스 세션
+        max_items: 최대 저장 개수
+
+    Returns:
+        삭제된 아이템 수
+    """
+    try:
+        count_result = await session.execute(select(func.count(CollectedItem.id)))
+        current_count = count_result.scalar() or 0
+        _storage_stats["row_count"] = current_count
+
+        if current_count <= max_items:
+            return 0
+
+        # 초과분의 경계 시각을 구한 뒤, 그 이전 구간만 삭제
+        # (파티션 테이블은 파티션 전체가 경계 이전일 때만 삭제하므로 최대 하루치가 더 남을 수 있음)
+        cutoff = await _find_count_cutoff(session, current_count - max_items)
+        if cutoff is None:
+            return 0
+
+        deleted_total = 0
+        for _ in range(RETENTION_MAX_SLICES):
+            deleted_count = await _reclaim_oldest(session, cutoff)
+            deleted_total += deleted_count
+            if deleted_count == 0:
+                break
+
+        _storage_stats["row_count"] = current_count - deleted_total
+        if deleted_total > 0:
+            logger.info(f"🗑️ 오래된 데이터 {deleted_total}개 삭제 (최대 저장 개수: {max_items}개 유지)")
+
+        return deleted_total
+    except Exception as e:
+        logger.error(f"❌ 오래된 데이터 삭제 실패: {type(e).__name__} - {e}")
+        return 0
+
+
+async def job_retention_task() -> Dict[str, int]:
+    """
+    스케줄러에 의해 주기적으로 실행되는 보존 정리 작업입니다.
+    디스크 용량 -> 최대 개수 순으로 정리하고 저장소 상태 캐시를 갱신합니다.
+    (프로세스 메모리 압박은 DB 행 삭제로 해결되지 않으므로 app/core/memory_pressure.py에서 처리)
+
+    Returns:
+        정책별 삭제된 아이템 수
+    """
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        # 앞으로 사용할 파티션을 미리 생성
+        try:
+            await ensure_partitions(session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"❌ 파티션 생성 실패: {type(e).__name__} - {e}")
+        
+        deleted = {
+            "disk": await cleanup_by_disk_size(session, MAX_DISK_SIZE_GB, DISK_USAGE_THRESHOLD),
+            "count": await cleanup_old_items(session, MAX_STORED_ITEMS),
+        }
+
+    deleted_run = sum(deleted.values())
+    _storage_stats["deleted_last_run"] = deleted_run
+    _storage_stats["deleted_total"] += deleted_run
+    _storage_stats["last_run_at"] = datetime.now().isoformat()
+    _storage_stats["last_run_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    db_size_gb = _storage_stats["db_size_gb"] or 0.0
+    logger.info(f"🧹 보존 정리 완료: {deleted_run}개 삭제 {deleted} (현재 DB 총 {_storage_stats['row_count']}개, 크기: {db_size_gb:.2f}GB, {_storage_stats['last_run_ms']}ms)")
+    return deleted
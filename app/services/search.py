@@ -0,0 +1,67 @@
+"""
+collected_items 전문 검색 헬퍼
+토픽 키워드 검색을 ILIKE '%kw%' 순차 스캔 대신 search_vector(GIN 인덱스) 접두 tsquery로 수행합니다.
+
+ILIKE와 달라진 매칭 의미:
+- 단어 시작 부분만 일치합니다. 단어 중간/끝의 일치는 찾지 못합니다. (예: "ai"로 "OpenAI"는 찾지 못함)
+- 한국어는 띄어쓰기 단위가 한 단어이므로 "AI규제"는 "ai"가 아니라 "ai규제"로 시작하는 검색에만 걸립니다.
+- 1글자 조각은 버리고 2글자 영문/숫자 조각은 정확히 같은 단어만 찾습니다. (예: "U.S." -> 검색어 없음, "O'Reilly" -> reilly:*, "AI" -> ai)
+"""
+import re
+from typing import List, Optional
+from sqlalchemy import func
+from app.core.models import CollectedItem
+
+# tsquery에 넣을 수 있는 단어 문자만 추출 (&, |, !, : 등 연산자 문자는 제거)
+_WORD_PATTERN = re.compile(r"\w+")
+
+# 이보다 짧은 영문/숫자 조각은 접두 일치 대신 정확히 같은 단어로 찾음 (기본값: 3, "ai:*"가 aid/air/airbnb까지 잡지 않도록)
+# 한국어는 2글자 단어에도 조사가 붙으므로(규제를, 규제가) 계속 접두 일치
+MIN_PREFIX_LENGTH = 3
+# 이보다 짧은 조각은 검색어에서 제외 (기본값: 2, "U.S." / "C++" / "O'Reilly"가 u:* / c:* / o:*가 되지 않도록)
+MIN_FRAGMENT_LENGTH = 2
+
+
+def _lexeme(word: str) -> str:
+    if len(word) < MIN_PREFIX_LENGTH and word.isascii():
+        return word
+    return f"{word}:*"
+
+
+def build_prefix_tsquery(keywords: List[str]) -> Optional[str]:
+    """
+    키워드 목록을 접두 일치 tsquery 문자열로 만듭니다.
+    키워드 안의 단어는 AND, 키워드끼리는 OR로 묶습니다. (예: ["AI safety", "규제"] -> "(ai & safety:*) | (규제:*)")
+    1글자 조각은 버리고, 3글자 미만 영문/숫자 조각은 접두 일치 없이 정확히 같은 단어로 찾습니다.
+
+    Returns:
+        tsquery 문자열, 검색할 단어가 없으면 None
+    """
+    clauses = []
+    for keyword in keywords:
+        words = [
+            word for word in _WORD_PATTERN.findall((keyword or "").lower())
+            if len(word) >= MIN_FRAGMENT_LENGTH
+        ]
+        if words:
+            clauses.append("(" + " & ".join(_lexeme(word) for word in words) + ")")
+    if not clauses:
+        return None
+    return " | ".join(dict.fromkeys(clauses))
+
+
+def keyword_search_condition(keywords: List[str]):
+    """
+    제목이나 내용에 키워드(로 시작하는 단어)가 들어 있는 아이템을 찾는 조건을 만듭니다.
+    (search_vector GIN 인덱스 사용, 단어 중간의 일치는 찾지 못함 - 모듈 설명 참고)
+
+    Args:
+        keywords: 토픽 키워드 목록
+
+    Returns:
+        SQLAlchemy 조건식, 검색할 단어가 없으면 None
+    """
+    query = build_prefix_tsquery(keywords)
+    if query is None:
+        return None
+    return CollectedItem.search_vector.op("@@")(func.to_tsquery("simple", query))
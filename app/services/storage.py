@@ -5,32 +5,24 @@ import logging
 import sys
 import asyncio
 import os
-import psutil
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, delete, text
+from sqlalchemy import select, update, bindparam, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.core.database import AsyncSessionLocal
-from app.core.models import CollectedItem
+from app.core.models import CollectedItem, AnalysisResult, IssueRanking
+from app.services.retention import note_items_inserted, get_storage_stats
+from app.services.dedup import compute_dedup_key, build_engagement_sample, merge_engagement_history
+from app.services.ranking import compute_interest_score
 
 logger = logging.getLogger("hourly_pulse")
 
-# 최대 저장 개수 (환경 변수로 설정 가능, 기본값: 50,000개)
-MAX_STORED_ITEMS = int(os.getenv("MAX_STORED_ITEMS", "50000"))
-
-# 최대 컨테이너 메모리 용량 (GB, 환경 변수로 설정 가능, 기본값: 7.5GB)
-# Docker 컨테이너 메모리 제한에 맞춰 설정
-MAX_CONTAINER_MEMORY_GB = float(os.getenv("MAX_CONTAINER_MEMORY_GB", "7.5"))
-
-# 메모리 사용량 임계값 (이 비율을 초과하면 정리 시작, 기본값: 80%)
-MEMORY_USAGE_THRESHOLD = float(os.getenv("MEMORY_USAGE_THRESHOLD", "0.8"))
-
-# 최대 디스크 용량 (GB, 환경 변수로 설정 가능, 기본값: 800GB)
-# Docker 제한이 1006.85GB이므로 80%인 800GB를 기본값으로 설정
-MAX_DISK_SIZE_GB = float(os.getenv("MAX_DISK_SIZE_GB", "800"))
-
-# 디스크 용량 임계값 (이 비율을 초과하면 정리 시작, 기본값: 80%)
-DISK_USAGE_THRESHOLD = float(os.getenv("DISK_USAGE_THRESHOLD", "0.8"))
+# 다중 행 INSERT 한 번에 보낼 최대 행 수 (PostgreSQL 파라미터 수 제한 65535개 이내, 기본값: 1,000행)
+BULK_INSERT_CHUNK_SIZE = int(os.getenv("BULK_INSERT_CHUNK_SIZE", "1000"))
+# 수집 데이터 저장을 직렬화하는 트랜잭션 advisory lock 키 (겹쳐 실행된 주기가 같은 dedup_key를 중복 INSERT하지 않도록)
+INGEST_ADVISORY_LOCK_KEY = 0x48505F494E47  # "HP_ING"
 
 def check_event_loop():
     """
@@ -50,369 +42,208 @@ def check_event_loop():
             pass
 
 
-async def get_container_memory_usage_gb() -> Optional[float]:
+def _parse_collected_at(value: Any) -> datetime:
     """
-    Docker 컨테이너의 현재 메모리 사용량을 GB 단위로 반환합니다.
-    
-    Returns:
-        메모리 사용량 (GB), 실패 시 None
+    아이템의 collected_at 값을 datetime으로 변환합니다. (실패 시 현재 시각)
     """
-    try:
-        # 프로세스의 메모리 사용량 확인 (RSS - Resident Set Size)
-        process = psutil.Process()
-        memory_bytes = process.memory_info().rss
-        
-        # GB로 변환
-        memory_gb = memory_bytes / (1024 ** 3)
-        return memory_gb
-    except Exception as e:
-        logger.error(f"❌ 컨테이너 메모리 사용량 조회 실패: {type(e).__name__} - {e}")
-        return None
+    if value and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return datetime.now()
+    return datetime.now()
 
 
-async def get_database_size_gb(session: AsyncSession) -> float:
+def _build_extra_data(item: Dict[str, Any]) -> Dict[str, Any]:
     """
-    데이터베이스의 현재 크기를 GB 단위로 반환합니다.
-    
-    Args:
-        session: 데이터베이스 세션
-    
-    Returns:
-        데이터베이스 크기 (GB)
+    아이템의 추가 데이터(extra_data)를 구성합니다.
     """
-    try:
-        # PostgreSQL의 pg_database_size 함수를 사용하여 데이터베이스 크기 확인
-        # 현재 데이터베이스 이름을 가져옴
-        db_name_result = await session.execute(text("SELECT current_database()"))
-        db_name = db_name_result.scalar()
-        
-        # 데이터베이스 크기 조회 (바이트 단위)
-        size_result = await session.execute(
-            text(f"SELECT pg_database_size('{db_name}')")
-        )
-        size_bytes = size_result.scalar() or 0
-        
-        # GB로 변환
-        size_gb = size_bytes / (1024 ** 3)
-        return size_gb
-    except Exception as e:
-        logger.error(f"❌ 데이터베이스 크기 조회 실패: {type(e).__name__} - {e}")
-        return 0.0
+    return {
+        "upvotes": item.get("upvotes"),
+        "likes": item.get("likes"),
+        "views": item.get("views"),
+        "comments": item.get("comments"),
+        "retweets": item.get("retweets"),
+        "stars": item.get("stars"),
+        "subreddit": item.get("subreddit"),
+        "channel": item.get("channel"),
+        "published": item.get("published_at") or item.get("published"),
+        **{k: v for k, v in item.items() if k not in [
+            "source", "title", "description", "content", "url",
+            "upvotes", "likes", "views", "comments", "retweets",
+            "stars", "subreddit", "channel", "published_at", "published",
+            "collected_at"
+        ]}
+    }
 
 
-async def cleanup_by_memory_usage(session: AsyncSession, max_memory_gb: float = MAX_CONTAINER_MEMORY_GB, threshold: float = MEMORY_USAGE_THRESHOLD) -> int:
+def _build_ingest_rows(
+    batches: List[Tuple[str, str, List[Dict[str, Any]]]]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
     """
-    컨테이너 메모리 사용량이 임계값을 초과하면 가장 오래된 데이터부터 삭제합니다.
+    수집 결과를 INSERT용 행 딕셔너리로 변환합니다. (ORM 객체를 만들지 않음)
+    같은 중복 제거 키는 한 행으로 합치고 참여도 샘플만 누적합니다.
+    관심도 점수는 여기서 한 번 계산해 행(interest_score)과 참여도 샘플("score")에 함께 저장합니다.
     
     Args:
-        session: 데이터베이스 세션
-        max_memory_gb: 최대 컨테이너 메모리 용량 (GB)
-        threshold: 메모리 사용량 임계값 비율 (0.0 ~ 1.0)
+        batches: (결과 키, 소스 타입, 아이템 리스트) 리스트
     
     Returns:
-        삭제된 아이템 수
+        (중복 제거 키별 행, 중복 제거 키별 새 샘플, 중복 제거 키별 결과 키)
     """
-    try:
-        # 현재 메모리 사용량 확인
-        current_memory_gb = await get_container_memory_usage_gb()
-        
-        if current_memory_gb is None:
-            logger.warning("⚠️ 메모리 사용량을 확인할 수 없어 메모리 기반 정리를 건너뜁니다.")
-            return 0
-        
-        threshold_memory_gb = max_memory_gb * threshold
-        
-        logger.info(f"💾 현재 컨테이너 메모리 사용량: {current_memory_gb:.2f}GB / 최대 {max_memory_gb:.2f}GB (임계값: {threshold_memory_gb:.2f}GB)")
-        
-        if current_memory_gb < threshold_memory_gb:
-            return 0
-        
-        # 임계값을 초과한 경우, 목표 메모리 사용량까지 삭제
-        # 목표 메모리는 임계값의 70%로 설정 (여유 공간 확보)
-        target_memory_gb = max_memory_gb * 0.7
-        
-        deleted_total = 0
-        batch_size = 1000  # 한 번에 삭제할 개수
-        max_iterations = 50  # 무한 루프 방지
-        
-        iteration = 0
-        while current_memory_gb > target_memory_gb and iteration < max_iterations:
-            iteration += 1
-            
-            # 가장 오래된 아이템들의 ID 조회
-            old_items_query = (
-                select(CollectedItem.id)
-                .order_by(CollectedItem.collected_at.asc())
-                .limit(batch_size)
-            )
-            old_items_result = await session.execute(old_items_query)
-            old_item_ids = [row[0] for row in old_items_result.all()]
-            
-            if not old_item_ids:
-                break
-            
-            # 삭제 실행
-            delete_result = await session.execute(
-                delete(CollectedItem).where(CollectedItem.id.in_(old_item_ids))
-            )
-            deleted_count = delete_result.rowcount
-            deleted_total += deleted_count
-            
-            # 세션 커밋
-            await session.commit()
-            
-            # 삭제 후 메모리 사용량 다시 확인
-            current_memory_gb = await get_container_memory_usage_gb()
-            if current_memory_gb is None:
-                logger.warning("⚠️ 메모리 사용량 확인 실패, 정리 중단")
-                break
+    rows: Dict[str, Dict[str, Any]] = {}
+    samples: Dict[str, List[Dict[str, Any]]] = {}
+    owners: Dict[str, str] = {}
+    
+    for source_key, source_type, items in batches:
+        for item in items:
+            collected_at = _parse_collected_at(item.get("collected_at"))
+            dedup_key = compute_dedup_key(item, source_type)
+            previous = rows.get(dedup_key)
             
-            logger.info(f"🗑️ {deleted_count}개 삭제 후 메모리 사용량: {current_memory_gb:.2f}GB (목표: {target_memory_gb:.2f}GB)")
+            title = item.get("title", "")
+            content = item.get("description") or item.get("content", "")
+            extra_data = _build_extra_data(item)
+            interest_score = compute_interest_score(source_type, extra_data, title or "", content or "")
             
-            # 더 이상 삭제할 데이터가 없으면 중단
-            if deleted_count == 0:
-                break
-        
-        if deleted_total > 0:
-            logger.info(f"🗑️ 메모리 사용량 기반 정리 완료: 총 {deleted_total}개 삭제 (최종 메모리: {current_memory_gb:.2f}GB)")
-        
-        return deleted_total
-    except Exception as e:
-        logger.error(f"❌ 메모리 사용량 기반 정리 실패: {type(e).__name__} - {e}")
-        return 0
+            rows[dedup_key] = {
+                "source": item.get("source", "Unknown"),
+                "source_type": source_type,
+                "title": title,
+                "content": content,
+                "url": item.get("url", ""),
+                "extra_data": extra_data,
+                "collected_at": collected_at,
+                "dedup_key": dedup_key,
+                "first_seen_at": previous["first_seen_at"] if previous else collected_at,
+                "interest_score": interest_score,
+            }
+            sample = build_engagement_sample(item, collected_at)
+            sample["score"] = interest_score
+            samples.setdefault(dedup_key, []).append(sample)
+            owners[dedup_key] = source_key
+    
+    return rows, samples, owners
 
 
-async def cleanup_by_disk_size(session: AsyncSession, max_size_gb: float = MAX_DISK_SIZE_GB, threshold: float = DISK_USAGE_THRESHOLD) -> int:
+async def _bulk_upsert_items(
+    session: AsyncSession,
+    batches: List[Tuple[str, str, List[Dict[str, Any]]]]
+) -> Dict[str, Dict[str, int]]:
     """
-    디스크 용량이 임계값을 초과하면 가장 오래된 데이터부터 삭제합니다.
+    한 수집 주기의 모든 아이템을 일괄 UPDATE(executemany) + 다중 행 INSERT ... RETURNING으로 저장합니다.
+    BULK_INSERT_CHUNK_SIZE행당 기존 게시물 조회 1회, UPDATE 1회, INSERT 1회만 실행합니다.
+    (커밋과 저장 직렬화 advisory lock은 호출자가 수행)
     
     Args:
         session: 데이터베이스 세션
-        max_size_gb: 최대 디스크 용량 (GB)
-        threshold: 용량 임계값 비율 (0.0 ~ 1.0)
+        batches: (결과 키, 소스 타입, 아이템 리스트) 리스트
     
     Returns:
-        삭제된 아이템 수
+        결과 키별 {"inserted": 신규 수, "updated": 갱신 수}
     """
-    try:
-        # 현재 데이터베이스 크기 확인
-        current_size_gb = await get_database_size_gb(session)
-        threshold_size_gb = max_size_gb * threshold
-        
-        logger.info(f"💾 현재 데이터베이스 크기: {current_size_gb:.2f}GB / 최대 {max_size_gb:.2f}GB (임계값: {threshold_size_gb:.2f}GB)")
-        
-        if current_size_gb < threshold_size_gb:
-            return 0
-        
-        # 임계값을 초과한 경우, 목표 크기까지 삭제
-        # 목표 크기는 임계값의 70%로 설정 (여유 공간 확보)
-        target_size_gb = max_size_gb * 0.7
-        
-        # 삭제할 데이터 양 계산 (대략적으로)
-        # 각 아이템의 평균 크기를 추정하여 삭제할 개수 계산
-        # 실제로는 반복적으로 삭제하면서 크기를 확인
-        deleted_total = 0
-        batch_size = 1000  # 한 번에 삭제할 개수
-        
-        while current_size_gb > target_size_gb:
-            # 가장 오래된 아이템들의 ID 조회
-            old_items_query = (
-                select(CollectedItem.id)
-                .order_by(CollectedItem.collected_at.asc())
-                .limit(batch_size)
-            )
-            old_items_result = await session.execute(old_items_query)
-            old_item_ids = [row[0] for row in old_items_result.all()]
-            
-            if not old_item_ids:
-                break
-            
-            # 삭제 실행
-            delete_result = await session.execute(
-                delete(CollectedItem).where(CollectedItem.id.in_(old_item_ids))
-            )
-            deleted_count = delete_result.rowcount
-            deleted_total += deleted_count
-            
-            # 세션 커밋
-            await session.commit()
-            
-            # 삭제 후 크기 다시 확인
-            current_size_gb = await get_database_size_gb(session)
-            logger.info(f"🗑️ {deleted_count}개 삭제 후 데이터베이스 크기: {current_size_gb:.2f}GB (목표: {target_size_gb:.2f}GB)")
-            
-            # 더 이상 삭제할 데이터가 없으면 중단
-            if deleted_count == 0:
-                break
-        
-        if deleted_total > 0:
-            logger.info(f"🗑️ 디스크 용량 정리 완료: 총 {deleted_total}개 삭제 (최종 크기: {current_size_gb:.2f}GB)")
-        
-        return deleted_total
-    except Exception as e:
-        logger.error(f"❌ 디스크 용량 기반 정리 실패: {type(e).__name__} - {e}")
-        return 0
-
-
-async def cleanup_old_items(session: AsyncSession, max_items: int = MAX_STORED_ITEMS) -> int:
-    """
-    데이터베이스에 저장된 아이템이 최대 개수를 초과하면 가장 오래된 데이터부터 삭제합니다.
+    counts = {source_key: {"inserted": 0, "updated": 0} for source_key, _, _ in batches}
+    rows, samples, owners = _build_ingest_rows(batches)
+    if not rows:
+        return counts
     
-    Args:
-        session: 데이터베이스 세션
-        max_items: 최대 저장 개수
+    table = CollectedItem.__table__
+    dedup_keys = list(rows.keys())
     
-    Returns:
-        삭제된 아이템 수
-    """
-    try:
-        # 현재 저장된 아이템 개수 확인
-        count_result = await session.execute(select(func.count(CollectedItem.id)))
-        current_count = count_result.scalar() or 0
-        
-        if current_count <= max_items:
-            return 0
-        
-        # 삭제할 개수 계산
-        items_to_delete = current_count - max_items
-        
-        # 가장 오래된 아이템부터 삭제 (collected_at 기준 오름차순)
-        # 먼저 삭제할 아이템들의 ID를 조회
-        old_items_query = (
-            select(CollectedItem.id)
-            .order_by(CollectedItem.collected_at.asc())
-            .limit(items_to_delete)
-        )
-        old_items_result = await session.execute(old_items_query)
-        old_item_ids = [row[0] for row in old_items_result.all()]
-        
-        if old_item_ids:
-            # ID 목록을 사용하여 삭제
-            delete_result = await session.execute(
-                delete(CollectedItem).where(CollectedItem.id.in_(old_item_ids))
+    # 이미 저장된 게시물의 기본 키와 참여도 이력, 번역 조회 (이력 병합, 번역 유지용)
+    existing: Dict[str, Tuple[int, datetime, Any, Any]] = {}
+    for i in range(0, len(dedup_keys), BULK_INSERT_CHUNK_SIZE):
+        chunk_keys = dedup_keys[i:i + BULK_INSERT_CHUNK_SIZE]
+        result = await session.execute(
+            select(
+                table.c.dedup_key, table.c.id, table.c.collected_at, table.c.engagement_history,
+                table.c.title, table.c.content, table.c.translations
             )
-            deleted_count = delete_result.rowcount
+            .where(table.c.dedup_key.in_(chunk_keys))
+        )
+        for dedup_key, item_id, collected_at, history, title, content, translations in result.all():
+            # 제목/내용이 그대로면 기존 번역 유지, 바뀌었으면 다음 번역 단계에서 다시 번역
+            existing[dedup_key] = (item_id, collected_at, history, (title, content, translations))
+    
+    # collected_items는 collected_at 파티션 테이블이라 dedup_key에 UNIQUE 제약(ON CONFLICT)을 둘 수 없으므로
+    # 기존 게시물은 기본 키 (id, collected_at)로 일괄 UPDATE, 나머지는 다중 행 INSERT
+    updates = []
+    inserts = []
+    for dedup_key, row in rows.items():
+        previous = existing.get(dedup_key)
+        if previous is not None:
+            item_id, previous_collected_at, history, (title, content, translations) = previous
+            if (title, content) != (row["title"], row["content"]):
+                translations = None
+            updates.append({
+                "b_id": item_id,
+                "b_collected_at": previous_collected_at,
+                "source": row["source"],
+                "title": row["title"],
+                "content": row["content"],
+                "extra_data": row["extra_data"],
+                "collected_at": row["collected_at"],
+                "engagement_history": merge_engagement_history(history, samples[dedup_key]),
+                "interest_score": row["interest_score"],
+                "translations": translations,
+            })
+            counts[owners[dedup_key]]["updated"] += 1
         else:
-            deleted_count = 0
-        
-        if deleted_count > 0:
-            logger.info(f"🗑️ 오래된 데이터 {deleted_count}개 삭제 (최대 저장 개수: {max_items}개 유지)")
-        
-        return deleted_count
-    except Exception as e:
-        logger.error(f"❌ 오래된 데이터 삭제 실패: {type(e).__name__} - {e}")
-        return 0
+            row["engagement_history"] = merge_engagement_history(None, samples[dedup_key])
+            inserts.append(row)
+    
+    if updates:
+        # 수집 시각이 바뀌어 날짜가 넘어가면 PostgreSQL이 행을 새 파티션으로 옮김
+        # WHERE 절 외의 파라미터 키(source, title 등)가 SET 절이 됨
+        update_stmt = update(table).where(
+            table.c.id == bindparam("b_id"),
+            table.c.collected_at == bindparam("b_collected_at")
+        )
+        for i in range(0, len(updates), BULK_INSERT_CHUNK_SIZE):
+            await session.execute(update_stmt, updates[i:i + BULK_INSERT_CHUNK_SIZE])
+    
+    for i in range(0, len(inserts), BULK_INSERT_CHUNK_SIZE):
+        stmt = pg_insert(table).values(inserts[i:i + BULK_INSERT_CHUNK_SIZE]).returning(table.c.dedup_key)
+        result = await session.execute(stmt)
+        for (dedup_key,) in result.all():
+            counts[owners[dedup_key]]["inserted"] += 1
+    
+    return counts
 
 
 async def save_collected_items(items: List[Dict[str, Any]], source_type: str) -> int:
     """
     수집된 아이템들을 데이터베이스에 저장합니다.
+    이미 저장된 게시물(같은 중복 제거 키)은 새 행을 만들지 않고 최신 참여도 지표로 갱신합니다.
     
     Args:
         items: 수집된 아이템 리스트
         source_type: 소스 타입 (예: "reddit", "news", "github", "youtube")
     
     Returns:
-        저장된 아이템 수
+        저장(신규 + 갱신)된 아이템 수
     """
-    # 이벤트 루프 확인
-    check_event_loop()
-    
     if not items:
         return 0
     
-    saved_count = 0
-    async with AsyncSessionLocal() as session:
-        try:
-            # 저장 전에 메모리 사용량 기반 정리 (최우선순위)
-            deleted_by_memory = await cleanup_by_memory_usage(session, MAX_CONTAINER_MEMORY_GB, MEMORY_USAGE_THRESHOLD)
-            
-            # 저장 전에 디스크 용량 기반 정리 (우선순위 2)
-            deleted_by_size = await cleanup_by_disk_size(session, MAX_DISK_SIZE_GB, DISK_USAGE_THRESHOLD)
-            
-            # 저장 전에 오래된 데이터 정리 (최대 개수 초과 시, 우선순위 3)
-            deleted_by_count = await cleanup_old_items(session, MAX_STORED_ITEMS)
-            
-            for item in items:
-                # 중복 체크 없이 모든 데이터 저장
-                url = item.get("url", "")
-                title = item.get("title", "")
-                
-                # collected_at 파싱
-                collected_at_str = item.get("collected_at")
-                if collected_at_str:
-                    try:
-                        if isinstance(collected_at_str, str):
-                            collected_at = datetime.fromisoformat(collected_at_str.replace('Z', '+00:00'))
-                        else:
-                            collected_at = datetime.now()
-                    except:
-                        collected_at = datetime.now()
-                else:
-                    collected_at = datetime.now()
-                
-                # CollectedItem 생성
-                collected_item = CollectedItem(
-                    source=item.get("source", "Unknown"),
-                    source_type=source_type,
-                    title=title,
-                    content=item.get("description") or item.get("content", ""),
-                    url=url,
-                    extra_data={
-                        "upvotes": item.get("upvotes"),
-                        "likes": item.get("likes"),
-                        "views": item.get("views"),
-                        "comments": item.get("comments"),
-                        "retweets": item.get("retweets"),
-                        "stars": item.get("stars"),
-                        "subreddit": item.get("subreddit"),
-                        "channel": item.get("channel"),
-                        "published": item.get("published_at") or item.get("published"),
-                        **{k: v for k, v in item.items() if k not in [
-                            "source", "title", "description", "content", "url",
-                            "upvotes", "likes", "views", "comments", "retweets",
-                            "stars", "subreddit", "channel", "published_at", "published",
-                            "collected_at"
-                        ]}
-                    },
-                    collected_at=collected_at
-                )
-                
-                session.add(collected_item)
-                saved_count += 1
-            
-            await session.commit()
-            
-            # 저장 후 현재 데이터 개수, 디스크 용량, 메모리 사용량 확인
-            count_result = await session.execute(select(func.count(CollectedItem.id)))
-            total_count = count_result.scalar() or 0
-            db_size_gb = await get_database_size_gb(session)
-            memory_gb = await get_container_memory_usage_gb()
-            memory_info = f", 메모리: {memory_gb:.2f}GB" if memory_gb is not None else ""
-            
-            logger.info(f"💾 {source_type} 데이터 저장 완료: {saved_count}개 저장 (총 {len(items)}개 중, 현재 DB 총 {total_count}개, 크기: {db_size_gb:.2f}GB{memory_info})")
-            
-        except Exception as e:
-            await session.rollback()
-            logger.error(f"❌ {source_type} 데이터 저장 실패: {type(e).__name__} - {e}")
-            raise
-    
-    return saved_count
+    save_results = await save_all_collected_data({source_type: items})
+    return save_results.get(source_type, 0)
 
 
 async def save_all_collected_data(collected_data: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
     """
-    모든 수집된 데이터를 데이터베이스에 저장합니다.
+    모든 수집된 데이터를 하나의 트랜잭션으로 데이터베이스에 저장합니다.
     
     Args:
         collected_data: 소스별로 분류된 수집 데이터 딕셔너리
     
     Returns:
-        소스별 저장된 아이템 수 딕셔너리
+        소스별 저장(신규 + 갱신)된 아이템 수 딕셔너리
     """
-    logger.info("💾 데이터베이스 저장 시작...")
+    # 이벤트 루프 확인
+    check_event_loop()
     
-    save_results = {}
+    logger.info("💾 데이터베이스 저장 시작...")
     
     # 각 소스 타입별로 저장
     source_type_mapping = {
@@ -423,15 +254,40 @@ async def save_all_collected_data(collected_data: Dict[str, List[Dict[str, Any]]
         "youtube": "youtube"
     }
     
-    for source_key, items in collected_data.items():
-        if items:
-            source_type = source_type_mapping.get(source_key, source_key)
-            try:
-                saved_count = await save_collected_items(items, source_type)
-                save_results[source_key] = saved_count
-            except Exception as e:
-                logger.error(f"❌ {source_key} 저장 중 오류: {e}")
-                save_results[source_key] = 0
+    batches = [
+        (source_key, source_type_mapping.get(source_key, source_key), items)
+        for source_key, items in collected_data.items() if items
+    ]
+    save_results = {source_key: 0 for source_key, _, _ in batches}
+    if not batches:
+        return save_results
+    
+    async with AsyncSessionLocal() as session:
+        try:
+            # 한 주기 전체를 하나의 트랜잭션으로 일괄 저장
+            # (보존 정리는 별도 스케줄러 작업에서 실행, 저장 경로는 INSERT만 수행)
+            started = time.perf_counter()
+            # 다른 주기의 저장이 커밋될 때까지 대기 (커밋/롤백 시 자동 해제, 이후 조회에서 기존 아이템으로 보임)
+            await session.execute(select(func.pg_advisory_xact_lock(INGEST_ADVISORY_LOCK_KEY)))
+            counts = await _bulk_upsert_items(session, batches)
+            await session.commit()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            
+            for source_key, count in counts.items():
+                save_results[source_key] = count["inserted"] + count["updated"]
+                logger.info(f"💾 {source_key} 데이터 저장 완료: 신규 {count['inserted']}개, 갱신 {count['updated']}개")
+            
+            note_items_inserted(sum(count["inserted"] for count in counts.values()))
+            
+            # 현재 데이터 개수와 크기는 보존 정리 작업이 캐시한 값 사용 (추가 쿼리 없음)
+            storage_stats = get_storage_stats()
+            total_items = sum(len(items) for _, _, items in batches)
+            logger.info(f"💾 일괄 저장 완료: {total_items}개 아이템, {elapsed_ms:.1f}ms (현재 DB 총 {storage_stats['row_count']}개, 크기: {storage_stats['db_size_gb'] or 0.0:.2f}GB)")
+            
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"❌ 데이터 일괄 저장 실패: {type(e).__name__} - {e}")
+            raise
     
     total_saved = sum(save_results.values())
     logger.info(f"💾 전체 저장 완료! 총 {total_saved}개 아이템 저장됨")
@@ -469,3 +325,54 @@ async def get_recent_items(source_type: str = None, limit: int = 10) -> List[Col
             logger.error(f"❌ 데이터 조회 실패: {type(e).__name__} - {e}")
             return []
 
+
+async def get_collection_stats() -> Dict[str, Any]:
+    """
+    수집/분석/랭킹 통계를 조회합니다. (/stats 응답과 실시간 푸시에서 사용)
+    
+    Returns:
+        통계 정보 딕셔너리
+    """
+    async with AsyncSessionLocal() as session:
+        # 수집 데이터 통계 (보존 정리 작업이 캐시한 행 개수 우선 사용)
+        total_collected = get_storage_stats()["row_count"]
+        if total_collected is None:
+            collected_count = await session.execute(
+                select(func.count(CollectedItem.id))
+            )
+            total_collected = collected_count.scalar() or 0
+        
+        # 소스 타입별 통계
+        source_stats = await session.execute(
+            select(
+                CollectedItem.source_type,
+                func.count(CollectedItem.id)
+            ).group_by(CollectedItem.source_type)
+        )
+        source_counts = {source: count for source, count in source_stats}
+        
+        # 분석 결과 통계
+        analysis_count = await session.execute(
+            select(func.count(AnalysisResult.id))
+        )
+        total_analysis = analysis_count.scalar() or 0
+        
+        # 랭킹 통계
+        ranking_count = await session.execute(
+            select(func.count(IssueRanking.id))
+        )
+        total_rankings = ranking_count.scalar() or 0
+        
+        # 최근 수집 시간
+        latest_collected = await session.execute(
+            select(func.max(CollectedItem.collected_at))
+        )
+        latest_collected_time = latest_collected.scalar()
+        
+        return {
+            "total_collected": total_collected,
+            "source_counts": source_counts,
+            "total_analysis": total_analysis,
+            "total_rankings": total_rankings,
+            "latest_collected": latest_collected_time.isoformat() if latest_collected_time else None,
+        }
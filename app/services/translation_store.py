@@ -0,0 +1,212 @@
+"""
+번역 결과 저장소
+원문 전체의 해시를 키로 하는 크기 제한 LRU 메모리 캐시와, 모든 워커가 공유하는
+PostgreSQL 영구 캐시(translation_cache 테이블) 두 단계로 구성됩니다.
+같은 텍스트는 서버 재시작이나 워커 수와 무관하게 한 번만 번역합니다.
+"""
+import os
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.core.database import AsyncSessionLocal
+from app.core.models import TranslationCache
+from app.core.memory_pressure import register_reclaimer
+
+logger = logging.getLogger("hourly_pulse")
+
+# 메모리 LRU 캐시 최대 항목 수 (기본값: 5,000개)
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "5000"))
+
+# 일괄 조회(IN) / 일괄 저장(다중 행 INSERT) 한 번에 보낼 최대 키 수 (기본값: 1,000개)
+TRANSLATION_DB_CHUNK_SIZE = int(os.getenv("TRANSLATION_DB_CHUNK_SIZE", "1000"))
+
+# 번역 키 -> 번역된 텍스트 (가장 최근에 사용한 항목이 끝)
+_lru: "OrderedDict[str, str]" = OrderedDict()
+
+_stats: Dict[str, int] = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "evictions": 0,
+    "db_writes": 0,
+    "db_errors": 0,
+}
+
+
+def translation_key(text: str, target_language: str) -> str:
+    """
+    목표 언어와 원문 전체로 번역 캐시 키를 만듭니다. (앞부분만 같은 텍스트끼리 충돌하지 않음)
+    """
+    return hashlib.sha256(f"{target_language}:{text}".encode("utf-8")).hexdigest()
+
+
+def _remember(key: str, translated: str) -> None:
+    """
+    메모리 LRU에 저장하고, 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 제거합니다.
+    """
+    _lru[key] = translated
+    _lru.move_to_end(key)
+    while len(_lru) > TRANSLATION_CACHE_MAX_ENTRIES:
+        _lru.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+def _reclaim_lru() -> int:
+    """
+    메모리 압박 시 메모리 LRU를 비웁니다. (영구 캐시에 남아 있으므로 다시 번역하지 않음)
+    """
+    count = len(_lru)
+    _lru.clear()
+    return count
+
+
+register_reclaimer("translation_cache", lambda: len(_lru), _reclaim_lru)
+
+
+async def get_translation(text: str, target_language: str) -> Optional[str]:
+    """
+    저장된 번역을 메모리 -> 데이터베이스 순으로 찾습니다.
+
+    Returns:
+        번역된 텍스트, 없으면 None
+    """
+    key = translation_key(text, target_language)
+    if key in _lru:
+        _lru.move_to_end(key)
+        _stats["memory_hits"] += 1
+        return _lru[key]
+
+    try:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(TranslationCache.translated).where(TranslationCache.text_hash == key)
+            )
+            translated = result.scalar()
+    except Exception as e:
+        _stats["db_errors"] += 1
+        logger.warning(f"⚠️ 번역 캐시 조회 실패, 메모리 캐시만 사용: {type(e).__name__} - {e}")
+        translated = None
+
+    if translated is None:
+        _stats["misses"] += 1
+        return None
+
+    _stats["db_hits"] += 1
+    _remember(key, translated)
+    return translated
+
+
+async def save_translation(text: str, target_language: str, translated: str, persist: bool = True) -> None:
+    """
+    번역 결과를 저장합니다.
+
+    Args:
+        text: 원문
+        target_language: 목표 언어
+        translated: 번역된 텍스트
+        persist: False면 메모리에만 저장 (번역하지 않은 원문 반환 등 API 비용이 없는 결과)
+    """
+    key = translation_key(text, target_language)
+    _remember(key, translated)
+    if not persist:
+        return
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                pg_insert(TranslationCache)
+                .values(text_hash=key, target_language=target_language, translated=translated)
+                .on_conflict_do_nothing(index_elements=["text_hash"])
+            )
+            await session.commit()
+        _stats["db_writes"] += 1
+    except Exception as e:
+        _stats["db_errors"] += 1
+        logger.warning(f"⚠️ 번역 캐시 저장 실패: {type(e).__name__} - {e}")
+
+
+async def get_translations_many(texts: List[str], target_language: str) -> Dict[str, str]:
+    """
+    여러 텍스트의 저장된 번역을 한 번에 찾습니다.
+    메모리 LRU에 없는 텍스트만 모아 데이터베이스를 WHERE text_hash IN (...) 조회 한 번으로 확인합니다.
+
+    Returns:
+        원문 -> 번역된 텍스트 (저장된 번역이 없는 원문은 빠짐)
+    """
+    found: Dict[str, str] = {}
+    missing: Dict[str, str] = {}
+    for text in dict.fromkeys(texts):
+        key = translation_key(text, target_language)
+        if key in _lru:
+            _lru.move_to_end(key)
+            _stats["memory_hits"] += 1
+            found[text] = _lru[key]
+        else:
+            missing[key] = text
+
+    keys = list(missing)
+    stored: Dict[str, str] = {}
+    try:
+        async with AsyncSessionLocal() as session:
+            for i in range(0, len(keys), TRANSLATION_DB_CHUNK_SIZE):
+                result = await session.execute(
+                    select(TranslationCache.text_hash, TranslationCache.translated)
+                    .where(TranslationCache.text_hash.in_(keys[i:i + TRANSLATION_DB_CHUNK_SIZE]))
+                )
+                stored.update(result.all())
+    except Exception as e:
+        _stats["db_errors"] += 1
+        logger.warning(f"⚠️ 번역 캐시 일괄 조회 실패, 메모리 캐시만 사용: {type(e).__name__} - {e}")
+
+    for key, text in missing.items():
+        translated = stored.get(key)
+        if translated is None:
+            _stats["misses"] += 1
+            continue
+        _stats["db_hits"] += 1
+        _remember(key, translated)
+        found[text] = translated
+    return found
+
+
+async def save_translations_many(translations: Dict[str, str], target_language: str, persist: bool = True) -> None:
+    """
+    여러 번역 결과를 다중 행 INSERT 한 번(키 TRANSLATION_DB_CHUNK_SIZE개 단위)과 커밋 한 번으로 저장합니다.
+
+    Args:
+        translations: 원문 -> 번역된 텍스트
+        target_language: 목표 언어
+        persist: False면 메모리에만 저장
+    """
+    rows = {}
+    for text, translated in translations.items():
+        key = translation_key(text, target_language)
+        _remember(key, translated)
+        rows[key] = {"text_hash": key, "target_language": target_language, "translated": translated}
+    if not persist or not rows:
+        return
+
+    values = list(rows.values())
+    try:
+        async with AsyncSessionLocal() as session:
+            for i in range(0, len(values), TRANSLATION_DB_CHUNK_SIZE):
+                await session.execute(
+                    pg_insert(TranslationCache)
+                    .values(values[i:i + TRANSLATION_DB_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=["text_hash"])
+                )
+            await session.commit()
+        _stats["db_writes"] += len(values)
+    except Exception as e:
+        _stats["db_errors"] += 1
+        logger.warning(f"⚠️ 번역 캐시 일괄 저장 실패: {type(e).__name__} - {e}")
+
+
+def get_translation_cache_stats() -> Dict[str, int]:
+    """
+    번역 캐시 적중/미스/제거 통계를 반환합니다.
+    """
+    return {**_stats, "memory_entries": len(_lru), "max_entries": TRANSLATION_CACHE_MAX_ENTRIES}
@@ -4,27 +4,25 @@
 import os
 import logging
 import asyncio
-from typing import Optional, Dict
+import json
+from typing import Optional, List, Dict
 from functools import lru_cache
-import google.generativeai as genai
 from dotenv import load_dotenv
+from app.core.llm_client import generate_content, estimate_tokens, is_available as llm_available
+from app.services.translation_store import get_translation, save_translation, get_translations_many, save_translations_many
+from app.services.language import detect_language, detect_languages, is_target_language
 
 load_dotenv()
 logger = logging.getLogger("hourly_pulse")
 
-# 간단한 번역 캐시 (메모리 기반)
-_translation_cache: Dict[str, str] = {}
+# 일괄 번역 한 번의 호출에 담을 입력 토큰 예산 (기본값: 3,000 토큰)
+TRANSLATION_BATCH_TOKEN_BUDGET = int(os.getenv("TRANSLATION_BATCH_TOKEN_BUDGET", "3000"))
 
-# Gemini 클라이언트 초기화
-gemini_model = None
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# 일괄 번역 한 번의 호출에 담을 최대 텍스트 수 (기본값: 50개)
+TRANSLATION_BATCH_MAX_ITEMS = int(os.getenv("TRANSLATION_BATCH_MAX_ITEMS", "50"))
 
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-    gemini_model = genai.GenerativeModel('gemini-2.0-flash-lite')
-    logger.info("✅ Gemini 번역 클라이언트 초기화 완료")
-else:
-    logger.warning("⚠️ GEMINI_API_KEY가 설정되지 않았습니다. 번역 기능이 작동하지 않습니다.")
+# 텍스트 한 개당 최대 길이 (translate_text와 동일)
+TRANSLATION_MAX_CHARS = 2000
 
 
 async def translate_text(text: str, target_language: str = "ko") -> Optional[str]:
@@ -41,23 +39,18 @@ async def translate_text(text: str, target_language: str = "ko") -> Optional[str
     if not text or len(text.strip()) < 3:
         return text  # 너무 짧은 텍스트는 번역하지 않음
     
-    # 캐시 확인
-    cache_key = f"{target_language}:{text[:100]}"
-    if cache_key in _translation_cache:
-        return _translation_cache[cache_key]
+    # 캐시 확인 (메모리 LRU -> 영구 캐시)
+    cached = await get_translation(text, target_language)
+    if cached is not None:
+        return cached
     
-    if not gemini_model:
+    if not llm_available():
         logger.warning("⚠️ Gemini 클라이언트가 초기화되지 않았습니다.")
         return text  # 번역 실패 시 원본 반환
     
     # 이미 목표 언어인지 확인 (간단한 휴리스틱)
-    if target_language == "en" and all(ord(c) < 128 for c in text[:100]):
-        # 영어로 보이는 텍스트
-        _translation_cache[cache_key] = text
-        return text
-    if target_language == "ko" and any('\uac00' <= c <= '\ud7a3' for c in text[:100]):
-        # 한글이 포함된 텍스트
-        _translation_cache[cache_key] = text
+    if is_target_language(detect_language(text), target_language):
+        await save_translation(text, target_language, text, persist=False)
         return text
     
     try:
@@ -67,40 +60,14 @@ async def translate_text(text: str, target_language: str = "ko") -> Optional[str
 Keep the meaning and tone accurate. If the text is already in {target_lang_name}, return it as is.
 
 Text to translate:
-{text[:2000]}
+{text[:TRANSLATION_MAX_CHARS]}
 
 Translation:"""
         
-        safety_settings = [
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-            {
-                "category": genai.types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                "threshold": genai.types.HarmBlockThreshold.BLOCK_NONE
-            },
-        ]
-        
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,  # 번역은 정확성이 중요
-                    max_output_tokens=1000,
-                ),
-                safety_settings=safety_settings
-            )
+        response = await generate_content(
+            prompt,
+            temperature=0.3,  # 번역은 정확성이 중요
+            max_output_tokens=1000,
         )
         
         # Gemini 응답에서 텍스트 추출
@@ -110,17 +77,17 @@ Translation:"""
                 if hasattr(candidate, 'content') and candidate.content.parts:
                     translated = candidate.content.parts[0].text.strip()
                     # 캐시에 저장
-                    _translation_cache[cache_key] = translated
+                    await save_translation(text, target_language, translated)
                     return translated
             elif hasattr(response, 'text'):
                 translated = response.text.strip()
-                _translation_cache[cache_key] = translated
+                await save_translation(text, target_language, translated)
                 return translated
         except Exception as e:
             logger.error(f"❌ 번역 응답 처리 실패: {e}")
         
-        # 번역 실패 시 원본 반환 및 캐시
-        _translation_cache[cache_key] = text
+        # 번역 실패 시 원본 반환 및 캐시 (메모리에만 저장, 재시작 후에는 다시 시도)
+        await save_translation(text, target_language, text, persist=False)
         return text
         
     except Exception as e:
@@ -128,6 +95,153 @@ Translation:"""
         return text  # 번역 실패 시 원본 반환
 
 
+def _pack_batches(texts: List[str]) -> List[List[str]]:
+    """
+    텍스트를 토큰 예산과 최대 개수 안에서 호출 단위로 묶습니다.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text[:TRANSLATION_MAX_CHARS])
+        if current and (current_tokens + tokens > TRANSLATION_BATCH_TOKEN_BUDGET or len(current) >= TRANSLATION_BATCH_MAX_ITEMS):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_batch_response(content: str, count: int) -> Dict[int, str]:
+    """
+    일괄 번역 응답(JSON 배열)을 {번호: 번역} 딕셔너리로 파싱합니다.
+    형식이 잘못된 항목은 건너뜁니다. (호출자가 개별 번역으로 대체)
+    """
+    content = content.strip()
+    # 코드 블록으로 감싼 응답 처리
+    if content.startswith("```"):
+        content = content.strip("`")
+        if content.startswith("json"):
+            content = content[4:]
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end == -1:
+        return {}
+
+    try:
+        segments = json.loads(content[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+
+    parsed: Dict[int, str] = {}
+    for segment in segments:
+        if not isinstance(segment, dict):
+            continue
+        index = segment.get("id")
+        translation = segment.get("translation")
+        if isinstance(index, int) and 0 <= index < count and isinstance(translation, str) and translation.strip():
+            parsed[index] = translation.strip()
+    return parsed
+
+
+async def _translate_batch_call(texts: List[str], target_language: str) -> Dict[int, str]:
+    """
+    텍스트 묶음을 하나의 JSON 프롬프트로 한 번에 번역합니다.
+
+    Returns:
+        {묶음 내 번호: 번역} (실패한 항목은 빠짐)
+    """
+    target_lang_name = "Korean" if target_language == "ko" else "English"
+    segments = [{"id": i, "text": text[:TRANSLATION_MAX_CHARS]} for i, text in enumerate(texts)]
+
+    prompt = f"""Translate the "text" of every segment in the following JSON array to {target_lang_name}.
+Keep the meaning and tone accurate. If a text is already in {target_lang_name}, return it as is.
+Respond only with a JSON array of objects with the same "id" and a "translation" field, one per segment, in the same order.
+
+Segments:
+{json.dumps(segments, ensure_ascii=False)}"""
+
+    response = await generate_content(
+        prompt,
+        temperature=0.3,  # 번역은 정확성이 중요
+        max_output_tokens=8000,
+        response_mime_type="application/json",
+    )
+
+    content = ""
+    if hasattr(response, 'candidates') and response.candidates:
+        candidate = response.candidates[0]
+        if hasattr(candidate, 'content') and candidate.content.parts:
+            content = candidate.content.parts[0].text
+    elif hasattr(response, 'text'):
+        content = response.text
+
+    return _parse_batch_response(content, len(texts))
+
+
+async def translate_batch(texts: List[str], target_language: str = "ko") -> List[str]:
+    """
+    여러 텍스트를 토큰 예산 단위로 묶어 한 번의 모델 호출로 번역합니다.
+    캐시에 있거나 이미 목표 언어인 텍스트는 호출에서 제외하고, 같은 텍스트는 한 번만 보냅니다.
+    응답은 받았지만 빠지거나 형식이 잘못된 항목만 translate_text로 개별 번역합니다.
+    호출 자체가 실패한 묶음(쿼터 초과, 타임아웃 등)은 개별 호출로 다시 몰아 보내지 않고 원문으로 두며, 캐시에 없으므로 다음 실행에서 다시 번역합니다.
+
+    Args:
+        texts: 번역할 텍스트 리스트
+        target_language: 목표 언어 ("ko" 또는 "en")
+
+    Returns:
+        입력 순서와 같은 번역 리스트 (실패한 항목은 원문)
+    """
+    results: Dict[str, str] = {}
+    candidates: List[str] = []
+    unique_texts = list(dict.fromkeys(t for t in texts if t))
+    for text, language in zip(unique_texts, detect_languages(unique_texts)):
+        if len(text.strip()) < 3 or is_target_language(language, target_language):
+            results[text] = text
+        else:
+            candidates.append(text)
+
+    # 저장된 번역은 캐시 조회 한 번으로 가져옴 (텍스트마다 세션을 열지 않음)
+    cached = await get_translations_many(candidates, target_language) if candidates else {}
+    results.update(cached)
+    pending = [text for text in candidates if text not in cached]
+    batch_translated: Dict[str, str] = {}
+
+    failed_batches: List[str] = []
+
+    async def run_batch(batch: List[str]) -> None:
+        try:
+            translated = await _translate_batch_call(batch, target_language)
+        except Exception as e:
+            logger.error(f"❌ 일괄 번역 실패 ({len(batch)}개 원문 유지): {type(e).__name__} - {e}")
+            failed_batches.extend(batch)
+            return
+
+        for i, text in enumerate(batch):
+            if i in translated:
+                results[text] = translated[i]
+                batch_translated[text] = translated[i]
+
+        failed = len(batch) - len(translated)
+        logger.info(f"🌐 일괄 번역: {len(batch)}개 중 {len(translated)}개 성공" + (f", {failed}개 개별 번역" if failed else ""))
+
+    # 묶음들은 동시에 호출 (동시 호출 수/RPM/TPM 제한은 공유 LLM 클라이언트에서 적용)
+    if pending and llm_available():
+        await asyncio.gather(*(run_batch(batch) for batch in _pack_batches(pending)))
+        # 모든 묶음의 번역을 다중 행 INSERT와 커밋 한 번으로 저장
+        await save_translations_many(batch_translated, target_language)
+
+    # 일괄 번역 응답에서 빠진 항목만 개별 번역 (동시 실행, 호출이 실패한 묶음은 제외)
+    skipped = set(failed_batches)
+    missing = [text for text in pending if text not in results and text not in skipped]
+    for text, translated in zip(missing, await asyncio.gather(*(translate_text(text, target_language) for text in missing))):
+        results[text] = translated
+
+    return [results.get(text, text) if text else text for text in texts]
+
+
 async def translate_list(texts: list, target_language: str = "ko") -> list:
     """
     텍스트 리스트를 일괄 번역합니다.
@@ -142,17 +256,4 @@ async def translate_list(texts: list, target_language: str = "ko") -> list:
     if not texts:
         return []
     
-    # 짧은 텍스트들은 한 번에 번역 (효율성)
-    if len(texts) <= 5:
-        translated = []
-        for text in texts:
-            if text:
-                result = await translate_text(text, target_language)
-                translated.append(result)
-            else:
-                translated.append(text)
-        return translated
-    else:
-        # 많은 텍스트는 원본 반환 (성능 고려)
-        return texts
-
+    return await translate_batch(texts, target_language)
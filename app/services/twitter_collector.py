@@ -6,6 +6,7 @@ import logging
 import os
 from datetime import datetime
 from typing import List, Dict, Any
+from app.core.http_client import get_http_client
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -48,48 +49,49 @@ async def fetch_twitter_trends(bearer_token: str = None) -> List[Dict[str, Any]]
     
     logger.info("🐦 Twitter/X 트렌딩 데이터 수집 시작...")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        try:
-            response = await client.get(url, params=params)
-            
-            if response.status_code == 401:
-                logger.error("❌ Twitter API 인증 실패. Bearer Token을 확인하세요.")
-                return []
-            elif response.status_code == 429:
-                logger.warning("⚠️ Twitter API 요청 한도 초과. 잠시 후 다시 시도하세요.")
-                return []
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            trends = []
-            if "data" in data:
-                for tweet in data["data"]:
-                    metrics = tweet.get("public_metrics", {})
-                    trend_item = {
-                        "source": "Twitter/X",
-                        "title": tweet.get("text", "")[:200],  # 최대 200자
-                        "url": f"https://twitter.com/i/web/status/{tweet.get('id', '')}",
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "replies": metrics.get("reply_count", 0),
-                        "created_at": tweet.get("created_at", ""),
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    trends.append(trend_item)
-            
-            if trends:
-                logger.info(f"✅ Twitter/X 수집 성공! {len(trends)}개 트윗 발견")
-            return trends
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"❌ Twitter API HTTP 오류 ({e.response.status_code}): {e}")
-            if e.response.status_code == 403:
-                logger.error("💡 Twitter API v2 Basic 접근 권한이 필요합니다. https://developer.twitter.com/ 에서 확인하세요.")
+    client = get_http_client()
+    
+    try:
+        response = await client.get(url, params=params, headers=headers)
+        
+        if response.status_code == 401:
+            logger.error("❌ Twitter API 인증 실패. Bearer Token을 확인하세요.")
             return []
-        except Exception as e:
-            logger.error(f"❌ Twitter/X 수집 실패: {type(e).__name__} - {e}")
+        elif response.status_code == 429:
+            logger.warning("⚠️ Twitter API 요청 한도 초과. 잠시 후 다시 시도하세요.")
             return []
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        trends = []
+        if "data" in data:
+            for tweet in data["data"]:
+                metrics = tweet.get("public_metrics", {})
+                trend_item = {
+                    "source": "Twitter/X",
+                    "title": tweet.get("text", "")[:200],  # 최대 200자
+                    "url": f"https://twitter.com/i/web/status/{tweet.get('id', '')}",
+                    "likes": metrics.get("like_count", 0),
+                    "retweets": metrics.get("retweet_count", 0),
+                    "replies": metrics.get("reply_count", 0),
+                    "created_at": tweet.get("created_at", ""),
+                    "collected_at": datetime.now().isoformat()
+                }
+                trends.append(trend_item)
+        
+        if trends:
+            logger.info(f"✅ Twitter/X 수집 성공! {len(trends)}개 트윗 발견")
+        return trends
+        
+    except httpx.HTTPStatusError as e:
+        logger.error(f"❌ Twitter API HTTP 오류 ({e.response.status_code}): {e}")
+        if e.response.status_code == 403:
+            logger.error("💡 Twitter API v2 Basic 접근 권한이 필요합니다. https://developer.twitter.com/ 에서 확인하세요.")
+        return []
+    except Exception as e:
+        logger.error(f"❌ Twitter/X 수집 실패: {type(e).__name__} - {e}")
+        return []
 
 
 async def fetch_twitter_hashtags(bearer_token: str = None, hashtag: str = "trending") -> List[Dict[str, Any]]:
@@ -122,34 +124,35 @@ async def fetch_twitter_hashtags(bearer_token: str = None, hashtag: str = "trend
     
     logger.info(f"🐦 Twitter 해시태그 #{hashtag} 수집 시작...")
     
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            tweets = []
-            
-            if "data" in data:
-                for tweet in data["data"]:
-                    metrics = tweet.get("public_metrics", {})
-                    tweet_item = {
-                        "source": f"Twitter #{hashtag}",
-                        "title": tweet.get("text", "")[:200],
-                        "url": f"https://twitter.com/i/web/status/{tweet.get('id', '')}",
-                        "hashtag": hashtag,
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    tweets.append(tweet_item)
-            
-            if tweets:
-                logger.info(f"✅ Twitter #{hashtag} 수집 성공! {len(tweets)}개 트윗 발견")
-            return tweets
-            
-        except Exception as e:
-            logger.error(f"❌ Twitter #{hashtag} 수집 실패: {type(e).__name__} - {e}")
-            return []
+    client = get_http_client()
+    
+    try:
+        response = await client.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        
+        data = response.json()
+        tweets = []
+        
+        if "data" in data:
+            for tweet in data["data"]:
+                metrics = tweet.get("public_metrics", {})
+                tweet_item = {
+                    "source": f"Twitter #{hashtag}",
+                    "title": tweet.get("text", "")[:200],
+                    "url": f"https://twitter.com/i/web/status/{tweet.get('id', '')}",
+                    "hashtag": hashtag,
+                    "likes": metrics.get("like_count", 0),
+                    "retweets": metrics.get("retweet_count", 0),
+                    "collected_at": datetime.now().isoformat()
+                }
+                tweets.append(tweet_item)
+        
+        if tweets:
+            logger.info(f"✅ Twitter #{hashtag} 수집 성공! {len(tweets)}개 트윗 발견")
+        return tweets
+        
+    except Exception as e:
+        logger.error(f"❌ Twitter #{hashtag} 수집 실패: {type(e).__name__} - {e}")
+        return []
 
 
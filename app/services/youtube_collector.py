@@ -6,6 +6,7 @@ import logging
 import os
 from datetime import datetime
 from typing import List, Dict, Any
+from app.services.conditional_fetch import conditional_get, record_validators
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -40,51 +41,56 @@ async def fetch_youtube_trending(api_key: str = None, region_code: str = "KR") -
     
     logger.info(f"📺 YouTube 트렌딩 동영상 수집 시작... (지역: {region_code})")
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(url, params=params)
-            
-            if response.status_code == 403:
-                logger.error("❌ YouTube API 인증 실패 또는 할당량 초과. API Key를 확인하세요.")
-                return []
-            elif response.status_code == 400:
-                logger.error("❌ YouTube API 요청 오류. 파라미터를 확인하세요.")
-                return []
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            videos = []
-            if "items" in data:
-                for video in data["items"]:
-                    snippet = video.get("snippet", {})
-                    stats = video.get("statistics", {})
-                    
-                    video_item = {
-                        "source": "YouTube",
-                        "title": snippet.get("title", "")[:200],
-                        "description": snippet.get("description", "")[:1000],  # 300 -> 1000자로 확대
-                        "url": f"https://www.youtube.com/watch?v={video.get('id', '')}",
-                        "channel": snippet.get("channelTitle", ""),
-                        "views": int(stats.get("viewCount", 0)),
-                        "likes": int(stats.get("likeCount", 0)),
-                        "comments": int(stats.get("commentCount", 0)),
-                        "published_at": snippet.get("publishedAt", ""),
-                        "region": region_code,
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    videos.append(video_item)
-            
-            if videos:
-                logger.info(f"✅ YouTube 수집 성공! {len(videos)}개 동영상 발견")
-            return videos
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"❌ YouTube API HTTP 오류 ({e.response.status_code}): {e}")
+    try:
+        response = await conditional_get(url, params=params)
+        if response is None:
+            logger.info("♻️ YouTube 트렌딩 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
             return []
-        except Exception as e:
-            logger.error(f"❌ YouTube 수집 실패: {type(e).__name__} - {e}")
+        
+        if response.status_code == 403:
+            logger.error("❌ YouTube API 인증 실패 또는 할당량 초과. API Key를 확인하세요.")
             return []
+        elif response.status_code == 400:
+            logger.error("❌ YouTube API 요청 오류. 파라미터를 확인하세요.")
+            return []
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        videos = []
+        if "items" in data:
+            for video in data["items"]:
+                snippet = video.get("snippet", {})
+                stats = video.get("statistics", {})
+                
+                video_item = {
+                    "source": "YouTube",
+                    "title": snippet.get("title", "")[:200],
+                    "description": snippet.get("description", "")[:1000],  # 300 -> 1000자로 확대
+                    "url": f"https://www.youtube.com/watch?v={video.get('id', '')}",
+                    "channel": snippet.get("channelTitle", ""),
+                    "views": int(stats.get("viewCount", 0)),
+                    "likes": int(stats.get("likeCount", 0)),
+                    "comments": int(stats.get("commentCount", 0)),
+                    "published_at": snippet.get("publishedAt", ""),
+                    "region": region_code,
+                    "collected_at": datetime.now().isoformat()
+                }
+                videos.append(video_item)
+        
+        # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+        record_validators(url, response, params, source="YouTube")
+        
+        if videos:
+            logger.info(f"✅ YouTube 수집 성공! {len(videos)}개 동영상 발견")
+        return videos
+        
+    except httpx.HTTPStatusError as e:
+        logger.error(f"❌ YouTube API HTTP 오류 ({e.response.status_code}): {e}")
+        return []
+    except Exception as e:
+        logger.error(f"❌ YouTube 수집 실패: {type(e).__name__} - {e}")
+        return []
 
 
 async def fetch_youtube_search(api_key: str = None, query: str = "trending", max_results: int = 10) -> List[Dict[str, Any]]:
@@ -116,33 +122,39 @@ async def fetch_youtube_search(api_key: str = None, query: str = "trending", max
     
     logger.info(f"📺 YouTube 검색 수집 시작... (키워드: {query})")
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            videos = []
-            
-            if "items" in data:
-                for video in data["items"]:
-                    snippet = video.get("snippet", {})
-                    video_item = {
-                        "source": f"YouTube ({query})",
-                        "title": snippet.get("title", "")[:200],
-                        "url": f"https://www.youtube.com/watch?v={video.get('id', {}).get('videoId', '')}",
-                        "channel": snippet.get("channelTitle", ""),
-                        "published_at": snippet.get("publishedAt", ""),
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    videos.append(video_item)
-            
-            if videos:
-                logger.info(f"✅ YouTube 검색 성공! {len(videos)}개 동영상 발견")
-            return videos
-            
-        except Exception as e:
-            logger.error(f"❌ YouTube 검색 실패: {type(e).__name__} - {e}")
+    try:
+        response = await conditional_get(url, params=params)
+        if response is None:
+            logger.info(f"♻️ YouTube 검색 ({query}) 변경 없음 (304), 파싱과 저장을 건너뜁니다.")
             return []
+        
+        response.raise_for_status()
+        
+        data = response.json()
+        videos = []
+        
+        if "items" in data:
+            for video in data["items"]:
+                snippet = video.get("snippet", {})
+                video_item = {
+                    "source": f"YouTube ({query})",
+                    "title": snippet.get("title", "")[:200],
+                    "url": f"https://www.youtube.com/watch?v={video.get('id', {}).get('videoId', '')}",
+                    "channel": snippet.get("channelTitle", ""),
+                    "published_at": snippet.get("publishedAt", ""),
+                    "collected_at": datetime.now().isoformat()
+                }
+                videos.append(video_item)
+        
+        # 파싱에 성공한 경우에만 ETag / Last-Modified 기록
+        record_validators(url, response, params, source=f"YouTube ({query})")
+        
+        if videos:
+            logger.info(f"✅ YouTube 검색 성공! {len(videos)}개 동영상 발견")
+        return videos
+        
+    except Exception as e:
+        logger.error(f"❌ YouTube 검색 실패: {type(e).__name__} - {e}")
+        return []
 
 
@@ -0,0 +1,44 @@
+"""
+기존 행의 쓰기 시점 번역(translations 컬럼)을 채우는 스크립트
+migrate_db.py로 translations 컬럼을 추가한 뒤 한 번 실행합니다.
+"""
+import asyncio
+import sys
+from app.services.localization import backfill_translations
+import logging
+
+# Windows에서 SelectorEventLoop 사용
+if sys.platform == 'win32':
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+logger = logging.getLogger("hourly_pulse")
+
+async def run_backfill(item_hours: int):
+    """
+    분석 결과/랭킹 전체와 최근 item_hours 시간의 수집 아이템을 번역하여 저장합니다.
+    """
+    print("=" * 70)
+    print(f"🌐 번역 백필 실행 (수집 아이템: 최근 {item_hours}시간)")
+    print("=" * 70)
+    
+    try:
+        totals = await backfill_translations(item_hours=item_hours)
+        for table, count in totals.items():
+            print(f"  - {table}: {count}개 번역 저장")
+        
+        print("\n" + "=" * 70)
+        print("✅ 번역 백필 완료!")
+        print("=" * 70)
+    except Exception as e:
+        print(f"\n❌ 실행 실패: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    hours = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    asyncio.run(run_backfill(hours))
@@ -175,6 +175,234 @@ async def migrate_database():
                 except Exception as e:
                     print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
             
+            print("\n📊 [3] collected_items 테이블 마이그레이션 (중복 제거)")
+            print("-" * 70)
+            
+            # collected_items 테이블에 중복 제거 컬럼 추가
+            # 기존 행은 dedup_key가 NULL로 남으며, 새로 수집된 게시물부터 적용
+            item_migrations = [
+                # dedup_key 컬럼 추가
+                """
+                DO $$ 
+                BEGIN
+                    IF NOT EXISTS (
+                        SELECT 1 FROM information_schema.columns 
+                        WHERE table_name='collected_items' AND column_name='dedup_key'
+                    ) THEN
+                        ALTER TABLE collected_items ADD COLUMN dedup_key VARCHAR(40);
+                        RAISE NOTICE 'Added column: dedup_key';
+                    ELSE
+                        RAISE NOTICE 'Column dedup_key already exists';
+                    END IF;
+                END $$;
+                """,
+                # first_seen_at 컬럼 추가
+                """
+                DO $$ 
+                BEGIN
+                    IF NOT EXISTS (
+                        SELECT 1 FROM information_schema.columns 
+                        WHERE table_name='collected_items' AND column_name='first_seen_at'
+                    ) THEN
+                        ALTER TABLE collected_items ADD COLUMN first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT now();
+                        UPDATE collected_items SET first_seen_at = collected_at;
+                        RAISE NOTICE 'Added column: first_seen_at';
+                    ELSE
+                        RAISE NOTICE 'Column first_seen_at already exists';
+                    END IF;
+                END $$;
+                """,
+                # engagement_history 컬럼 추가
+                """
+                DO $$ 
+                BEGIN
+                    IF NOT EXISTS (
+                        SELECT 1 FROM information_schema.columns 
+                        WHERE table_name='collected_items' AND column_name='engagement_history'
+                    ) THEN
+                        ALTER TABLE collected_items ADD COLUMN engagement_history JSON;
+                        RAISE NOTICE 'Added column: engagement_history';
+                    ELSE
+                        RAISE NOTICE 'Column engagement_history already exists';
+                    END IF;
+                END $$;
+                """,
+                # dedup_key 인덱스 추가 (파티션 테이블에서는 UNIQUE 불가, 유일성은 저장 경로에서 보장)
+                """
+                CREATE INDEX IF NOT EXISTS ix_collected_items_dedup_key ON collected_items (dedup_key);
+                """,
+            ]
+            
+            for i, migration in enumerate(item_migrations, 1):
+                try:
+                    await conn.execute(text(migration))
+                    print(f"  ✅ 마이그레이션 {i} 완료")
+                except Exception as e:
+                    print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
+            
+            print("\n📊 [4] collected_items 테이블 파티션 전환 (collected_at 일 단위 RANGE)")
+            print("-" * 70)
+            
+            try:
+                relkind_result = await conn.execute(text(
+                    "SELECT relkind FROM pg_class WHERE relname = 'collected_items' AND relkind IN ('r', 'p')"
+                ))
+                relkind = relkind_result.scalar()
+                
+                if relkind == 'p':
+                    print("  ✅ 이미 파티션 테이블입니다. 건너뜁니다.")
+                elif relkind == 'r':
+                    # 1. 기존 테이블을 옆으로 옮기고 이름이 겹치는 제약/인덱스 정리 (시퀀스는 새 테이블이 이어서 사용)
+                    partition_migrations = [
+                        "ALTER TABLE collected_items RENAME TO collected_items_legacy",
+                        "ALTER TABLE collected_items_legacy RENAME CONSTRAINT collected_items_pkey TO collected_items_legacy_pkey",
+                        "DROP INDEX IF EXISTS ix_collected_items_id, ix_collected_items_source, ix_collected_items_source_type, "
+                        "ix_collected_items_url, ix_collected_items_collected_at, ix_collected_items_dedup_key",
+                        "ALTER SEQUENCE collected_items_id_seq OWNED BY NONE",
+                        # 2. 파티션 테이블 생성 (기본 키와 인덱스에 파티션 키 포함, dedup_key는 일반 인덱스)
+                        """
+                        CREATE TABLE collected_items (
+                            id INTEGER NOT NULL DEFAULT nextval('collected_items_id_seq'),
+                            source VARCHAR NOT NULL,
+                            source_type VARCHAR NOT NULL,
+                            title TEXT NOT NULL,
+                            content TEXT,
+                            url TEXT,
+                            extra_data JSON,
+                            collected_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+                            dedup_key VARCHAR(40),
+                            first_seen_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+                            engagement_history JSON,
+                            PRIMARY KEY (id, collected_at)
+                        ) PARTITION BY RANGE (collected_at)
+                        """,
+                        "ALTER SEQUENCE collected_items_id_seq OWNED BY collected_items.id",
+                        "CREATE INDEX ix_collected_items_id ON collected_items (id)",
+                        "CREATE INDEX ix_collected_items_source ON collected_items (source)",
+                        "CREATE INDEX ix_collected_items_source_type ON collected_items (source_type)",
+                        "CREATE INDEX ix_collected_items_url ON collected_items (url)",
+                        "CREATE INDEX ix_collected_items_collected_at ON collected_items (collected_at)",
+                        "CREATE INDEX ix_collected_items_dedup_key ON collected_items (dedup_key)",
+                    ]
+                    for statement in partition_migrations:
+                        await conn.execute(text(statement))
+                    print("  ✅ 파티션 테이블 생성 완료")
+                    
+                    # 3. 기존 데이터 범위 ~ 미래 2일까지 일 단위 파티션 + 기본 파티션 생성
+                    from datetime import datetime, timedelta, timezone
+                    min_result = await conn.execute(text("SELECT min(collected_at) FROM collected_items_legacy"))
+                    oldest = min_result.scalar() or datetime.now(timezone.utc)
+                    day = oldest.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+                    last_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=2)
+                    partition_count = 0
+                    while day <= last_day:
+                        await conn.execute(text(
+                            f"CREATE TABLE IF NOT EXISTS collected_items_p{day:%Y%m%d} PARTITION OF collected_items "
+                            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+                        ))
+                        day += timedelta(days=1)
+                        partition_count += 1
+                    await conn.execute(text("CREATE TABLE IF NOT EXISTS collected_items_default PARTITION OF collected_items DEFAULT"))
+                    print(f"  ✅ 일 단위 파티션 {partition_count}개 + 기본 파티션 생성 완료")
+                    
+                    # 4. 데이터 복사 후 기존 테이블 삭제
+                    copy_result = await conn.execute(text("""
+                        INSERT INTO collected_items (id, source, source_type, title, content, url, extra_data,
+                                                     collected_at, dedup_key, first_seen_at, engagement_history)
+                        SELECT id, source, source_type, title, content, url, extra_data,
+                               COALESCE(collected_at, now()), dedup_key, first_seen_at, engagement_history
+                        FROM collected_items_legacy
+                    """))
+                    await conn.execute(text("DROP TABLE collected_items_legacy"))
+                    print(f"  ✅ 기존 데이터 {copy_result.rowcount}개 복사 완료")
+                else:
+                    print("  ℹ️  collected_items 테이블이 없습니다. 서버 시작 시 파티션 테이블로 생성됩니다.")
+            except Exception as e:
+                print(f"  ⚠️  파티션 전환 오류: {e}")
+                raise
+            
+            print("\n📊 [5] 쓰기 시점 번역 컬럼 추가 (translations)")
+            print("-" * 70)
+            
+            # 파티션 테이블(collected_items)은 부모에 추가하면 모든 파티션에 반영됨
+            translation_migrations = [
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS translations JSON"
+                for table in ("analysis_results", "issue_rankings", "collected_items")
+            ]
+            
+            for i, migration in enumerate(translation_migrations, 1):
+                try:
+                    await conn.execute(text(migration))
+                    print(f"  ✅ 마이그레이션 {i} 완료")
+                except Exception as e:
+                    print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
+            print("  ℹ️  기존 행 번역은 backfill_translations.py로 채웁니다.")
+            
+            print("\n📊 [6] collected_items 전문 검색 인덱스 추가 (search_vector + GIN)")
+            print("-" * 70)
+            
+            # 생성 컬럼 추가 시 기존 행의 벡터가 함께 계산됨 (모든 파티션을 다시 쓰므로 행이 많으면 시간이 걸림)
+            # 인덱스는 부모에 만들면 기존/새 파티션 모두에 생성됨
+            search_migrations = [
+                """
+                ALTER TABLE collected_items ADD COLUMN IF NOT EXISTS search_vector tsvector
+                GENERATED ALWAYS AS (to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))) STORED
+                """,
+                "CREATE INDEX IF NOT EXISTS ix_collected_items_search_vector ON collected_items USING gin (search_vector)",
+            ]
+            
+            for i, migration in enumerate(search_migrations, 1):
+                try:
+                    await conn.execute(text(migration))
+                    print(f"  ✅ 마이그레이션 {i} 완료")
+                except Exception as e:
+                    print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
+            
+            print("\n📊 [7] collected_items 관심도 점수 컬럼 추가 및 백필 (interest_score)")
+            print("-" * 70)
+            
+            # 새로 수집되는 아이템은 저장 시점에 계산되므로, 기존 행만 compute_interest_score와 같은 SQL 식으로 채움
+            from app.services.ranking import interest_score_sql
+            score_migrations = [
+                "ALTER TABLE collected_items ADD COLUMN IF NOT EXISTS interest_score BIGINT",
+                "CREATE INDEX IF NOT EXISTS ix_collected_items_interest_score ON collected_items (interest_score)",
+            ]
+            
+            for i, migration in enumerate(score_migrations, 1):
+                try:
+                    await conn.execute(text(migration))
+                    print(f"  ✅ 마이그레이션 {i} 완료")
+                except Exception as e:
+                    print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
+            
+            try:
+                backfill_result = await conn.execute(text(
+                    f"UPDATE collected_items SET interest_score = {interest_score_sql('collected_items')} "
+                    "WHERE interest_score IS NULL"
+                ))
+                print(f"  ✅ 기존 행 {backfill_result.rowcount}개 관심도 점수 백필 완료")
+            except Exception as e:
+                print(f"  ⚠️  관심도 점수 백필 오류: {e}")
+            
+            print("\n📊 [8] feed_validators 피드 확인 시각 컬럼 추가 (source, fetched_at, last_seen_at)")
+            print("-" * 70)
+            
+            # 304 응답을 받은 피드의 현재 본문 아이템을 윈도우 쿼리에 포함하기 위한 컬럼
+            # 기존 행은 다음 200 응답에서 채워짐 (그 전까지는 304 피드의 아이템이 윈도우에서 빠짐)
+            feed_migrations = [
+                "ALTER TABLE feed_validators ADD COLUMN IF NOT EXISTS source TEXT",
+                "ALTER TABLE feed_validators ADD COLUMN IF NOT EXISTS fetched_at TIMESTAMP WITH TIME ZONE",
+                "ALTER TABLE feed_validators ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP WITH TIME ZONE",
+                "CREATE INDEX IF NOT EXISTS ix_feed_validators_last_seen_at ON feed_validators (last_seen_at)",
+            ]
+            
+            for i, migration in enumerate(feed_migrations, 1):
+                try:
+                    await conn.execute(text(migration))
+                    print(f"  ✅ 마이그레이션 {i} 완료")
+                except Exception as e:
+                    print(f"  ⚠️  마이그레이션 {i} 오류: {e}")
+            
             print("\n" + "=" * 70)
             print("✅ 데이터베이스 마이그레이션 완료!")
             print("=" * 70)
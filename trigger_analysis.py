@@ -5,6 +5,7 @@ import asyncio
 import sys
 from app.services.ai_analyzer import analyze_collected_data, save_analysis_results
 from app.services.ranking import calculate_issue_rankings, save_issue_rankings
+from app.services.localization import localize_pending_rows
 import logging
 
 # Windows에서 SelectorEventLoop 사용
@@ -75,6 +76,11 @@ async def run_analysis():
         else:
             print("⚠️ 랭킹할 이슈가 없습니다.")
         
+        # 3. 쓰기 시점 번역 (ko/en 번역을 행에 저장)
+        print("\n🌐 [3] 번역 저장 시작...")
+        localized = await localize_pending_rows()
+        print(f"✅ 번역 저장 완료: {localized}")
+        
         print("\n" + "=" * 70)
         print("✅ 완료! 웹사이트를 새로고침하여 결과를 확인하세요.")
         print("=" * 70)